@@ -1,10 +1,13 @@
 # Standard library imports
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Third-party imports
 from flask import Flask, render_template, redirect, url_for, flash, request
+from flask.logging import default_handler
 from flask_login import LoginManager, current_user
 from flask_sqlalchemy import SQLAlchemy
 from flask_apscheduler import APScheduler
@@ -15,7 +18,7 @@ from sqlalchemy.exc import OperationalError, DisconnectionError
 
 # Local imports
 from .config import Config
-from .models import db, User
+from .models import db, User, dedupe_emails, upgrade_schema
 
 login_manager = LoginManager()
 
@@ -63,7 +66,30 @@ def create_app(config_class=Config, testing=False):
             )
         )
         file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
+
+        # Request threads only enqueue records; a listener thread does the writes
+        queue_handler = QueueHandler(queue.Queue(-1))
+
+        def start_log_listener():
+            log_listener = QueueListener(
+                queue_handler.queue,
+                default_handler,
+                file_handler,
+                respect_handler_level=True,
+            )
+            log_listener.start()
+            atexit.register(log_listener.stop)
+
+        def restart_log_listener_after_fork():
+            # Threads do not survive a fork (gunicorn preload_app creates the app
+            # in the master), so each worker reads a fresh queue with its own thread
+            queue_handler.queue = queue.Queue(-1)
+            start_log_listener()
+
+        start_log_listener()
+        os.register_at_fork(after_in_child=restart_log_listener_after_fork)
+        app.logger.removeHandler(default_handler)
+        app.logger.addHandler(queue_handler)
 
         app.logger.setLevel(logging.INFO)
         app.logger.info("CleanBox started")
@@ -142,10 +168,18 @@ def create_app(config_class=Config, testing=False):
         flash("You do not have access rights to this feature.", "error")
         return redirect(url_for("main.dashboard"))
 
+    @app.cli.command("dedupe-emails")
+    def dedupe_emails_command():
+        """Delete duplicate emails (keeps the most recently updated of each)"""
+        deleted = dedupe_emails()
+        print(f"Deleted {deleted} duplicate emails.")
+        upgrade_schema()
+
     # Initialize database (only if not testing)
     if not app.config.get("TESTING", False):
         with app.app_context():
             db.create_all()
+            upgrade_schema()
 
     return app
 
@@ -154,4 +188,5 @@ def init_db(app):
     """Initialize database"""
     with app.app_context():
         db.create_all()
+        upgrade_schema()
         print("CleanBox database initialized.")
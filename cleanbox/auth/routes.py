@@ -3,6 +3,7 @@ import json
 import os
 import subprocess
 import time
+from collections import namedtuple
 from datetime import datetime
 
 # Third-party imports
@@ -14,6 +15,7 @@ from flask import (
     session,
     flash,
     render_template,
+    g,
 )
 from flask_login import login_user, logout_user, login_required, current_user
 from google_auth_oauthlib.flow import Flow
@@ -24,10 +26,14 @@ from google.cloud import resourcemanager_v3
 
 # Local imports
 from ..models import User, UserToken, UserAccount, db
+from .. import cache
 
 
 auth_bp = Blueprint("auth", __name__)
 
+# Active account row used by pages and background work (plain data, cacheable)
+ActiveAccount = namedtuple("ActiveAccount", "id account_email account_name is_primary")
+
 # OAuth 2.0 client settings
 GOOGLE_CLIENT_CONFIG = {
     "web": {
@@ -702,6 +708,7 @@ def _handle_login_callback(credentials, id_info):
         # Update last_login
         user.last_login = datetime.utcnow()
         db.session.commit()
+        invalidate_active_accounts(user.id)
 
         # Check and grant Pub/Sub permissions for all users
         try:
@@ -774,6 +781,7 @@ def _handle_add_account_callback(credentials, id_info):
                     "name", existing_account.account_name
                 )
                 db.session.commit()
+                invalidate_active_accounts(current_user.id)
 
                 flash(
                     f"Deactivated account {id_info['email']} re-activated!",
@@ -816,6 +824,7 @@ def _handle_add_account_callback(credentials, id_info):
         db.session.add(user_token)
 
         db.session.commit()
+        invalidate_active_accounts(current_user.id)
 
         # Check and grant Pub/Sub permissions for the new account
         try:
@@ -930,6 +939,7 @@ def remove_account(account_id):
     # Deactivate account
     account.is_active = False
     db.session.commit()
+    invalidate_active_accounts(current_user.id)
 
     flash(f"{account.account_email} account disconnected.", "success")
 
@@ -983,27 +993,54 @@ def get_user_credentials(user_id, account_id=None):
     return None
 
 
+def get_active_accounts(user_id):
+    """Active accounts of a user, cached per request and for 5 minutes across requests."""
+    request_accounts = g.setdefault("active_accounts", {})
+    if user_id in request_accounts:
+        return request_accounts[user_id]
+
+    cache_key = f"active_accounts_{user_id}"
+    accounts = cache.get(cache_key)
+    if accounts is None:
+        accounts = [
+            ActiveAccount(*row)
+            for row in db.session.query(
+                UserAccount.id,
+                UserAccount.account_email,
+                UserAccount.account_name,
+                UserAccount.is_primary,
+            )
+            .filter_by(user_id=user_id, is_active=True)
+            .all()
+        ]
+        cache.set(cache_key, accounts, timeout=300)
+
+    request_accounts[user_id] = accounts
+    return accounts
+
+
+def invalidate_active_accounts(user_id):
+    """Drop cached active accounts after an account is added, changed or removed."""
+    cache.delete(f"active_accounts_{user_id}")
+    g.get("active_accounts", {}).pop(user_id, None)
+
+
 def get_current_account_id():
     """Get the ID of the currently active account."""
     # Return None if not logged in
     if not current_user.is_authenticated:
         return None
 
-    # Return the ID of the primary account
-    primary_account = UserAccount.query.filter_by(
-        user_id=current_user.id, is_primary=True, is_active=True
-    ).first()
+    accounts = get_active_accounts(current_user.id)
 
-    if primary_account:
-        return primary_account.id
+    # Return the ID of the primary account
+    for account in accounts:
+        if account.is_primary:
+            return account.id
 
     # If no active account, return the ID of the first active account
-    first_account = UserAccount.query.filter_by(
-        user_id=current_user.id, is_active=True
-    ).first()
-
-    if first_account:
-        return first_account.id
+    if accounts:
+        return accounts[0].id
 
     return None
 
@@ -17,6 +17,7 @@ from flask_login import login_user, logout_user, login_required, current_user
 
 # Local imports
 from ..models import User, UserToken, UserAccount, Category, db
+from ..email.routes import invalidate_active_categories, invalidate_email_caches
 
 category_bp = Blueprint("category", __name__)
 
@@ -99,6 +100,7 @@ def add_category():
 
             db.session.add(category)
             db.session.commit()
+            invalidate_active_categories(current_user.id)
 
             flash("Category added successfully.", "success")
             return redirect(url_for("category.list_categories"))
@@ -153,6 +155,9 @@ def edit_category(category_id):
             category.icon = icon
 
             db.session.commit()
+            # Cached email list pages show category names
+            invalidate_email_caches(current_user.id)
+            invalidate_active_categories(current_user.id)
 
             flash("Category updated successfully.", "success")
             return redirect(url_for("category.list_categories"))
@@ -183,6 +188,8 @@ def delete_category(category_id):
         # Deactivate category (instead of actual delete)
         category.is_active = False
         db.session.commit()
+        invalidate_email_caches(current_user.id)
+        invalidate_active_categories(current_user.id)
 
         flash("Category deleted successfully.", "success")
         return redirect(url_for("category.list_categories"))
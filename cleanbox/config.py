@@ -85,6 +85,9 @@ class Config:
     ENABLE_AI_FEATURES = os.environ.get("CLEANBOX_ENABLE_AI", "true").lower() == "true"
     OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4.1-nano")
 
+    # Raise on lazy relationship loads in email routes (surfaces N+1 queries)
+    RAISELOAD_ENABLED = os.environ.get("CLEANBOX_RAISELOAD", "false").lower() == "true"
+
     # Scheduler settings removed - unnecessary feature per PROJECT_DESCRIPTION
     # ENABLE_SCHEDULER = (
     #     os.environ.get("CLEANBOX_ENABLE_SCHEDULER", "true").lower() == "true"
@@ -115,10 +118,9 @@ class TestConfig(Config):
     # SQLite settings (remove PostgreSQL options)
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,
-        "pool_size": 5,
-        "max_overflow": 10,
     }
     WTF_CSRF_ENABLED = False
+    RAISELOAD_ENABLED = True
     # In test environment, control DB initialization manually
     INIT_DB = False
     # Test Fernet key (32-byte base64 encoded)
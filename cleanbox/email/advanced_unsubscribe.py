@@ -1,4 +1,6 @@
 # Standard library imports
+import asyncio
+import html
 import logging
 import re
 import time
@@ -14,6 +16,8 @@ from bs4 import BeautifulSoup
 # Local imports
 from .playwright_unsubscribe import (
     PlaywrightUnsubscribeService,
+    get_http_session,
+    is_valid_unsubscribe_url,
     process_unsubscribe_sync,
 )
 
@@ -71,11 +75,7 @@ class AdvancedUnsubscribeService:
 
     def _is_valid_unsubscribe_url(self, url: str) -> bool:
         """Check if URL is a valid unsubscribe link"""
-        try:
-            parsed = urlparse(url)
-            return parsed.scheme in ["http", "https"] and bool(parsed.netloc)
-        except:
-            return False
+        return is_valid_unsubscribe_url(url)
 
     def _detect_personal_email(
         self, email_content: str, email_headers: Dict = None
@@ -184,16 +184,41 @@ class AdvancedUnsubscribeService:
             return None
 
     async def process_unsubscribe_advanced(
-        self, email_content: str, email_headers: Dict = None, user_email: str = None
+        self,
+        email_content: str,
+        email_headers: Dict = None,
+        user_email: str = None,
+        known_links: List[str] = None,
+        one_click_url: str = None,
     ) -> Dict:
-        """Advanced unsubscribe processing (using Playwright service, with AI fallback)"""
+        """Advanced unsubscribe processing (using Playwright service, with AI fallback)
+
+        known_links (extracted at ingest) are tried first; the full extraction
+        (anchor scan and AI fallback) runs when none are stored or all of them
+        fail. A one_click_url (RFC 8058) is tried first with a plain POST, and
+        the browser is only started if that fails.
+        """
         try:
             print(f"🔧 Starting advanced unsubscribe processing (async, AI fallback)")
 
-            # Extract unsubscribe links (AI fallback 포함)
-            unsubscribe_links = await self.playwright_service.extract_unsubscribe_links_with_ai_fallback(
-                email_content, email_headers, user_email
-            )
+            if one_click_url and await asyncio.to_thread(
+                self._one_click_unsubscribe, one_click_url
+            ):
+                return {
+                    "success": True,
+                    "message": "Unsubscribe success: one-click (RFC 8058) request accepted",
+                    "processed_url": one_click_url,
+                    "method": "one_click_post",
+                }
+
+            # Links stored before ingest unescaped them may still contain &amp;
+            unsubscribe_links = [html.unescape(link) for link in known_links or []]
+            extracted = not unsubscribe_links
+            if extracted:
+                # Extract unsubscribe links (AI fallback 포함)
+                unsubscribe_links = await self.playwright_service.extract_unsubscribe_links_with_ai_fallback(
+                    email_content, email_headers, user_email
+                )
 
             if not unsubscribe_links:
                 return {
@@ -207,7 +232,9 @@ class AdvancedUnsubscribeService:
 
             # Try unsubscribe for each link
             failed_links = []
-            for i, link in enumerate(unsubscribe_links):
+            i = 0
+            while i < len(unsubscribe_links):
+                link = unsubscribe_links[i]
                 print(f"📝 Processing link {i + 1}/{len(unsubscribe_links)}: {link}")
                 result = await self.playwright_service.process_unsubscribe_with_playwright_ai(
                     link, user_email
@@ -229,6 +256,20 @@ class AdvancedUnsubscribeService:
                         }
                     )
 
+                i += 1
+                if i == len(unsubscribe_links) and not extracted:
+                    # Every stored link failed: try the links only the full
+                    # extraction finds
+                    extracted = True
+                    more_links = await self.playwright_service.extract_unsubscribe_links_with_ai_fallback(
+                        email_content, email_headers, user_email
+                    )
+                    unsubscribe_links += [
+                        extracted_link
+                        for extracted_link in dict.fromkeys(more_links)
+                        if extracted_link not in unsubscribe_links
+                    ]
+
             # All links failed
             return {
                 "success": False,
@@ -247,6 +288,29 @@ class AdvancedUnsubscribeService:
                 "error_details": str(e),
             }
 
+    def _one_click_unsubscribe(self, url: str) -> bool:
+        """Send the RFC 8058 one-click unsubscribe POST"""
+        try:
+            response = get_http_session().post(
+                url,
+                data={"List-Unsubscribe": "One-Click"},
+                timeout=self.timeouts["api_call"],
+            )
+            self.logger.info(
+                "📝 One-click unsubscribe POST: %s -> %s", url, response.status_code
+            )
+            return 200 <= response.status_code < 300
+        except requests.RequestException as e:
+            self.logger.warning("⚠️ One-click unsubscribe POST failed: %s", e)
+            return False
+
+    async def close_browser(self) -> None:
+        """Close the Playwright browser (must run on the event loop that opened it)"""
+        try:
+            await self.playwright_service.cleanup_browser()
+        except Exception as e:
+            self.logger.warning("⚠️ Failed to close unsubscribe browser: %s", e)
+
     def process_unsubscribe_with_mechanicalsoup_ai(
         self, unsubscribe_url: str, user_email: str = None
     ) -> Dict:
@@ -1,12 +1,26 @@
 # Standard library imports
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
 import openai
+from flask import current_app, has_app_context
 
 # Local imports
 from ..models import Category
+from .. import cache
+
+# Results for an identical prompt are reused (newsletters repeat the same body)
+AI_RESULT_CACHE_TIMEOUT = 7 * 24 * 3600
+
+# OpenAI requests in flight per process. classify_and_summarize_emails runs
+# inside per-account worker pools, so its own pool size does not bound this
+AI_MAX_CONCURRENT_REQUESTS = 8
+_openai_request_slots = threading.BoundedSemaphore(AI_MAX_CONCURRENT_REQUESTS)
 
 
 class AIClassifier:
@@ -16,15 +30,26 @@ class AIClassifier:
         self.api_key = os.environ.get("OPENAI_API_KEY")
         self.model = os.environ.get("OPENAI_MODEL", "gpt-4.1-nano")
         openai.api_key = self.api_key
+        # OpenAI client, created on first API call and reused (it is thread-safe)
+        self._client = None
 
     def get_user_categories_for_ai(self, user_id: str) -> List[Dict]:
-        """Get user category info for AI classification"""
+        """Get user category info for AI classification (cached for 5 minutes)"""
         try:
+            cache_key = f"ai_categories_{user_id}"
+            if has_app_context():
+                cached_categories = cache.get(cache_key)
+                if cached_categories is not None:
+                    return cached_categories
+
             categories = Category.query.filter_by(user_id=user_id, is_active=True).all()
-            return [
+            result = [
                 {"id": cat.id, "name": cat.name, "description": cat.description or ""}
                 for cat in categories
             ]
+            if has_app_context():
+                cache.set(cache_key, result, timeout=300)
+            return result
         except Exception as e:
             print(f"Failed to query user categories: {str(e)}")
             return []
@@ -87,8 +112,15 @@ class AIClassifier:
                 email_content, subject, sender, categories
             )
 
-            # API call
-            response = self._call_openai_api(prompt)
+            # Same prompt (content, sender and category set) gives the same result
+            cache_key = self._result_cache_key(prompt)
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result is not None:
+                return tuple(cached_result)
+
+            # API call (waits for a free process-wide request slot)
+            with _openai_request_slots:
+                response = self._call_openai_api(prompt)
             if not response:
                 return None, "Unable to use AI processing. Please check manually."
 
@@ -104,12 +136,56 @@ class AIClassifier:
                     "Unable to parse AI analysis result. Please check manually.",
                 )
 
+            self._set_cached_result(cache_key, (category_id, summary))
             return category_id, summary
 
         except Exception as e:
             print(f"AI classification and summarization failed: {str(e)}")
             return None, "Unable to use AI processing. Please check manually."
 
+    def classify_and_summarize_emails(
+        self, emails: List[Dict], categories: List[Dict], max_workers: int = 8
+    ) -> List[Tuple[Optional[int], str]]:
+        """Classify and summarize several emails with concurrent API calls
+
+        emails: [{"content", "subject", "sender"}, ...]; results keep the input order.
+        """
+        if not emails:
+            return []
+
+        # Workers get the caller's app context so the result cache is usable
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def classify(email_data):
+            args = (
+                email_data["content"],
+                email_data["subject"],
+                email_data["sender"],
+                categories,
+            )
+            if app is None:
+                return self.classify_and_summarize_email(*args)
+            with app.app_context():
+                return self.classify_and_summarize_email(*args)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(emails))) as executor:
+            return list(executor.map(classify, emails))
+
+    def _result_cache_key(self, prompt: str) -> str:
+        digest = hashlib.blake2b(
+            f"{self.model}\n{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        return f"ai_result_{digest}"
+
+    def _get_cached_result(self, cache_key: str) -> Optional[Tuple]:
+        if not has_app_context():
+            return None
+        return cache.get(cache_key)
+
+    def _set_cached_result(self, cache_key: str, result: Tuple) -> None:
+        if has_app_context():
+            cache.set(cache_key, result, timeout=AI_RESULT_CACHE_TIMEOUT)
+
     def _build_unified_prompt(
         self, content: str, subject: str, sender: str, categories: List[Dict]
     ) -> str:
@@ -264,9 +340,10 @@ Analysis Guidelines:
                 print("OpenAI API key not set.")
                 return None
 
-            # Initialize OpenAI client (safely)
+            # Initialize OpenAI client once (safely)
             try:
-                client = openai.OpenAI(api_key=self.api_key)
+                if self._client is None:
+                    self._client = openai.OpenAI(api_key=self.api_key)
             except TypeError as e:
                 if "proxies" in str(e):
                     # If it's a proxies issue, remove from environment variables
@@ -276,12 +353,12 @@ Analysis Guidelines:
                         del os.environ["HTTP_PROXY"]
                     if "HTTPS_PROXY" in os.environ:
                         del os.environ["HTTPS_PROXY"]
-                    client = openai.OpenAI(api_key=self.api_key)
+                    self._client = openai.OpenAI(api_key=self.api_key)
                 else:
                     raise e
 
             # API call (modified for newer versions)
-            completion = client.chat.completions.create(
+            completion = self._client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -298,3 +375,9 @@ Analysis Guidelines:
         except Exception as e:
             print(f"OpenAI API call failed: {str(e)}")
             return None
+
+
+@lru_cache(maxsize=1)
+def get_classifier() -> AIClassifier:
+    """Shared AIClassifier instance (it holds no per-request state)"""
+    return AIClassifier()
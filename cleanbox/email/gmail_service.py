@@ -1,12 +1,17 @@
 # Standard library imports
 import base64
 import email
+import html
+import json
 import os
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Set
 
 # Third-party imports
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 # Local imports
@@ -18,6 +23,33 @@ from ..auth.routes import (
 )
 from .advanced_unsubscribe import AdvancedUnsubscribeService
 
+# Unsubscribe URLs in the body and in the List-Unsubscribe header (<url>, <mailto:...>)
+UNSUBSCRIBE_URL_PATTERN = re.compile(
+    r"https?://[^\s<>\"']*unsubscribe[^\s<>\"']*", re.IGNORECASE
+)
+LIST_UNSUBSCRIBE_URL_PATTERN = re.compile(r"<(https?://[^>]+)>")
+
+# Requests per Gmail batch HTTP call (Gmail allows 100, recommends at most 50)
+GMAIL_BATCH_SIZE = 50
+
+# Partial response for messages.get: only what _parse_email_message reads
+GMAIL_MESSAGE_FIELDS = (
+    "id,threadId,snippet,labelIds,payload(headers,body/data,parts(mimeType,body/data))"
+)
+
+# Message ids per batchModify/batchDelete call (Gmail limit)
+GMAIL_BATCH_MODIFY_SIZE = 1000
+
+
+@lru_cache(maxsize=1)
+def _gmail_discovery_document() -> Optional[str]:
+    """Bundled Gmail API discovery document, read from disk once per process
+
+    Kept as the JSON string: build_from_document mutates the parsed dict, so
+    each build parses its own copy instead of sharing one across threads.
+    """
+    return get_static_doc("gmail", "v1")
+
 
 class GmailService:
     """Gmail API Service Class"""
@@ -69,8 +101,14 @@ class GmailService:
                 if not refresh_success:
                     raise Exception("Token refresh failed. Please log in again.")
 
-            # Build Google API client
-            self.service = build("gmail", "v1", credentials=credentials)
+            # Build Google API client from the already-read discovery document
+            discovery_document = _gmail_discovery_document()
+            if discovery_document:
+                self.service = build_from_document(
+                    discovery_document, credentials=credentials
+                )
+            else:
+                self.service = build("gmail", "v1", credentials=credentials)
         except Exception as e:
             raise Exception(f"Failed to initialize Gmail API service: {str(e)}")
 
@@ -95,8 +133,9 @@ class GmailService:
             messages = results.get("messages", [])
 
             emails = []
-            for message in messages:
-                email_data = self._get_email_details(message["id"])
+            for email_data in self._get_email_details_batch(
+                [message["id"] for message in messages]
+            ):
                 if email_data:
                     # Date filtering (Gmail API's after query might not be accurate)
                     email_date = self._parse_date(email_data.get("date"))
@@ -134,6 +173,10 @@ class GmailService:
                     f"🔍 Gmail API call - Account: {self.account_id}, Query: {query} (default)"
                 )
 
+            # Pages skipped for the offset only need their nextPageToken, so
+            # their message ids are not transferred at all
+            skip_pages = offset // max_results
+
             # Get email list from Gmail API
             results = (
                 self.service.users()
@@ -142,47 +185,40 @@ class GmailService:
                     userId="me",
                     maxResults=max_results,
                     q=query,  # Emails received in the inbox after subscription date
+                    fields="nextPageToken" if skip_pages else None,
                 )
                 .execute()
             )
 
+            # Apply offset (Gmail API handles pagination internally)
+            for page in range(1, skip_pages + 1):
+                if "nextPageToken" not in results:
+                    break
+                results = (
+                    self.service.users()
+                    .messages()
+                    .list(
+                        userId="me",
+                        maxResults=max_results,
+                        pageToken=results["nextPageToken"],
+                        q=query,
+                        fields="nextPageToken" if page < skip_pages else None,
+                    )
+                    .execute()
+                )
+
             messages = results.get("messages", [])
             print(
                 f"📧 Gmail API response - Account: {self.account_id}, Message count: {len(messages)}"
             )
 
-            # Apply offset (Gmail API handles pagination internally)
-            if offset > 0 and "nextPageToken" in results:
-                # Process offset using nextPageToken
-                for _ in range(offset // max_results):
-                    if "nextPageToken" not in results:
-                        break
-                    results = (
-                        self.service.users()
-                        .messages()
-                        .list(
-                            userId="me",
-                            maxResults=max_results,
-                            pageToken=results["nextPageToken"],
-                            q=query,
-                        )
-                        .execute()
-                    )
-                    messages = results.get("messages", [])
-
-            emails = []
-            for i, message in enumerate(messages):
-                print(
-                    f"📨 Processing email ({i+1}/{len(messages)}) - ID: {message['id']}"
-                )
-                email_data = self._get_email_details(message["id"])
-                if email_data:
-                    emails.append(email_data)
-                    print(
-                        f"✅ Email data extraction complete - Subject: {email_data.get('subject', 'No subject')}"
-                    )
-                else:
-                    print(f"❌ Failed to get email details - ID: {message['id']}")
+            # Fetch message details with batched HTTP calls
+            emails = self._get_email_details_batch(
+                [message["id"] for message in messages]
+            )
+            print(
+                f"✅ Email data extraction complete - {len(emails)}/{len(messages)} emails"
+            )
 
             print(
                 f"🎉 Email processing complete - Account: {self.account_id}, Total {len(emails)} processed"
@@ -202,44 +238,87 @@ class GmailService:
             message = (
                 self.service.users()
                 .messages()
-                .get(userId="me", id=message_id, format="full")
+                .get(
+                    userId="me",
+                    id=message_id,
+                    format="full",
+                    fields=GMAIL_MESSAGE_FIELDS,
+                )
                 .execute()
             )
-
-            headers = message["payload"]["headers"]
-            subject = next(
-                (h["value"] for h in headers if h["name"] == "Subject"), "No subject"
-            )
-            sender = next(
-                (h["value"] for h in headers if h["name"] == "From"),
-                "Unknown sender",
-            )
-            date = next((h["value"] for h in headers if h["name"] == "Date"), None)
-
-            # Extract email body
-            body = self._extract_email_body(message["payload"])
-
-            # Extract header information (for unsubscribe)
-            email_headers = {}
-            for header in headers:
-                email_headers[header["name"]] = header["value"]
-
-            return {
-                "gmail_id": message_id,
-                "thread_id": message.get("threadId"),
-                "subject": subject,
-                "sender": sender,
-                "body": body,
-                "date": date,
-                "snippet": message.get("snippet", ""),
-                "labels": message.get("labelIds", []),
-                "headers": email_headers,
-            }
+            return self._parse_email_message(message)
 
         except HttpError as error:
             print(f"Failed to get email details (ID: {message_id}): {error}")
             return None
 
+    def _get_email_details_batch(self, message_ids: List[str]) -> List[Dict]:
+        """Get details of several emails, one batch HTTP call per GMAIL_BATCH_SIZE ids"""
+        details = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                print(f"Failed to get email details (ID: {request_id}): {exception}")
+                return
+            try:
+                details[request_id] = self._parse_email_message(response)
+            except Exception as e:
+                print(f"Failed to parse email details (ID: {request_id}): {str(e)}")
+
+        for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for message_id in message_ids[start : start + GMAIL_BATCH_SIZE]:
+                batch.add(
+                    self.service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=message_id,
+                        format="full",
+                        fields=GMAIL_MESSAGE_FIELDS,
+                    ),
+                    request_id=message_id,
+                )
+            batch.execute()
+
+        # Keep the order returned by messages.list
+        return [
+            details[message_id] for message_id in message_ids if message_id in details
+        ]
+
+    def _parse_email_message(self, message: Dict) -> Dict:
+        """Convert a Gmail API message (format=full) to email data"""
+        message_id = message["id"]
+        headers = message["payload"]["headers"]
+        subject = next(
+            (h["value"] for h in headers if h["name"] == "Subject"), "No subject"
+        )
+        sender = next(
+            (h["value"] for h in headers if h["name"] == "From"),
+            "Unknown sender",
+        )
+        date = next((h["value"] for h in headers if h["name"] == "Date"), None)
+
+        # Extract email body
+        body = self._extract_email_body(message["payload"])
+
+        # Extract header information (for unsubscribe)
+        email_headers = {}
+        for header in headers:
+            email_headers[header["name"]] = header["value"]
+
+        return {
+            "gmail_id": message_id,
+            "thread_id": message.get("threadId"),
+            "subject": subject,
+            "sender": sender,
+            "body": body,
+            "date": date,
+            "snippet": message.get("snippet", ""),
+            "labels": message.get("labelIds", []),
+            "headers": email_headers,
+        }
+
     def _extract_email_body(self, payload: Dict) -> str:
         """Extract email body"""
         if "body" in payload and payload["body"].get("data"):
@@ -260,22 +339,49 @@ class GmailService:
 
         return "Could not extract body."
 
-    def save_email_to_db(self, email_data: Dict) -> Email:
-        """Save email to DB (improved version)"""
+    def get_existing_gmail_ids(self, gmail_ids: List[str]) -> Set[str]:
+        """Gmail ids of this account that are already saved (one query)"""
+        if not gmail_ids:
+            return set()
+        return {
+            gmail_id
+            for (gmail_id,) in db.session.query(Email.gmail_id).filter(
+                Email.user_id == self.user_id,
+                Email.account_id == self.account_id,
+                Email.gmail_id.in_(gmail_ids),
+            )
+        }
+
+    def save_email_to_db(
+        self, email_data: Dict, commit: bool = True, check_existing: bool = True
+    ) -> Email:
+        """Save email to DB (improved version)
+
+        With commit=False the new row is flushed inside a savepoint and left for
+        the caller to commit with the rest of its batch; a failing email only
+        rolls back its own savepoint, not the emails added before it.
+        check_existing=False skips the per-email lookup for callers that already
+        filtered the batch with get_existing_gmail_ids.
+        """
         try:
-            # Check if email is already saved (per account)
-            existing_email = Email.query.filter_by(
-                user_id=self.user_id,
-                account_id=self.account_id,
-                gmail_id=email_data["gmail_id"],
-            ).first()
+            if check_existing:
+                # Check if email is already saved (per account)
+                existing_email = Email.query.filter_by(
+                    user_id=self.user_id,
+                    account_id=self.account_id,
+                    gmail_id=email_data["gmail_id"],
+                ).first()
 
-            if existing_email:
-                return existing_email
+                if existing_email:
+                    return existing_email
 
             # Extract sender information
             sender = email_data.get("sender") or "Unknown sender"
 
+            # Store the common-case unsubscribe links so unsubscribing later
+            # does not have to parse the body again
+            unsubscribe_links = self._extract_unsubscribe_links(email_data)
+
             # Create new email (with default values)
             email_obj = Email(
                 user_id=self.user_id,
@@ -286,21 +392,55 @@ class GmailService:
                 sender=sender,
                 content=email_data.get("body") or "No body",
                 summary=email_data.get("snippet", ""),
+                unsubscribe_links=(
+                    json.dumps(unsubscribe_links) if unsubscribe_links else None
+                ),
+                one_click_unsubscribe_url=self._extract_one_click_unsubscribe_url(
+                    email_data
+                ),
                 received_at=self._parse_date(email_data.get("date")),
                 is_read=False,
                 is_archived=False,
                 is_unsubscribed=False,  # New emails are not automatically unsubscribed by default
             )
 
-            db.session.add(email_obj)
-            db.session.commit()
+            if commit:
+                db.session.add(email_obj)
+                db.session.commit()
+            else:
+                with db.session.begin_nested():
+                    db.session.add(email_obj)
 
             return email_obj
 
         except Exception as e:
-            db.session.rollback()
+            if commit:
+                db.session.rollback()
             raise Exception(f"Failed to save email to DB: {str(e)}")
 
+    def _extract_unsubscribe_links(self, email_data: Dict) -> List[str]:
+        """Extract unsubscribe links from the List-Unsubscribe header and body"""
+        headers = email_data.get("headers") or {}
+        links = LIST_UNSUBSCRIBE_URL_PATTERN.findall(
+            headers.get("List-Unsubscribe", "")
+        )
+        links.extend(UNSUBSCRIBE_URL_PATTERN.findall(email_data.get("body") or ""))
+        # URLs captured from HTML bodies keep entities such as &amp;
+        return list(dict.fromkeys(html.unescape(link) for link in links))
+
+    def _extract_one_click_unsubscribe_url(self, email_data: Dict) -> Optional[str]:
+        """HTTPS List-Unsubscribe URL if the sender supports RFC 8058 one-click"""
+        headers = email_data.get("headers") or {}
+        list_unsubscribe_post = headers.get("List-Unsubscribe-Post", "")
+        if list_unsubscribe_post.strip().lower() != "list-unsubscribe=one-click":
+            return None
+        for url in LIST_UNSUBSCRIBE_URL_PATTERN.findall(
+            headers.get("List-Unsubscribe", "")
+        ):
+            if url.lower().startswith("https://"):
+                return url
+        return None
+
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """Convert date string to datetime (timezone-naive)"""
         if not date_str:
@@ -316,8 +456,12 @@ class GmailService:
         except:
             return datetime.utcnow()
 
-    def archive_email(self, gmail_id: str) -> bool:
-        """Archive email"""
+    def archive_email(self, gmail_id: str, update_db: bool = True) -> bool:
+        """Archive email
+
+        With update_db=False only Gmail is changed; callers handling many
+        emails update the local rows themselves in one statement.
+        """
         try:
             # Archive in Gmail
             self.service.users().messages().modify(
@@ -325,13 +469,10 @@ class GmailService:
             ).execute()
 
             # Update archived status in DB
-            email_obj = Email.query.filter_by(
-                user_id=self.user_id, account_id=self.account_id, gmail_id=gmail_id
-            ).first()
-
-            if email_obj:
-                email_obj.is_archived = True
-                email_obj.updated_at = datetime.utcnow()
+            if update_db:
+                Email.query.filter_by(
+                    user_id=self.user_id, account_id=self.account_id, gmail_id=gmail_id
+                ).update({"is_archived": True, "updated_at": datetime.utcnow()})
                 db.session.commit()
 
             return True
@@ -339,8 +480,12 @@ class GmailService:
         except HttpError as error:
             raise Exception(f"Failed to archive email: {error}")
 
-    def mark_as_read(self, gmail_id: str) -> bool:
-        """Mark email as read"""
+    def mark_as_read(self, gmail_id: str, update_db: bool = True) -> bool:
+        """Mark email as read
+
+        With update_db=False only Gmail is changed; callers handling many
+        emails update the local rows themselves in one statement.
+        """
         try:
             # Mark as read in Gmail
             self.service.users().messages().modify(
@@ -348,13 +493,10 @@ class GmailService:
             ).execute()
 
             # Update read status in DB
-            email_obj = Email.query.filter_by(
-                user_id=self.user_id, account_id=self.account_id, gmail_id=gmail_id
-            ).first()
-
-            if email_obj:
-                email_obj.is_read = True
-                email_obj.updated_at = datetime.utcnow()
+            if update_db:
+                Email.query.filter_by(
+                    user_id=self.user_id, account_id=self.account_id, gmail_id=gmail_id
+                ).update({"is_read": True, "updated_at": datetime.utcnow()})
                 db.session.commit()
 
             return True
@@ -362,6 +504,41 @@ class GmailService:
         except HttpError as error:
             raise Exception(f"Failed to mark email as read: {error}")
 
+    def batch_modify(
+        self,
+        gmail_ids: List[str],
+        add_labels: Optional[List[str]] = None,
+        remove_labels: Optional[List[str]] = None,
+    ) -> bool:
+        """Change labels of many emails (one batchModify call per 1000 ids)"""
+        try:
+            for start in range(0, len(gmail_ids), GMAIL_BATCH_MODIFY_SIZE):
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={
+                        "ids": gmail_ids[start : start + GMAIL_BATCH_MODIFY_SIZE],
+                        "addLabelIds": add_labels or [],
+                        "removeLabelIds": remove_labels or [],
+                    },
+                ).execute()
+            return True
+
+        except HttpError as error:
+            raise Exception(f"Failed to modify emails: {error}")
+
+    def batch_delete(self, gmail_ids: List[str]) -> bool:
+        """Delete many emails (one batchDelete call per 1000 ids)"""
+        try:
+            for start in range(0, len(gmail_ids), GMAIL_BATCH_MODIFY_SIZE):
+                self.service.users().messages().batchDelete(
+                    userId="me",
+                    body={"ids": gmail_ids[start : start + GMAIL_BATCH_MODIFY_SIZE]},
+                ).execute()
+            return True
+
+        except HttpError as error:
+            raise Exception(f"Failed to delete emails: {error}")
+
     def get_user_categories(self) -> List[Category]:
         """Get user's category list"""
         return Category.query.filter_by(user_id=self.user_id, is_active=True).all()
@@ -369,17 +546,11 @@ class GmailService:
     def update_email_category(self, gmail_id: str, category_id: Optional[int]) -> bool:
         """Update email category"""
         try:
-            email_obj = Email.query.filter_by(
+            updated = Email.query.filter_by(
                 user_id=self.user_id, account_id=self.account_id, gmail_id=gmail_id
-            ).first()
-
-            if email_obj:
-                email_obj.category_id = category_id
-                email_obj.updated_at = datetime.utcnow()
-                db.session.commit()
-                return True
-
-            return False
+            ).update({"category_id": category_id, "updated_at": datetime.utcnow()})
+            db.session.commit()
+            return updated > 0
 
         except Exception as e:
             db.session.rollback()
@@ -440,8 +611,13 @@ class GmailService:
         except HttpError as error:
             raise Exception(f"Failed to delete email: {error}")
 
-    async def process_unsubscribe(self, email_obj) -> Dict:
-        """Process advanced unsubscribe (improved version, async)"""
+    async def process_unsubscribe(self, email_obj, close_browser: bool = True) -> Dict:
+        """Process advanced unsubscribe (improved version, async)
+
+        The Playwright browser is reused for every link and retry of this call.
+        Callers unsubscribing several emails on one event loop pass
+        close_browser=False and call close_unsubscribe_browser() at the end.
+        """
         print(f"🔍 GmailService.process_unsubscribe started - Email ID: {email_obj.id}")
         print(
             f"📝 Email info - Subject: {email_obj.subject}, Sender: {email_obj.sender}"
@@ -454,8 +630,16 @@ class GmailService:
 
             # Use advanced unsubscribe service (pass user email)
             print(f"📝 AdvancedUnsubscribeService call started")
+            # Links extracted at ingest skip the full body parse
+            stored_links = getattr(email_obj, "unsubscribe_links", None)
             result = await self.advanced_unsubscribe.process_unsubscribe_advanced(
-                email_obj.content, getattr(email_obj, "headers", {}), user_email
+                email_obj.content,
+                getattr(email_obj, "headers", {}),
+                user_email,
+                known_links=(
+                    json.loads(stored_links) if isinstance(stored_links, str) else None
+                ),
+                one_click_url=getattr(email_obj, "one_click_unsubscribe_url", None),
             )
             print(f"📝 AdvancedUnsubscribeService result: {result}")
 
@@ -521,6 +705,14 @@ class GmailService:
                 "steps": [f"Error occurred: {str(e)}"],
             }
 
+        finally:
+            if close_browser:
+                await self.close_unsubscribe_browser()
+
+    async def close_unsubscribe_browser(self) -> None:
+        """Close the browser used by process_unsubscribe"""
+        await self.advanced_unsubscribe.close_browser()
+
     def _get_user_email(self) -> str:
         """Get user email address"""
         try:
@@ -4,6 +4,7 @@ Optimized for memory and browser reuse to run stably in Render environments.
 """
 
 import asyncio
+import glob
 import logging
 import re
 import time
@@ -11,12 +12,213 @@ import os
 import json
 import psutil
 import random
+from functools import lru_cache
 from typing import List, Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import openai
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"  # C parser, several times faster on large emails
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# URLs in the email body that look like unsubscribe/preference links. One
+# alternation scans the body once; "email...preferences" and
+# "manage...subscription" are covered by "preferences" and "subscription".
+UNSUBSCRIBE_URL_PATTERN = re.compile(
+    r"https?://[^\s<>\"]*"
+    r"(?:unsubscribe|opt-out|remove|cancel|subscription|preferences|settings|account)"
+    r"[^\s<>\"]*",
+    re.IGNORECASE,
+)
+
+# Markup that makes an email body HTML rather than plain text
+HTML_BODY_PATTERN = re.compile(r"<(?:html|body|div|table|p|a)\b", re.IGNORECASE)
+
+# Keywords in an anchor's href/text (or surrounding text) marking an unsubscribe link
+UNSUBSCRIBE_KEYWORDS = [
+    "unsubscribe",
+    "opt-out",
+    "remove",
+    "cancel",
+    "구독해지",  # (Korean: unsubscribe)
+    "구독취소",  # (Korean: cancel subscription)
+    "수신거부",  # (Korean: refuse reception)
+    "수신취소",  # (Korean: cancel reception)
+    "email preferences",
+    "manage subscription",
+    "subscription settings",
+    "구독",  # (Korean: subscribe)
+    "취소",  # (Korean: cancel)
+]
+UNSUBSCRIBE_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, UNSUBSCRIBE_KEYWORDS)))
+
+# Chromium flags for a low-memory headless browser. Chromium only honours the
+# last --disable-features flag, so all disabled features go in one.
+BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",
+    "--window-size=640,480",
+    "--max_old_space_size=64",
+    "--single-process",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--memory-pressure-off",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor,TranslateUI",
+    "--disable-software-rasterizer",
+    "--disable-threaded-animation",
+    "--disable-threaded-scrolling",
+    "--disable-logging",
+    "--disable-dev-tools",
+    "--disable-default-apps",
+    "--disable-popup-blocking",
+    "--disable-notifications",
+    "--disable-remote-fonts",
+    "--disable-smooth-scrolling",
+    "--disable-webgl",
+    "--disable-3d-apis",
+    "--disable-accelerated-2d-canvas",
+    "--disable-accelerated-jpeg-decoding",
+    "--disable-accelerated-mjpeg-decode",
+    "--disable-accelerated-video-decode",
+    "--disable-accelerated-video-encode",
+    "--disable-gpu-sandbox",
+    "--disable-threaded-compositing",
+    "--disable-touch-drag-drop",
+    "--disable-touch-feedback",
+    "--disable-xss-auditor",
+    "--no-zygote",
+    "--disable-ipc-flooding-protection",
+    "--disable-checker-imaging",
+    "--disable-new-content-rendering-timeout",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-sync-preferences",
+    "--disable-background-mode",
+    "--disable-background-downloads",
+)
+# textContent of a list of element handles, read in a single evaluate call
+ELEMENT_TEXTS_SCRIPT = "(elements) => elements.map((e) => e.textContent || '')"
+
+# Requests dropped before they leave the browser (--disable-images only skips
+# decoding, the bytes are still downloaded)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_PATTERN = re.compile(
+    r"google-analytics|googletagmanager|doubleclick|facebook\.com/tr"
+)
+
+
+async def block_unneeded_requests(route):
+    """Route handler that aborts images, fonts, media and analytics requests"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(
+        request.url
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Page text that means the address is (already) unsubscribed
+UNSUBSCRIBE_SUCCESS_INDICATORS = [
+    # Already unsubscribed indicators
+    "already unsubscribed",
+    "already cancelled",
+    "already removed",
+    "previously unsubscribed",
+    "previously cancelled",
+    "previously removed",
+    # Unsubscribe success indicators
+    "unsubscribe successful",
+    "successfully unsubscribed",
+    "unsubscribe completed",
+    "you have been unsubscribed",
+    "Unsubscribe completed",
+    "Unsubscribe success",
+    "Unsubscribe has been cancelled",
+    "Unsubscribe request completed",
+    "unsubscribe processed",
+]
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Shared HTTP session for unsubscribe requests
+
+    Keeps connections alive across calls and retries idempotent requests
+    on gateway errors.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = BROWSER_USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=4096)
+def is_valid_unsubscribe_url(url: str) -> bool:
+    """Check if the URL is a valid http(s) URL (cached; links repeat across emails)"""
+    try:
+        parsed = urlparse(url)
+        return parsed.scheme in ["http", "https"] and bool(parsed.netloc)
+    except:
+        return False
+
+
+@lru_cache(maxsize=1)
+def find_chrome_executable() -> Optional[str]:
+    """Locate the Chrome executable once per process (the filesystem scan is slow)"""
+    chrome_paths = [
+        os.path.expanduser("~/.cache/ms-playwright/chromium-*/chrome-linux/chrome"),
+        os.path.expanduser("~/.cache/ms-playwright/chromium-*/chrome-linux/chromium"),
+        "/root/.cache/ms-playwright/chromium-*/chrome-linux/chrome",
+        "/root/.cache/ms-playwright/chromium-*/chrome-linux/chromium",
+        "/ms-playwright/chromium-*/chrome-linux/chrome",
+        "/ms-playwright/chromium-*/chrome-linux/chromium",
+        "/usr/bin/chromium",
+        "/usr/bin/chromium-browser",
+        "/usr/bin/google-chrome",
+    ]
+
+    for path_pattern in chrome_paths:
+        if "*" in path_pattern:
+            # Wildcard pattern handling
+            matches = glob.glob(path_pattern)
+            if matches:
+                return matches[0]
+        elif os.path.exists(path_pattern):
+            return path_pattern
+    return None
 
 
 class PlaywrightUnsubscribeService:
@@ -24,80 +226,13 @@ class PlaywrightUnsubscribeService:
 
     def __init__(self):
         self.setup_logging()
+        self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
 
         # Memory optimization settings
-        self.browser_args = [
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--disable-images",
-            "--headless",
-            "--window-size=640,480",
-            "--max_old_space_size=64",
-            "--single-process",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
-            "--memory-pressure-off",
-            "--disable-web-security",
-            "--disable-features=VizDisplayCompositor",
-            "--disable-software-rasterizer",
-            "--disable-threaded-animation",
-            "--disable-threaded-scrolling",
-            "--disable-logging",
-            "--disable-dev-tools",
-            "--disable-default-apps",
-            "--disable-popup-blocking",
-            "--disable-notifications",
-            "--disable-remote-fonts",
-            "--disable-smooth-scrolling",
-            "--disable-webgl",
-            "--disable-3d-apis",
-            "--disable-accelerated-2d-canvas",
-            "--disable-accelerated-jpeg-decoding",
-            "--disable-accelerated-mjpeg-decode",
-            "--disable-accelerated-video-decode",
-            "--disable-accelerated-video-encode",
-            "--disable-gpu-sandbox",
-            "--disable-threaded-compositing",
-            "--disable-touch-drag-drop",
-            "--disable-touch-feedback",
-            "--disable-xss-auditor",
-            "--no-zygote",
-            "--disable-ipc-flooding-protection",
-            "--disable-renderer-backgrounding",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-features=TranslateUI",
-            "--disable-ipc-flooding-protection",
-            "--memory-pressure-off",
-            "--max_old_space_size=64",
-            "--disable-web-security",
-            "--disable-features=VizDisplayCompositor",
-            "--disable-software-rasterizer",
-            "--disable-threaded-animation",
-            "--disable-threaded-scrolling",
-            "--disable-checker-imaging",
-            "--disable-new-content-rendering-timeout",
-            "--disable-hang-monitor",
-            "--disable-prompt-on-repost",
-            "--disable-client-side-phishing-detection",
-            "--disable-component-update",
-            "--disable-default-apps",
-            "--disable-sync",
-            "--disable-translate",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-background-networking",
-            "--disable-sync-preferences",
-            "--disable-background-mode",
-            "--disable-background-downloads",
-        ]
+        self.browser_args = list(BROWSER_ARGS)
 
         # Timeout settings (tuned for Render environment)
         self.timeouts = {
@@ -105,8 +240,15 @@ class PlaywrightUnsubscribeService:
             "element_wait": 10000,  # 10 seconds
             "api_call": 20000,  # 20 seconds
             "retry_delay": 2000,  # 2 seconds
+            "http_request": 10000,  # 10 seconds
         }
 
+        # Same model setting as the email classifier
+        self.ai_model = os.environ.get("OPENAI_MODEL", "gpt-4.1-nano")
+
+        # Plain HTTP client for the pre-browser static attempt
+        self.http_session = get_http_session()
+
         # Initialize statistics
         self.stats = {
             "total_attempts": 0,
@@ -118,148 +260,127 @@ class PlaywrightUnsubscribeService:
         }
 
     def _log_memory_usage(self, stage: str):
-        """Log memory usage"""
+        """Log memory usage (only sampled when debug logging is on)"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             process = psutil.Process(os.getpid())
             memory_info = process.memory_info()
             memory_mb = memory_info.rss / 1024 / 1024
-            print(f"📊 Memory usage [{stage}]: {memory_mb:.1f} MB")
+            self.logger.debug("📊 Memory usage [%s]: %.1f MB", stage, memory_mb)
             self.stats["memory_usage"].append(
                 {"stage": stage, "memory_mb": memory_mb, "timestamp": time.time()}
             )
         except Exception as e:
-            print(f"⚠️ Memory monitoring failed: {str(e)}")
+            self.logger.warning("⚠️ Memory monitoring failed: %s", e)
 
     async def initialize_browser(self):
         """Initialize browser (reusable)"""
         if self.browser is None:
             # Check browser path and dynamic detection
-            import os
-            import glob
-
-            # Find Chrome executable
-            chrome_paths = [
-                os.path.expanduser(
-                    "~/.cache/ms-playwright/chromium-*/chrome-linux/chrome"
-                ),
-                os.path.expanduser(
-                    "~/.cache/ms-playwright/chromium-*/chrome-linux/chromium"
-                ),
-                "/root/.cache/ms-playwright/chromium-*/chrome-linux/chrome",
-                "/root/.cache/ms-playwright/chromium-*/chrome-linux/chromium",
-                "/ms-playwright/chromium-*/chrome-linux/chrome",
-                "/ms-playwright/chromium-*/chrome-linux/chromium",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-                "/usr/bin/google-chrome",
-            ]
-
-            executable_path = None
-            for path_pattern in chrome_paths:
-                if "*" in path_pattern:
-                    # Wildcard pattern handling
-                    matches = glob.glob(path_pattern)
-                    if matches:
-                        executable_path = matches[0]
-                        print(f"📝 Chrome executable found: {executable_path}")
-                        break
-                elif os.path.exists(path_pattern):
-                    executable_path = path_pattern
-                    print(f"📝 Chrome executable found: {executable_path}")
-                    break
-
-            if not executable_path:
-                print(
+            executable_path = find_chrome_executable()
+            if executable_path:
+                self.logger.debug("📝 Chrome executable found: %s", executable_path)
+            else:
+                self.logger.warning(
                     "⚠️ Could not find Chrome executable. Proceeding in auto-detect mode."
                 )
 
-            playwright = await async_playwright().start()
+            # Kept so cleanup_browser can stop the driver process too
+            self.playwright = await async_playwright().start()
             try:
-                self.browser = await playwright.chromium.launch(
+                self.browser = await self.playwright.chromium.launch(
                     headless=True,
                     args=self.browser_args,
                     chromium_sandbox=False,
                     executable_path=executable_path,
                 )
-                print("✅ Playwright browser initialized")
+                self.logger.info("✅ Playwright browser initialized")
             except Exception as e:
-                print(f"❌ Browser initialization failed: {str(e)}")
+                self.logger.error("❌ Browser initialization failed: %s", e)
                 # Retry (without executable_path)
-                self.browser = await playwright.chromium.launch(
+                self.browser = await self.playwright.chromium.launch(
                     headless=True,
                     args=self.browser_args,
                     chromium_sandbox=False,
                 )
-                print("✅ Playwright browser initialized (retry)")
+                self.logger.info("✅ Playwright browser initialized (retry)")
 
         # Create new context (reuse existing context)
         if self.context is None:
             try:
-                print(f" Browser context creation started...")
-                print(f"🔍 Browser state: {self.browser}")
-                print(f"🔍 Browser type: {type(self.browser)}")
-                print(
-                    f"🔍 Browser methods: {[m for m in dir(self.browser) if not m.startswith('_')]}"
+                self.logger.debug(" Browser context creation started...")
+                self.logger.debug("🔍 Browser state: %s", self.browser)
+                self.logger.debug("🔍 Browser type: %s", type(self.browser))
+                self.logger.debug(
+                    "🔍 Browser methods: %s",
+                    [m for m in dir(self.browser) if not m.startswith("_")],
                 )
 
                 self.context = await self.browser.new_context(
                     viewport={"width": 640, "height": 480},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    user_agent=BROWSER_USER_AGENT,
                     java_script_enabled=True,
                     ignore_https_errors=True,
                 )
-                print(f"🔍 Context creation result: {self.context}")
-                print(f"🔍 Context type: {type(self.context)}")
-                print(
-                    f"🔍 Context methods: {[m for m in dir(self.context) if not m.startswith('_')]}"
+                await self.context.route("**/*", block_unneeded_requests)
+                self.logger.debug("🔍 Context creation result: %s", self.context)
+                self.logger.debug("🔍 Context type: %s", type(self.context))
+                self.logger.debug(
+                    "🔍 Context methods: %s",
+                    [m for m in dir(self.context) if not m.startswith("_")],
                 )
 
                 if self.context is None:
                     raise Exception("Browser context creation failed")
-                print("📝 New browser context created")
+                self.logger.debug("📝 New browser context created")
             except Exception as e:
-                print(f"❌ Browser context creation failed: {str(e)}")
-                print(f"🔍 Exception type: {type(e)}")
-                print(f"🔍 Exception details: {e}")
-                print(f"🔍 Exception traceback: {e.__traceback__}")
+                self.logger.error("❌ Browser context creation failed: %s", e)
+                self.logger.debug("🔍 Exception type: %s", type(e))
+                self.logger.debug("🔍 Exception details: %s", e)
+                self.logger.debug("🔍 Exception traceback: %s", e.__traceback__)
                 raise Exception(f"Browser context creation failed: {str(e)}")
         else:
             self.stats["browser_reuses"] += 1
-            print(
-                f"♻️ Browser context reused (reuse count: {self.stats['browser_reuses']})"
+            self.logger.debug(
+                "♻️ Browser context reused (reuse count: %s)",
+                self.stats["browser_reuses"],
             )
 
         # Create new page
         try:
-            print(f" Page creation started...")
-            print(f"🔍 Context state: {self.context}")
-            print(f"🔍 Context type: {type(self.context)}")
-            print(f"🔍 Is context None?: {self.context is None}")
+            self.logger.debug(" Page creation started...")
+            self.logger.debug("🔍 Context state: %s", self.context)
+            self.logger.debug("🔍 Context type: %s", type(self.context))
+            self.logger.debug("🔍 Is context None?: %s", self.context is None)
 
             if self.context is None:
-                print(f"❌ Context is None!")
+                self.logger.error("❌ Context is None!")
                 raise Exception("Context is None")
 
-            print(f"🔍 Calling new_page method...")
+            self.logger.debug("🔍 Calling new_page method...")
             self.page = await self.context.new_page()
-            print(f"🔍 Page creation result: {self.page}")
-            print(f" Page type: {type(self.page)}")
-            print(f"🔍 Is page None?: {self.page is None}")
+            self.logger.debug("🔍 Page creation result: %s", self.page)
+            self.logger.debug(" Page type: %s", type(self.page))
+            self.logger.debug("🔍 Is page None?: %s", self.page is None)
 
             if self.page is None:
                 raise Exception("Page creation failed")
 
-            print(f"🔍 Setting page timeout...")
-            self.page.set_default_timeout(self.timeouts["page_load"])
-            print("✅ New page created")
+            self.logger.debug("🔍 Setting page timeout...")
+            # Navigation gets the page-load budget; element actions (click,
+            # text_content) on a stale or hidden element fail fast instead
+            self.page.set_default_navigation_timeout(self.timeouts["page_load"])
+            self.page.set_default_timeout(self.timeouts["element_wait"])
+            self.logger.info("✅ New page created")
             return self.page
         except Exception as e:
-            print(f"❌ Page creation failed: {str(e)}")
-            print(f"🔍 Exception type: {type(e)}")
-            print(f"🔍 Exception details: {e}")
-            print(f"🔍 Context state: {self.context}")
-            print(f" Page state: {self.page}")
-            print(f"🔍 Exception traceback: {e.__traceback__}")
+            self.logger.error("❌ Page creation failed: %s", e)
+            self.logger.debug("🔍 Exception type: %s", type(e))
+            self.logger.debug("🔍 Exception details: %s", e)
+            self.logger.debug("🔍 Context state: %s", self.context)
+            self.logger.debug(" Page state: %s", self.page)
+            self.logger.debug("🔍 Exception traceback: %s", e.__traceback__)
             # Try to cleanup page
             if self.page:
                 try:
@@ -274,9 +395,9 @@ class PlaywrightUnsubscribeService:
         if self.page:
             try:
                 await self.page.close()
-                print("🧹 Page cleanup complete")
+                self.logger.debug("🧹 Page cleanup complete")
             except Exception as e:
-                print(f"⚠️ Error during page cleanup: {str(e)}")
+                self.logger.warning("⚠️ Error during page cleanup: %s", e)
             finally:
                 self.page = None
 
@@ -288,83 +409,73 @@ class PlaywrightUnsubscribeService:
         if self.context:
             try:
                 await self.context.close()
-                print("🧹 Browser context cleanup complete")
+                self.logger.debug("🧹 Browser context cleanup complete")
             except Exception as e:
-                print(f"⚠️ Error during context cleanup: {str(e)}")
+                self.logger.warning("⚠️ Error during context cleanup: %s", e)
             finally:
                 self.context = None
 
         if self.browser:
             try:
                 await self.browser.close()
-                print("🧹 Browser cleanup complete")
+                self.logger.debug("🧹 Browser cleanup complete")
             except Exception as e:
-                print(f"⚠️ Error during browser cleanup: {str(e)}")
+                self.logger.warning("⚠️ Error during browser cleanup: %s", e)
             finally:
                 self.browser = None
 
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                self.logger.warning("⚠️ Error during Playwright driver cleanup: %s", e)
+            finally:
+                self.playwright = None
+
     def extract_unsubscribe_links(
         self, email_content: str, email_headers: Dict = None
     ) -> List[str]:
         """Extract unsubscribe links from email (same as before)"""
-        print(f"🔍 extract_unsubscribe_links started")
+        self.logger.debug("🔍 extract_unsubscribe_links started")
         unsubscribe_links = []
 
         # 1. Check List-Unsubscribe field in email headers
         if email_headers:
             list_unsubscribe = email_headers.get("List-Unsubscribe", "")
-            print(f"📝 List-Unsubscribe header: {list_unsubscribe}")
+            self.logger.debug("📝 List-Unsubscribe header: %s", list_unsubscribe)
             if list_unsubscribe:
-                links = [link.strip() for link in list_unsubscribe.split(",")]
+                links = [
+                    link.strip().strip("<>") for link in list_unsubscribe.split(",")
+                ]
                 unsubscribe_links.extend(links)
-                print(f"📝 Links extracted from header: {links}")
-
-        # 2. Search for unsubscribe link patterns in email body
-        print(f"📝 Pattern search in email body started")
-        patterns = [
-            r"https?://[^\s<>\"]*unsubscribe[^\s<>\"]*",
-            r"https?://[^\s<>\"]*opt-out[^\s<>\"]*",
-            r"https?://[^\s<>\"]*remove[^\s<>\"]*",
-            r"https?://[^\s<>\"]*cancel[^\s<>\"]*",
-            r"https?://[^\s<>\"]*subscription[^\s<>\"]*",
-            r"https?://[^\s<>\"]*email[^\s<>\"]*preferences[^\s<>\"]*",
-            r"https?://[^\s<>\"]*manage[^\s<>\"]*subscription[^\s<>\"]*",
-            r"https?://[^\s<>\"]*preferences[^\s<>\"]*",
-            r"https?://[^\s<>\"]*settings[^\s<>\"]*",
-            r"https?://[^\s<>\"]*account[^\s<>\"]*",
-        ]
-
-        for i, pattern in enumerate(patterns):
-            matches = re.findall(pattern, email_content, re.IGNORECASE)
-            if matches:
-                print(f"📝 Matches found in pattern {i + 1}: {matches}")
-            unsubscribe_links.extend(matches)
+                self.logger.debug("📝 Links extracted from header: %s", links)
+
+        # HTML bodies are parsed once: the URL pattern runs on their visible
+        # text (URLs written out, not linked) and the anchors are scanned below
+        soup = None
+        body_text = email_content
+        if HTML_BODY_PATTERN.search(email_content):
+            soup = BeautifulSoup(email_content, HTML_PARSER)
+            body_text = soup.get_text(" ")
+
+        # 2. Search for unsubscribe link patterns in the body text
+        self.logger.debug("📝 Pattern search in email body started")
+        matches = UNSUBSCRIBE_URL_PATTERN.findall(body_text)
+        if matches:
+            self.logger.debug("📝 Pattern matches found: %s", matches)
+        unsubscribe_links.extend(matches)
 
         # 3. Extract links from HTML tags
-        print(f"📝 Extracting links from HTML tags started")
-        soup = BeautifulSoup(email_content, "html.parser")
+        anchors = []
+        if soup is not None:
+            self.logger.debug("📝 Extracting links from HTML tags started")
+            anchors = soup.find_all("a", href=True)
         html_links_found = 0
 
-        for link in soup.find_all("a", href=True):
+        for link in anchors:
             href = link.get("href", "").lower()
             link_text = link.get_text().strip().lower()
 
-            unsubscribe_keywords = [
-                "unsubscribe",
-                "opt-out",
-                "remove",
-                "cancel",
-                "구독해지",  # (Korean: unsubscribe)
-                "구독취소",  # (Korean: cancel subscription)
-                "수신거부",  # (Korean: refuse reception)
-                "수신취소",  # (Korean: cancel reception)
-                "email preferences",
-                "manage subscription",
-                "subscription settings",
-                "구독",  # (Korean: subscribe)
-                "취소",  # (Korean: cancel)
-            ]
-
             generic_texts = ["여기", "click", "link", "here", "보기", "확인"]
             found = False
             # 1. If the anchor text is generic, check parent/grandparent text for keywords
@@ -374,48 +485,51 @@ class PlaywrightUnsubscribeService:
                     parent_text += link.parent.get_text().lower()
                 if link.parent and link.parent.parent:
                     parent_text += link.parent.parent.get_text().lower()
-                if any(keyword in parent_text for keyword in unsubscribe_keywords):
+                if UNSUBSCRIBE_KEYWORD_PATTERN.search(parent_text):
                     unsubscribe_links.append(link["href"])
                     html_links_found += 1
-                    print(
-                        f"📝 Unsubscribe link found in HTML (parent context): {link['href']} (parent context matched)"
+                    self.logger.debug(
+                        "📝 Unsubscribe link found in HTML (parent context): %s (parent context matched)",
+                        link["href"],
                     )
                     found = True
             # 2. If keyword is in href or text, add as unsubscribe link
             if not found:
-                for keyword in unsubscribe_keywords:
-                    if keyword in href or keyword in link_text:
-                        unsubscribe_links.append(link["href"])
-                        html_links_found += 1
-                        print(
-                            f"📝 Unsubscribe link found in HTML: {link['href']} (keyword: {keyword})"
-                        )
-                        break
+                match = UNSUBSCRIBE_KEYWORD_PATTERN.search(href)
+                if not match:
+                    match = UNSUBSCRIBE_KEYWORD_PATTERN.search(link_text)
+                if match:
+                    unsubscribe_links.append(link["href"])
+                    html_links_found += 1
+                    self.logger.debug(
+                        "📝 Unsubscribe link found in HTML: %s (keyword: %s)",
+                        link["href"],
+                        match.group(0),
+                    )
 
-        print(f"📝 Number of unsubscribe links found in HTML: {html_links_found}")
+        self.logger.debug(
+            "📝 Number of unsubscribe links found in HTML: %s", html_links_found
+        )
 
         # Remove duplicates and filter only valid URLs
-        print(f"📝 Removing duplicates and validating URLs started")
-        print(f"📝 Total links extracted: {len(unsubscribe_links)}")
+        self.logger.debug("📝 Removing duplicates and validating URLs started")
+        self.logger.debug("📝 Total links extracted: %s", len(unsubscribe_links))
 
+        # Order-preserving dedup: header links come first and are tried first
         valid_links = []
-        for link in set(unsubscribe_links):
+        for link in dict.fromkeys(unsubscribe_links):
             if self._is_valid_unsubscribe_url(link):
                 valid_links.append(link)
-                print(f"📝 Valid link added: {link}")
+                self.logger.debug("📝 Valid link added: %s", link)
             else:
-                print(f"❌ Invalid link excluded: {link}")
+                self.logger.debug("❌ Invalid link excluded: %s", link)
 
-        print(f"📝 Final number of valid links: {len(valid_links)}")
+        self.logger.debug("📝 Final number of valid links: %s", len(valid_links))
         return valid_links
 
     def _is_valid_unsubscribe_url(self, url: str) -> bool:
         """Check if the URL is a valid unsubscribe URL"""
-        try:
-            parsed = urlparse(url)
-            return parsed.scheme in ["http", "https"] and parsed.netloc
-        except:
-            return False
+        return is_valid_unsubscribe_url(url)
 
     async def process_unsubscribe_with_playwright_ai(
         self, unsubscribe_url: str, user_email: str = None
@@ -424,13 +538,26 @@ class PlaywrightUnsubscribeService:
         start_time = time.time()
         self.log_unsubscribe_attempt(unsubscribe_url, user_email, start_time)
 
+        # Simple pages and forms are handled without starting the browser
+        static_result = await asyncio.to_thread(
+            self._try_static_unsubscribe, unsubscribe_url, user_email
+        )
+        if static_result["success"]:
+            return self._finalize_success(static_result, start_time)
+        self.logger.debug(
+            "📝 Static attempt: %s, using browser", static_result["message"]
+        )
+
         max_retries = 2
         retry_count = 0
 
         while retry_count <= max_retries:
             try:
-                print(
-                    f"🔧 Playwright + AI unsubscribe attempt ({retry_count + 1}/{max_retries + 1}): {unsubscribe_url}"
+                self.logger.debug(
+                    "🔧 Playwright + AI unsubscribe attempt (%s/%s): %s",
+                    retry_count + 1,
+                    max_retries + 1,
+                    unsubscribe_url,
                 )
 
                 # Initialize browser
@@ -441,12 +568,12 @@ class PlaywrightUnsubscribeService:
                     raise Exception("Browser page initialization failed")
 
                 # Step 1: Initial page access
-                print(f"📝 Step 1: Initial page access")
+                self.logger.debug("📝 Step 1: Initial page access")
                 await page.goto(unsubscribe_url, wait_until="domcontentloaded")
-                await page.wait_for_timeout(2000)  # Page loading wait
+                await self._wait_for_page_update(page, 2000)
 
                 # Step 2: Check unsubscribe success state
-                print(f"📝 Step 2: Check unsubscribe success state")
+                self.logger.debug("📝 Step 2: Check unsubscribe success state")
                 if await self._check_unsubscribe_success(page):
                     await self.cleanup_page()
                     return {
@@ -457,14 +584,14 @@ class PlaywrightUnsubscribeService:
                     }
 
                 # Step 3: Try basic unsubscribe
-                print(f"📝 Step 3: Try basic unsubscribe")
+                self.logger.debug("📝 Step 3: Try basic unsubscribe")
                 basic_result = await self._try_basic_unsubscribe(page, user_email)
                 if basic_result["success"]:
                     await self.cleanup_page()
                     return self._finalize_success(basic_result, start_time)
 
                 # Step 4: Handle second page
-                print(f"📝 Step 4: Handle second page")
+                self.logger.debug("📝 Step 4: Handle second page")
                 second_result = await self._try_second_page_unsubscribe(
                     page, user_email
                 )
@@ -473,14 +600,14 @@ class PlaywrightUnsubscribeService:
                     return self._finalize_success(second_result, start_time)
 
                 # Step 5: AI analysis and processing
-                print(f"📝 Step 5: AI analysis and processing")
+                self.logger.debug("📝 Step 5: AI analysis and processing")
                 ai_result = await self._analyze_page_with_ai(page, user_email)
                 if ai_result["success"]:
                     await self.cleanup_page()
                     return self._finalize_success(ai_result, start_time)
 
                 # Step 6: Final check for unsubscribe success
-                print(f"📝 Step 6: Final check for unsubscribe success")
+                self.logger.debug("📝 Step 6: Final check for unsubscribe success")
                 if await self._check_unsubscribe_success(page):
                     await self.cleanup_page()
                     return {
@@ -497,12 +624,16 @@ class PlaywrightUnsubscribeService:
                 )
 
             except Exception as e:
-                print(f"❌ Playwright + AI unsubscribe attempt failed: {str(e)}")
+                self.logger.error(
+                    "❌ Playwright + AI unsubscribe attempt failed: %s", e
+                )
                 await self.cleanup_page()
                 retry_count += 1
 
                 if retry_count <= max_retries:
-                    print(f"🔄 Retrying... ({retry_count}/{max_retries})")
+                    self.logger.debug(
+                        "🔄 Retrying... (%s/%s)", retry_count, max_retries
+                    )
                     await asyncio.sleep(2)  # Wait before retrying
                 else:
                     return self._finalize_failure(
@@ -511,10 +642,91 @@ class PlaywrightUnsubscribeService:
 
         return self._finalize_failure("Exceeded maximum retry count", start_time)
 
+    def _try_static_unsubscribe(
+        self, unsubscribe_url: str, user_email: str = None
+    ) -> Dict:
+        """Unsubscribe with plain HTTP requests (no JavaScript)
+
+        Covers pages that confirm on load and unsubscribe forms, like
+        _try_form_action_submit does in the browser.
+        """
+        timeout = self.timeouts["http_request"] / 1000
+        try:
+            response = self.http_session.get(unsubscribe_url, timeout=timeout)
+            if response.status_code >= 400:
+                return {
+                    "success": False,
+                    "message": f"Static GET returned {response.status_code}",
+                }
+            if self._has_success_indicator(response.url, response.text):
+                return {
+                    "success": True,
+                    "message": "Unsubscribe completed.",
+                    "method": "static_get",
+                }
+
+            soup = BeautifulSoup(
+                response.text, HTML_PARSER, parse_only=SoupStrainer("form")
+            )
+            for form in soup.find_all("form"):
+                action = form.get("action") or ""
+                if "unsubscribe" not in action.lower():
+                    continue
+
+                # Collect form data, filling email fields with the user's address
+                form_data = {}
+                for input_elem in form.find_all("input"):
+                    name = input_elem.get("name")
+                    input_type = (input_elem.get("type") or "text").lower()
+                    if not name or input_type == "submit":
+                        continue
+                    if user_email and (
+                        input_type == "email" or "email" in name.lower()
+                    ):
+                        form_data[name] = user_email
+                    else:
+                        form_data[name] = input_elem.get("value") or ""
+
+                action_url = urljoin(response.url, action)
+                if (form.get("method") or "GET").upper() == "POST":
+                    form_response = self.http_session.post(
+                        action_url, data=form_data, timeout=timeout
+                    )
+                else:
+                    form_response = self.http_session.get(
+                        action_url, params=form_data, timeout=timeout
+                    )
+                self.logger.debug(
+                    "📝 Static form submit: %s -> %s",
+                    action_url,
+                    form_response.status_code,
+                )
+
+                if form_response.status_code < 400 and self._has_success_indicator(
+                    form_response.url, form_response.text
+                ):
+                    return {
+                        "success": True,
+                        "message": "Unsubscribe confirmed after form submission",
+                        "method": "static_form",
+                    }
+
+            return {"success": False, "message": "Static unsubscribe not confirmed"}
+
+        except requests.RequestException as e:
+            return {"success": False, "message": f"Static request failed: {str(e)}"}
+
+    def _has_success_indicator(self, url: str, content: str) -> bool:
+        """Check a page's URL and HTML for unsubscribe success text"""
+        all_text = f"{url} {content.lower()}"
+        return any(
+            indicator in all_text for indicator in UNSUBSCRIBE_SUCCESS_INDICATORS
+        )
+
     async def _try_basic_unsubscribe(self, page: Page, user_email: str = None) -> Dict:
         """Basic unsubscribe processing (integrated JavaScript-based)"""
         try:
-            print(f"📝 Basic unsubscribe processing started")
+            self.logger.debug("📝 Basic unsubscribe processing started")
 
             # Integrated JavaScript-based unsubscribe processing
             return await self._try_javascript_submit(
@@ -558,8 +770,10 @@ class PlaywrightUnsubscribeService:
 
                         if is_visible and is_enabled:
                             element_text = await element.text_content()
-                            print(
-                                f"📝 Legacy element found: {selector} - text: '{element_text}'"
+                            self.logger.debug(
+                                "📝 Legacy element found: %s - text: '%s'",
+                                selector,
+                                element_text,
                             )
 
                             # Check unsubscribe-related keywords
@@ -587,7 +801,9 @@ class PlaywrightUnsubscribeService:
                                 is_unsubscribe_element
                                 or "unsubscribe" in selector.lower()
                             ):
-                                print(f"📝 Legacy element clicked: {element_text}")
+                                self.logger.debug(
+                                    "📝 Legacy element clicked: %s", element_text
+                                )
 
                                 # Save current URL before click
                                 before_url = page.url
@@ -596,21 +812,24 @@ class PlaywrightUnsubscribeService:
                                 try:
                                     await element.click(timeout=5000)
                                 except Exception as click_error:
-                                    print(
-                                        f"⚠️ Click failed, retrying with JavaScript: {str(click_error)}"
+                                    self.logger.warning(
+                                        "⚠️ Click failed, retrying with JavaScript: %s",
+                                        click_error,
                                     )
                                     await page.evaluate(
                                         "(element) => element.click()", element
                                     )
 
                                 # Short wait
-                                await page.wait_for_timeout(2000)
+                                await self._wait_for_page_update(page, 2000, before_url)
 
                                 # Check URL change
                                 after_url = page.url
                                 if before_url != after_url:
-                                    print(
-                                        f"📝 URL change detected: {before_url} → {after_url}"
+                                    self.logger.debug(
+                                        "📝 URL change detected: %s → %s",
+                                        before_url,
+                                        after_url,
                                     )
 
                                 # Check unsubscribe completion
@@ -622,7 +841,7 @@ class PlaywrightUnsubscribeService:
                                         "selector": selector,
                                     }
                                 # AI-based unsubscribe completion check
-                                print(
+                                self.logger.debug(
                                     "🤖 Starting AI-based unsubscribe completion analysis..."
                                 )
                                 ai_result = (
@@ -635,8 +854,9 @@ class PlaywrightUnsubscribeService:
                                     ai_result["success"]
                                     and ai_result["confidence"] >= 70
                                 ):
-                                    print(
-                                        f"🤖 Unsubscribe confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
+                                    self.logger.debug(
+                                        "🤖 Unsubscribe confirmed by AI analysis (confidence: %s%%)",
+                                        ai_result["confidence"],
                                     )
                                     return {
                                         "success": True,
@@ -645,25 +865,32 @@ class PlaywrightUnsubscribeService:
                                         "ai_reason": ai_result["reason"],
                                     }
                                 else:
-                                    print(
-                                        f"🤖 AI analysis result: Unsubscribe not completed (confidence: {ai_result['confidence']}%)"
+                                    self.logger.debug(
+                                        "🤖 AI analysis result: Unsubscribe not completed (confidence: %s%%)",
+                                        ai_result["confidence"],
                                     )
                                     # Also check with legacy method
                                     if await self._check_basic_success_indicators(page):
-                                        print("📝 Success confirmed by basic indicator")
+                                        self.logger.debug(
+                                            "📝 Success confirmed by basic indicator"
+                                        )
                                         return {
                                             "success": True,
                                             "message": "Legacy unsubscribe success",
                                         }
                                     else:
-                                        print("📝 Judged as unsubscribe not completed")
+                                        self.logger.debug(
+                                            "📝 Judged as unsubscribe not completed"
+                                        )
                                         return {
                                             "success": False,
                                             "message": "Legacy unsubscribe not completed",
                                         }
 
                 except Exception as e:
-                    print(f"⚠️ Error processing legacy selector {selector}: {str(e)}")
+                    self.logger.warning(
+                        "⚠️ Error processing legacy selector %s: %s", selector, e
+                    )
                     continue
 
             return {
@@ -709,7 +936,7 @@ Please answer in JSON format:
             return self._parse_simple_ai_result(ai_response, current_url, title)
 
         except Exception as e:
-            print(f"⚠️ AI unsubscribe completion analysis failed: {str(e)}")
+            self.logger.warning("⚠️ AI unsubscribe completion analysis failed: %s", e)
             return {"success": False, "confidence": 0, "reason": str(e)}
 
     def _parse_simple_ai_result(self, ai_response: str, url: str, title: str) -> Dict:
@@ -734,10 +961,12 @@ Please answer in JSON format:
                         "title": title,
                     }
 
-                    print(f"🤖 AI unsubscribe completion analysis (simplified):")
-                    print(f"   - Success: {result['success']}")
-                    print(f"   - Confidence: {result['confidence']}%")
-                    print(f"   - Reason: {result['reason']}")
+                    self.logger.debug(
+                        "🤖 AI unsubscribe completion analysis (simplified):"
+                    )
+                    self.logger.debug("   - Success: %s", result["success"])
+                    self.logger.debug("   - Confidence: %s%%", result["confidence"])
+                    self.logger.debug("   - Reason: %s", result["reason"])
 
                     return result
 
@@ -797,15 +1026,15 @@ Please answer in JSON format:
                 "title": title,
             }
 
-            print(f"🤖 AI unsubscribe completion analysis (text-based):")
-            print(f"   - Success: {success}")
-            print(f"   - Confidence: {confidence}%")
-            print(f"   - Reason: {ai_response}")
+            self.logger.debug("🤖 AI unsubscribe completion analysis (text-based):")
+            self.logger.debug("   - Success: %s", success)
+            self.logger.debug("   - Confidence: %s%%", confidence)
+            self.logger.debug("   - Reason: %s", ai_response)
 
             return result
 
         except Exception as e:
-            print(f"⚠️ AI response parsing failed: {str(e)}")
+            self.logger.warning("⚠️ AI response parsing failed: %s", e)
             return {
                 "success": False,
                 "confidence": 0,
@@ -820,23 +1049,24 @@ Please answer in JSON format:
             # First check with legacy method
             basic_result = await self._check_basic_success_indicators(page)
             if basic_result:
-                print("📝 Success confirmed by basic indicator")
+                self.logger.debug("📝 Success confirmed by basic indicator")
                 return True
 
             # Additional check with AI-based analysis
-            print("🤖 Starting AI-based unsubscribe completion analysis...")
+            self.logger.debug("🤖 Starting AI-based unsubscribe completion analysis...")
             ai_result = await self._analyze_unsubscribe_completion_with_ai(page)
 
             if ai_result["success"] and ai_result["confidence"] >= 70:
-                print(
-                    f"🤖 Success confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
+                self.logger.debug(
+                    "🤖 Success confirmed by AI analysis (confidence: %s%%)",
+                    ai_result["confidence"],
                 )
                 return True
 
             return False
 
         except Exception as e:
-            print(f"⚠️ Error during POST request check: {str(e)}")
+            self.logger.warning("⚠️ Error during POST request check: %s", e)
             return False
 
     async def _analyze_page_for_next_action(self, page: Page) -> Dict:
@@ -872,7 +1102,7 @@ Please answer in JSON format:
             client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
             response = client.chat.completions.create(
-                model="gpt-4",
+                model=self.ai_model,
                 messages=[
                     {
                         "role": "system",
@@ -885,11 +1115,11 @@ Please answer in JSON format:
             )
 
             content = response.choices[0].message.content
-            print(f"🤖 AI response: {content}")
+            self.logger.debug("🤖 AI response: %s", content)
             return content
 
         except Exception as e:
-            print(f"⚠️ OpenAI API call failed: {str(e)}")
+            self.logger.warning("⚠️ OpenAI API call failed: %s", e)
             return '{"success": false, "confidence": 0, "reason": "API call failed"}'
 
     def _parse_simple_completion_result(self, ai_response: str) -> Dict:
@@ -961,7 +1191,7 @@ Please answer in JSON format:
             }
 
         except Exception as e:
-            print(f"⚠️ Failed to parse simplified AI response: {str(e)}")
+            self.logger.warning("⚠️ Failed to parse simplified AI response: %s", e)
             return {
                 "success": False,
                 "confidence": 0,
@@ -991,7 +1221,7 @@ Please answer in JSON format:
             if any(
                 indicator in current_url.lower() for indicator in success_url_indicators
             ):
-                print(f"📝 URL-based success confirmed: {current_url}")
+                self.logger.debug("📝 URL-based success confirmed: %s", current_url)
                 return True
 
             # 2. Check by page title
@@ -1014,7 +1244,7 @@ Please answer in JSON format:
             if any(
                 indicator in title.lower() for indicator in success_title_indicators
             ):
-                print(f"📝 Title-based success confirmed: {title}")
+                self.logger.debug("📝 Title-based success confirmed: %s", title)
                 return True
 
             # 3. Check by page content
@@ -1041,7 +1271,7 @@ Please answer in JSON format:
             if any(
                 indicator in content_lower for indicator in success_content_indicators
             ):
-                print(f"📝 Content-based success confirmed")
+                self.logger.debug("📝 Content-based success confirmed")
                 return True
 
             # 4. Check specific elements
@@ -1066,8 +1296,10 @@ Please answer in JSON format:
                     if element and await element.is_visible():
                         element_text = await element.text_content()
                         if element_text:
-                            print(
-                                f"📝 Success confirmed by element: {selector} - {element_text}"
+                            self.logger.debug(
+                                "📝 Success confirmed by element: %s - %s",
+                                selector,
+                                element_text,
                             )
                             return True
                 except Exception:
@@ -1083,7 +1315,7 @@ Please answer in JSON format:
             ]
 
             if any(indicator in content_lower for indicator in resubscribe_indicators):
-                print(f"📝 Resubscribe button found - considered successful")
+                self.logger.debug("📝 Resubscribe button found - considered successful")
                 return True
 
             # 6. Check error messages
@@ -1101,24 +1333,25 @@ Please answer in JSON format:
             ]
 
             if any(indicator in content_lower for indicator in error_indicators):
-                print(f"📝 Error indicators found")
+                self.logger.debug("📝 Error indicators found")
                 return False
 
             # 7. Check AI-based analysis
             try:
                 ai_result = await self._analyze_unsubscribe_completion_with_ai(page)
                 if ai_result["success"] and ai_result["confidence"] >= 60:
-                    print(
-                        f"📝 Success confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
+                    self.logger.debug(
+                        "📝 Success confirmed by AI analysis (confidence: %s%%)",
+                        ai_result["confidence"],
                     )
                     return True
             except Exception as e:
-                print(f"⚠️ AI analysis failed: {str(e)}")
+                self.logger.warning("⚠️ AI analysis failed: %s", e)
 
             return False
 
         except Exception as e:
-            print(f"⚠️ Failed to check basic success indicators: {str(e)}")
+            self.logger.warning("⚠️ Failed to check basic success indicators: %s", e)
             return False
 
     async def _check_unsubscribe_success(self, page: Page) -> bool:
@@ -1129,52 +1362,23 @@ Please answer in JSON format:
             current_url = page.url
             title = await page.title()
 
-            # Basic keywords check (quick filtering)
-            basic_indicators = [
-                # Already unsubscribed indicators
-                "already unsubscribed",
-                "already cancelled",
-                "already removed",
-                "previously unsubscribed",
-                "previously cancelled",
-                "previously removed",
-                "already unsubscribed",
-                "already cancelled",
-                "already removed",
-                "already unsubscribed",
-                "already cancelled",
-                "already removed",
-                "already unsubscribed",
-                "already cancelled",
-                "already removed",
-                # Unsubscribe success indicators
-                "unsubscribe successful",
-                "successfully unsubscribed",
-                "unsubscribe completed",
-                "you have been unsubscribed",
-                "Unsubscribe completed",
-                "Unsubscribe success",
-                "Unsubscribe completed",
-                "Unsubscribe has been cancelled",
-                "Unsubscribe request completed",
-                "unsubscribe processed",
-            ]
-
-            # Check basic indicators in URL, title, and content
+            # Check basic indicators in URL, title, and content (quick filtering)
             all_text = f"{current_url} {title} {content_lower}"
 
-            for indicator in basic_indicators:
+            for indicator in UNSUBSCRIBE_SUCCESS_INDICATORS:
                 if indicator in all_text:
-                    print(f"📝 Unsubscribe success indicator found: {indicator}")
+                    self.logger.debug(
+                        "📝 Unsubscribe success indicator found: %s", indicator
+                    )
                     return True
 
             # AI-based analysis (if no basic keywords are present)
-            print(f"📝 Starting AI-based unsubscribe status analysis")
+            self.logger.debug("📝 Starting AI-based unsubscribe status analysis")
 
             # Extract text from page (remove HTML tags)
             from bs4 import BeautifulSoup
 
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, HTML_PARSER)
             page_text = soup.get_text(separator=" ", strip=True)
 
             # Create AI prompt
@@ -1217,27 +1421,27 @@ Answer:
             # AI API call
             try:
                 ai_response = await self._call_simple_ai_api(ai_prompt)
-                print(f"📝 AI response: {ai_response}")
+                self.logger.debug("📝 AI response: %s", ai_response)
 
                 if "ALREADY_UNSUBSCRIBED" in ai_response.upper():
-                    print(f"📝 AI determined already unsubscribed")
+                    self.logger.debug("📝 AI determined already unsubscribed")
                     return True
                 elif "SUCCESS" in ai_response.upper():
-                    print(f"📝 AI determined unsubscribe success")
+                    self.logger.debug("📝 AI determined unsubscribe success")
                     return True
                 elif "FAILED" in ai_response.upper():
-                    print(f"📝 AI determined unsubscribe failure")
+                    self.logger.debug("📝 AI determined unsubscribe failure")
                     return False
                 else:
-                    print(f"📝 AI unable to determine unsubscribe status")
+                    self.logger.debug("📝 AI unable to determine unsubscribe status")
                     return False
 
             except Exception as ai_error:
-                print(f"⚠️ AI analysis failed: {str(ai_error)}")
+                self.logger.warning("⚠️ AI analysis failed: %s", ai_error)
                 return False
 
         except Exception as e:
-            print(f"⚠️ Failed to check unsubscribe success: {str(e)}")
+            self.logger.warning("⚠️ Failed to check unsubscribe success: %s", e)
             return False
 
     async def _create_temp_page_from_response(
@@ -1261,7 +1465,7 @@ Answer:
             return temp_page
 
         except Exception as e:
-            print(f"⚠️ Failed to create temporary page: {str(e)}")
+            self.logger.warning("⚠️ Failed to create temporary page: %s", e)
             return None
 
     async def _parse_post_response(self, response) -> Optional[Page]:
@@ -1288,7 +1492,7 @@ Answer:
                 return await self._create_temp_page_from_response(response_text)
 
         except Exception as e:
-            print(f"⚠️ Failed to parse POST response: {str(e)}")
+            self.logger.warning("⚠️ Failed to parse POST response: %s", e)
             return None
 
     async def _check_response_with_temp_page(self, response) -> bool:
@@ -1303,12 +1507,54 @@ Answer:
             if temp_page:
                 await temp_page.close()
 
+    async def _wait_for_page_update(
+        self, page: Page, timeout: int, before_url: str = None
+    ):
+        """Wait up to timeout ms for the page to update instead of a fixed sleep
+
+        With before_url, waits for the URL to change and the new page to load;
+        otherwise waits for network idle after a navigation.
+        """
+        try:
+            if before_url is not None:
+                await page.wait_for_url(lambda url: url != before_url, timeout=timeout)
+                await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            else:
+                await page.wait_for_load_state("networkidle", timeout=timeout)
+        except Exception:
+            # Page updated in place (or is still loading): continue with what is there
+            pass
+
+    async def _wait_for_click_result(self, page: Page, before_url: str, timeout: int):
+        """Wait up to timeout ms for a click to navigate or for the network to idle
+
+        Returns on whichever happens first instead of a fixed post-click wait.
+        """
+        waits = [
+            asyncio.ensure_future(
+                page.wait_for_url(lambda url: url != before_url, timeout=timeout)
+            ),
+            asyncio.ensure_future(
+                page.wait_for_load_state("networkidle", timeout=timeout)
+            ),
+        ]
+        done, pending = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        # Timeouts are expected (slow page or in-place update): continue either way
+        await asyncio.gather(*waits, return_exceptions=True)
+        if page.url != before_url:
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            except Exception:
+                pass
+
     async def _detect_page_navigation(
         self, page: Page, before_url: str, before_title: str = None
     ) -> Dict:
         """Detect page navigation and handle it"""
         try:
-            await page.wait_for_timeout(2000)  # Page loading wait
+            await self._wait_for_page_update(page, 2000, before_url)
 
             after_url = page.url
             after_title = await page.title()
@@ -1318,7 +1564,9 @@ Answer:
             title_changed = before_title and before_title != after_title
 
             if url_changed:
-                print(f"📝 URL change detected: {before_url} → {after_url}")
+                self.logger.debug(
+                    "📝 URL change detected: %s → %s", before_url, after_url
+                )
 
                 # Check if unsubscribe is successful on new page
                 if await self._check_unsubscribe_success(page):
@@ -1339,7 +1587,9 @@ Answer:
                     }
 
             elif title_changed:
-                print(f"📝 Title change detected: {before_title} → {after_title}")
+                self.logger.debug(
+                    "📝 Title change detected: %s → %s", before_title, after_title
+                )
 
                 # Check if unsubscribe is successful after title change
                 if await self._check_unsubscribe_success(page):
@@ -1367,7 +1617,7 @@ Answer:
             }
 
         except Exception as e:
-            print(f"⚠️ Failed to detect page navigation: {str(e)}")
+            self.logger.warning("⚠️ Failed to detect page navigation: %s", e)
             return {
                 "success": False,
                 "message": f"Failed to detect page navigation: {str(e)}",
@@ -1381,7 +1631,7 @@ Answer:
         try:
             # Wait for network requests to complete
             await page.wait_for_load_state("networkidle", timeout=timeout)
-            print("📝 Network requests completed successfully")
+            self.logger.debug("📝 Network requests completed successfully")
 
             # Check if unsubscribe is successful
             if await self._check_unsubscribe_success(page):
@@ -1398,7 +1648,7 @@ Answer:
             }
 
         except Exception as e:
-            print(f"⚠️ Failed to wait for network idle: {str(e)}")
+            self.logger.warning("⚠️ Failed to wait for network idle: %s", e)
             # Fallback to default wait time if network idle fails
             await page.wait_for_timeout(3000)
 
@@ -1440,7 +1690,7 @@ Answer:
             for selector in captcha_selectors:
                 elements = await page.query_selector_all(selector)
                 if elements:
-                    print(f"📝 CAPTCHA detected: {selector}")
+                    self.logger.debug("📝 CAPTCHA detected: %s", selector)
                     return True
 
             # Check for text related to CAPTCHA
@@ -1461,13 +1711,13 @@ Answer:
 
             for keyword in captcha_keywords:
                 if keyword in content_lower:
-                    print(f"📝 CAPTCHA keyword detected: {keyword}")
+                    self.logger.debug("📝 CAPTCHA keyword detected: %s", keyword)
                     return True
 
             return False
 
         except Exception as e:
-            print(f"⚠️ Failed to detect CAPTCHA: {str(e)}")
+            self.logger.warning("⚠️ Failed to detect CAPTCHA: %s", e)
             return False
 
     async def _handle_captcha_required(self, page: Page) -> Dict:
@@ -1485,7 +1735,9 @@ Answer:
         """Handle email confirmation request"""
         try:
             if not user_email:
-                print("⚠️ No user email provided, unable to handle email confirmation")
+                self.logger.warning(
+                    "⚠️ No user email provided, unable to handle email confirmation"
+                )
                 return False
 
             # Detect email input fields
@@ -1494,13 +1746,13 @@ Answer:
             )
 
             if email_inputs:
-                print(f"📝 Found {len(email_inputs)} email input fields")
+                self.logger.debug("📝 Found %s email input fields", len(email_inputs))
 
                 for email_input in email_inputs:
                     try:
                         # Fill email input
                         await email_input.fill(user_email)
-                        print(f"📝 Email input filled: {user_email}")
+                        self.logger.debug("📝 Email input filled: %s", user_email)
 
                         # Find submit button
                         submit_selectors = [
@@ -1518,23 +1770,30 @@ Answer:
                             for submit_element in submit_elements:
                                 if await submit_element.is_visible():
                                     element_text = await submit_element.text_content()
-                                    print(f"📝 Submit button clicked: {element_text}")
+                                    self.logger.debug(
+                                        "📝 Submit button clicked: %s", element_text
+                                    )
 
                                     # Click submit button
+                                    before_url = page.url
                                     await submit_element.click()
 
                                     # Wait for page navigation or response
-                                    await page.wait_for_timeout(3000)
+                                    await self._wait_for_page_update(
+                                        page, 3000, before_url
+                                    )
 
                                     # Check if unsubscribe is successful
                                     if await self._check_unsubscribe_success(page):
-                                        print("✅ Email confirmation successful")
+                                        self.logger.info(
+                                            "✅ Email confirmation successful"
+                                        )
                                         return True
 
                                     break
 
                     except Exception as e:
-                        print(f"⚠️ Failed to handle email input: {str(e)}")
+                        self.logger.warning("⚠️ Failed to handle email input: %s", e)
                         continue
 
                 return False
@@ -1542,13 +1801,13 @@ Answer:
             return False
 
         except Exception as e:
-            print(f"⚠️ Failed to handle email confirmation: {str(e)}")
+            self.logger.warning("⚠️ Failed to handle email confirmation: %s", e)
             return False
 
     async def _execute_complex_javascript(self, page: Page) -> bool:
         """Execute complex JavaScript logic"""
         try:
-            print("📝 Executing complex JavaScript logic")
+            self.logger.debug("📝 Executing complex JavaScript logic")
 
             # Detect and execute JavaScript functions
             js_result = await page.evaluate(
@@ -1598,7 +1857,7 @@ Answer:
             )
 
             if js_result.get("success"):
-                print(f"📝 JavaScript execution successful: {js_result}")
+                self.logger.debug("📝 JavaScript execution successful: %s", js_result)
 
                 # Wait for asynchronous processing
                 await page.wait_for_timeout(5000)
@@ -1618,23 +1877,23 @@ Answer:
                     """,
                         timeout=10000,
                     )
-                    print("📝 Dynamic content loaded successfully")
+                    self.logger.debug("📝 Dynamic content loaded successfully")
                 except Exception as e:
-                    print(f"⚠️ Failed to wait for dynamic content: {str(e)}")
+                    self.logger.warning("⚠️ Failed to wait for dynamic content: %s", e)
 
                 return True
             else:
-                print(f"⚠️ Failed to execute JavaScript: {js_result}")
+                self.logger.warning("⚠️ Failed to execute JavaScript: %s", js_result)
                 return False
 
         except Exception as e:
-            print(f"⚠️ Failed to execute complex JavaScript: {str(e)}")
+            self.logger.warning("⚠️ Failed to execute complex JavaScript: %s", e)
             return False
 
     async def _wait_for_service_worker(self, page: Page) -> bool:
         """Wait for Service Worker registration (with timeout)"""
         try:
-            print("📝 Waiting for Service Worker registration")
+            self.logger.debug("📝 Waiting for Service Worker registration")
 
             # Check Service Worker registration (5-second timeout)
             sw_result = await page.evaluate(
@@ -1663,20 +1922,22 @@ Answer:
             )
 
             if sw_result.get("success"):
-                print("📝 Service Worker registration successful")
+                self.logger.debug("📝 Service Worker registration successful")
                 return True
             else:
-                print(f"⚠️ Failed to register Service Worker: {sw_result}")
+                self.logger.warning(
+                    "⚠️ Failed to register Service Worker: %s", sw_result
+                )
                 return False
 
         except Exception as e:
-            print(f"⚠️ Failed to wait for Service Worker: {str(e)}")
+            self.logger.warning("⚠️ Failed to wait for Service Worker: %s", e)
             return False
 
     async def _detect_spa_navigation(self, page: Page, before_url: str) -> bool:
         """Detect SPA navigation"""
         try:
-            print("📝 Detecting SPA navigation")
+            self.logger.debug("📝 Detecting SPA navigation")
 
             # Detect changes in History API
             navigation_result = await page.wait_for_function(
@@ -1693,13 +1954,15 @@ Answer:
 
             if navigation_result:
                 current_url = page.url
-                print(f"📝 SPA navigation detected: {before_url} → {current_url}")
+                self.logger.debug(
+                    "📝 SPA navigation detected: %s → %s", before_url, current_url
+                )
                 return True
 
             return False
 
         except Exception as e:
-            print(f"⚠️ Failed to detect SPA navigation: {str(e)}")
+            self.logger.warning("⚠️ Failed to detect SPA navigation: %s", e)
             return False
 
     async def _handle_multi_step_unsubscribe(
@@ -1707,11 +1970,11 @@ Answer:
     ) -> Dict:
         """Handle multi-step unsubscribe (prevent infinite loop)"""
         try:
-            print("📝 Starting multi-step unsubscribe process")
+            self.logger.debug("📝 Starting multi-step unsubscribe process")
             steps = []
 
             # 1st step: Direct unsubscribe attempt (prevent infinite loop)
-            print("📝 1st step: Direct unsubscribe attempt")
+            self.logger.debug("📝 1st step: Direct unsubscribe attempt")
 
             # Form submit attempt
             forms = await page.query_selector_all("form")
@@ -1719,7 +1982,9 @@ Answer:
                 try:
                     action = await form.get_attribute("action")
                     if action and "unsubscribe" in action.lower():
-                        print(f"📝 Executing multi-step form submit: {action}")
+                        self.logger.debug(
+                            "📝 Executing multi-step form submit: %s", action
+                        )
 
                         # Save current state before form submit
                         before_url = page.url
@@ -1734,11 +1999,13 @@ Answer:
                         )
                         if navigation_result["success"]:
                             steps.append("1st step completed (form submit)")
-                            print("✅ 1st step completed (form submit)")
+                            self.logger.info("✅ 1st step completed (form submit)")
                             break
 
                 except Exception as e:
-                    print(f"⚠️ Failed to execute multi-step form submit: {str(e)}")
+                    self.logger.warning(
+                        "⚠️ Failed to execute multi-step form submit: %s", e
+                    )
                     continue
 
             # If form submit failed, try button click
@@ -1764,8 +2031,10 @@ Answer:
                                 and await element.is_enabled()
                             ):
                                 element_text = await element.text_content()
-                                print(
-                                    f"📝 Clicking multi-step button: {selector} - '{element_text}'"
+                                self.logger.debug(
+                                    "📝 Clicking multi-step button: %s - '%s'",
+                                    selector,
+                                    element_text,
                                 )
 
                                 # Save current state before click
@@ -1783,11 +2052,15 @@ Answer:
                                 )
                                 if navigation_result["success"]:
                                     steps.append("1st step completed (button click)")
-                                    print("✅ 1st step completed (button click)")
+                                    self.logger.info(
+                                        "✅ 1st step completed (button click)"
+                                    )
                                     break
 
                     except Exception as e:
-                        print(f"⚠️ Failed to click multi-step button: {str(e)}")
+                        self.logger.warning(
+                            "⚠️ Failed to click multi-step button: %s", e
+                        )
                         continue
 
                     if steps:  # If successful, break out of loop
@@ -1795,13 +2068,13 @@ Answer:
 
             # 2nd step: Check completion of final page
             if steps:
-                print("📝 2nd step: Check completion of final page")
-                await page.wait_for_timeout(3000)  # Page loading wait
+                self.logger.debug("📝 2nd step: Check completion of final page")
+                await self._wait_for_page_update(page, 3000)
 
                 final_result = await self._check_unsubscribe_success(page)
                 if final_result:
                     steps.append("2nd step completed")
-                    print("✅ 2nd step completed")
+                    self.logger.info("✅ 2nd step completed")
                     return {
                         "success": True,
                         "message": "Multi-step unsubscribe completed",
@@ -1812,7 +2085,7 @@ Answer:
                     # Check basic success indicators
                     if await self._check_basic_success_indicators(page):
                         steps.append("2nd step completed (basic indicators)")
-                        print("✅ 2nd step completed (basic indicators)")
+                        self.logger.info("✅ 2nd step completed (basic indicators)")
                         return {
                             "success": True,
                             "message": "Multi-step unsubscribe completed (basic indicators)",
@@ -1839,7 +2112,7 @@ Answer:
     ) -> Dict:
         """Handle second page unsubscribe (integrated JavaScript-based)"""
         try:
-            print(f"📝 Handling second page unsubscribe started")
+            self.logger.debug("📝 Handling second page unsubscribe started")
 
             # Integrated JavaScript-based unsubscribe processing
             return await self._try_javascript_submit(
@@ -1855,7 +2128,7 @@ Answer:
     async def _try_form_action_submit(self, page: Page, user_email: str = None) -> Dict:
         """Submit form using Form Action URL"""
         try:
-            print(f"📝 Handling Form Action URL")
+            self.logger.debug("📝 Handling Form Action URL")
 
             # Find form elements
             forms = await page.query_selector_all("form")
@@ -1866,7 +2139,7 @@ Answer:
                     method = await form.get_attribute("method") or "GET"
 
                     if action and "unsubscribe" in action.lower():
-                        print(f"📝 Found unsubscribe form: {action}")
+                        self.logger.debug("📝 Found unsubscribe form: %s", action)
 
                         # Collect form data
                         form_data = {}
@@ -1880,12 +2153,14 @@ Answer:
                             if name and input_type != "submit":
                                 form_data[name] = value or ""
 
-                        print(f"📝 Form data: {form_data}")
+                        self.logger.debug("📝 Form data: %s", form_data)
 
                         # Execute POST request (improved version)
                         if method.upper() == "POST":
                             response = await page.request.post(action, data=form_data)
-                            print(f"📝 POST request completed: {response.status}")
+                            self.logger.debug(
+                                "📝 POST request completed: %s", response.status
+                            )
 
                             if response.status in [200, 201, 302]:
                                 # Parse response as temporary page
@@ -1913,7 +2188,7 @@ Answer:
                             )
 
                             await page.goto(full_url, wait_until="domcontentloaded")
-                            await page.wait_for_timeout(2000)
+                            await self._wait_for_page_update(page, 2000)
 
                             # Check if unsubscribe is successful
                             if await self._check_unsubscribe_success(page):
@@ -1931,7 +2206,7 @@ Answer:
                                 }
 
                 except Exception as e:
-                    print(f"⚠️ Error processing form: {str(e)}")
+                    self.logger.warning("⚠️ Error processing form: %s", e)
                     continue
 
             return {"success": False, "message": "Failed to handle Form Action URL"}
@@ -1947,7 +2222,7 @@ Answer:
     ) -> Dict:
         """Universal unsubscribe processing using Playwright + OpenAI API (all methods combined + improved functionality)"""
         try:
-            print(f"📝 Starting universal unsubscribe processing")
+            self.logger.debug("📝 Starting universal unsubscribe processing")
             self._log_memory_usage("javascript_submit_start")
 
             # 0th step: Detect and handle CAPTCHA
@@ -1972,16 +2247,18 @@ Answer:
             # 3rd step: Execute Form submit JavaScript
             self._log_memory_usage("form_submit_start")
             forms = await page.query_selector_all("form")
-            print(f"📝 Found {len(forms)} forms")
+            self.logger.debug("📝 Found %s forms", len(forms))
 
             for form in forms:
                 try:
                     action = await form.get_attribute("action")
-                    print(f"📝 Form action: {action}")
+                    self.logger.debug("📝 Form action: %s", action)
 
                     # If this is a React app, action might be missing
                     if action and "unsubscribe" in action.lower():
-                        print(f"📝 Executing JavaScript Form submit: {action}")
+                        self.logger.debug(
+                            "📝 Executing JavaScript Form submit: %s", action
+                        )
 
                         # Save current state before form submit
                         before_url = page.url
@@ -2014,7 +2291,7 @@ Answer:
                             return network_result
                     else:
                         # If this is a React app, handle button click inside form
-                        print(f"📝 Handling React app form")
+                        self.logger.debug("📝 Handling React app form")
                         buttons = await form.query_selector_all("button[type='submit']")
                         if buttons:
                             for button in buttons:
@@ -2023,8 +2300,8 @@ Answer:
                                     and await button.is_enabled()
                                 ):
                                     button_text = await button.text_content()
-                                    print(
-                                        f"📝 Found React form button: '{button_text}'"
+                                    self.logger.debug(
+                                        "📝 Found React form button: '%s'", button_text
                                     )
 
                                     # Save current state before click
@@ -2055,7 +2332,9 @@ Answer:
                                         return network_result
 
                 except Exception as e:
-                    print(f"⚠️ Failed to execute JavaScript Form submit: {str(e)}")
+                    self.logger.warning(
+                        "⚠️ Failed to execute JavaScript Form submit: %s", e
+                    )
                     continue
 
             # 4th step: Execute complex JavaScript logic
@@ -2101,128 +2380,126 @@ Answer:
                 # React-specific class names
                 "[class*='btn']",
                 "[class*='button']",
-                "[class*='submit']",
-                "[class*='unsubscribe']",
             ]
+            # One query for all selectors (document order, each element once)
+            unified_selector = ", ".join(enhanced_selectors)
 
-            # Wait for React app to load
+            # Wait once for any candidate to render (covers React apps mounting
+            # their buttons late; returns at once when candidates are already there)
             try:
-                await page.wait_for_function(
-                    """
-                    () => {
-                        // Check if React app is loaded
-                        const root = document.getElementById('root');
-                        if (!root) return false;
-                        
-                        // Check if buttons exist
-                        const buttons = root.querySelectorAll('button');
-                        return buttons.length > 0;
-                    }
-                """,
-                    timeout=10000,
+                await page.wait_for_selector(
+                    unified_selector, state="attached", timeout=10000
                 )
-                print("📝 React app loaded successfully")
+                self.logger.debug("📝 Candidate elements rendered")
             except Exception as e:
-                print(f"⚠️ Failed to wait for React app: {str(e)}")
+                self.logger.warning("⚠️ Failed to wait for candidate elements: %s", e)
 
-            for selector in enhanced_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    print(f"📝 Found {len(elements)} elements in selector '{selector}'")
+            elements = await page.query_selector_all(unified_selector)
+            self.logger.debug("📝 Found %s candidate elements", len(elements))
 
-                    for element in elements:
-                        is_visible = await element.is_visible()
-                        is_enabled = await element.is_enabled()
+            # Read visibility, enabled state and text of all candidates in one call
+            states = await page.evaluate(
+                """
+                (elements) => elements.map((e) => {
+                    const rect = e.getBoundingClientRect();
+                    return {
+                        visible: rect.width > 0 && rect.height > 0
+                            && getComputedStyle(e).visibility !== 'hidden',
+                        enabled: !e.disabled,
+                        text: e.textContent || '',
+                    };
+                })
+            """,
+                elements,
+            )
 
-                        if is_visible and is_enabled:
-                            element_text = await element.text_content()
-                            print(
-                                f"📝 Found element: {selector} - text: '{element_text}'"
-                            )
+            for element, state in zip(elements, states):
+                try:
+                    if state["visible"] and state["enabled"]:
+                        element_text = state["text"]
+                        self.logger.debug("📝 Found element - text: '%s'", element_text)
+
+                        # Check resubscribe button (should not be clicked!)
+                        resubscribe_keywords = [
+                            "resubscribe",
+                            "subscribe again",
+                            "re-subscribe",
+                            "subscribe again",
+                            "re-subscribe",
+                        ]
 
-                            # Check resubscribe button (should not be clicked!)
-                            resubscribe_keywords = [
-                                "resubscribe",
-                                "subscribe again",
-                                "re-subscribe",
-                                "subscribe again",
-                                "re-subscribe",
-                            ]
+                        is_resubscribe_button = any(
+                            keyword in element_text.lower()
+                            for keyword in resubscribe_keywords
+                        )
 
-                            is_resubscribe_button = any(
-                                keyword in element_text.lower()
-                                for keyword in resubscribe_keywords
+                        if is_resubscribe_button:
+                            self.logger.info(
+                                "🎉 Resubscribe button found - considered successful (no click)"
                             )
+                            return {
+                                "success": True,
+                                "message": "Resubscribe button found, confirming successful unsubscribe",
+                                "method": "resubscribe_button_detected",
+                                "button_text": element_text,
+                            }
 
-                            if is_resubscribe_button:
-                                print(
-                                    f"🎉 Resubscribe button found - considered successful (no click)"
-                                )
-                                return {
-                                    "success": True,
-                                    "message": "Resubscribe button found, confirming successful unsubscribe",
-                                    "method": "resubscribe_button_detected",
-                                    "button_text": element_text,
-                                }
+                        # Check unsubscribe-related keywords
+                        unsubscribe_keywords = [
+                            "unsubscribe",
+                            "opt-out",
+                            "remove",
+                            "cancel",
+                            "unsubscribe",
+                            "unsubscribe-button",
+                            "unsubscribe-link",
+                            "opt-out-link",
+                            "remove-link",
+                            "cancel-link",
+                        ]
 
-                            # Check unsubscribe-related keywords
-                            unsubscribe_keywords = [
-                                "unsubscribe",
-                                "opt-out",
-                                "remove",
-                                "cancel",
-                                "unsubscribe",
-                                "unsubscribe-button",
-                                "unsubscribe-link",
-                                "opt-out-link",
-                                "remove-link",
-                                "cancel-link",
-                            ]
+                        is_unsubscribe_button = any(
+                            keyword in element_text.lower()
+                            for keyword in unsubscribe_keywords
+                        )
 
-                            is_unsubscribe_button = any(
-                                keyword in element_text.lower()
-                                for keyword in unsubscribe_keywords
+                        if is_unsubscribe_button:
+                            self.logger.debug(
+                                "📝 Unsubscribe button found - text: '%s'", element_text
                             )
 
-                            if is_unsubscribe_button:
-                                print(
-                                    f"📝 Unsubscribe button found: {selector} - text: '{element_text}'"
-                                )
+                            # Save current state before click
+                            before_url = page.url
+                            before_title = await page.title()
 
-                                # Save current state before click
-                                before_url = page.url
-                                before_title = await page.title()
+                            # Execute click event using JavaScript
+                            await page.evaluate("(element) => element.click()", element)
 
-                                # Execute click event using JavaScript
-                                await page.evaluate(
-                                    "(element) => element.click()", element
-                                )
-
-                                # Detect SPA navigation
-                                if await self._detect_spa_navigation(page, before_url):
-                                    if await self._check_unsubscribe_success(page):
-                                        return {
-                                            "success": True,
-                                            "message": "Unsubscribe successful after SPA navigation",
-                                            "method": "spa_navigation_completed",
-                                        }
+                            # Detect SPA navigation
+                            if await self._detect_spa_navigation(page, before_url):
+                                if await self._check_unsubscribe_success(page):
+                                    return {
+                                        "success": True,
+                                        "message": "Unsubscribe successful after SPA navigation",
+                                        "method": "spa_navigation_completed",
+                                    }
 
-                                # Detect page navigation and handle it
-                                navigation_result = await self._detect_page_navigation(
-                                    page, before_url, before_title
-                                )
-                                if navigation_result["success"]:
-                                    return navigation_result
+                            # Detect page navigation and handle it
+                            navigation_result = await self._detect_page_navigation(
+                                page, before_url, before_title
+                            )
+                            if navigation_result["success"]:
+                                return navigation_result
 
-                                # Wait for network requests to complete and check
-                                network_result = (
-                                    await self._wait_for_network_idle_and_check(page)
-                                )
-                                if network_result["success"]:
-                                    return network_result
+                            # Wait for network requests to complete and check
+                            network_result = (
+                                await self._wait_for_network_idle_and_check(page)
+                            )
+                            if network_result["success"]:
+                                return network_result
 
                 except Exception as e:
-                    print(f"⚠️ Failed to handle JavaScript click: {str(e)}")
+                    self.logger.warning("⚠️ Failed to handle JavaScript click: %s", e)
                     continue
 
             # 6th step: Handle multi-step unsubscribe (recursive call prevention)
@@ -2252,7 +2529,7 @@ Answer:
     async def _try_enhanced_selectors(self, page: Page, user_email: str = None) -> Dict:
         """Handle enhanced selectors for unsubscribe"""
         try:
-            print(f"📝 Trying enhanced selectors")
+            self.logger.debug("📝 Trying enhanced selectors")
 
             # List of extended selectors
             enhanced_selectors = [
@@ -2310,8 +2587,10 @@ Answer:
 
                         if is_visible and is_enabled:
                             element_text = await element.text_content()
-                            print(
-                                f"📝 Found enhanced selector: {selector} - text: '{element_text}'"
+                            self.logger.debug(
+                                "📝 Found enhanced selector: %s - text: '%s'",
+                                selector,
+                                element_text,
                             )
 
                             # Check resubscribe button (should not be clicked!)
@@ -2329,8 +2608,8 @@ Answer:
                             )
 
                             if is_resubscribe_button:
-                                print(
-                                    f"🎉 Resubscribe button found - considered successful (no click)"
+                                self.logger.info(
+                                    "🎉 Resubscribe button found - considered successful (no click)"
                                 )
                                 return {
                                     "success": True,
@@ -2362,7 +2641,9 @@ Answer:
                                 keyword in selector.lower()
                                 for keyword in ["unsubscribe", "confirm", "submit"]
                             ):
-                                print(f"📝 Clicking enhanced selector: {element_text}")
+                                self.logger.debug(
+                                    "📝 Clicking enhanced selector: %s", element_text
+                                )
 
                                 # Save current URL before click
                                 before_url = page.url
@@ -2371,8 +2652,9 @@ Answer:
                                 try:
                                     await element.click(timeout=15000)
                                 except Exception as click_error:
-                                    print(
-                                        f"⚠️ Click failed, retrying with JavaScript: {str(click_error)}"
+                                    self.logger.warning(
+                                        "⚠️ Click failed, retrying with JavaScript: %s",
+                                        click_error,
                                     )
                                     await page.evaluate(
                                         "(element) => element.click()", element
@@ -2383,18 +2665,23 @@ Answer:
                                     await page.wait_for_load_state(
                                         "networkidle", timeout=10000
                                     )
-                                    print("📝 Network requests completed successfully")
+                                    self.logger.debug(
+                                        "📝 Network requests completed successfully"
+                                    )
                                 except Exception as e:
-                                    print(
-                                        f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
+                                    self.logger.warning(
+                                        "⚠️ Failed to wait for network idle, falling back to default wait: %s",
+                                        e,
                                     )
                                     await page.wait_for_timeout(5000)
 
                                 # Check URL change
                                 after_url = page.url
                                 if before_url != after_url:
-                                    print(
-                                        f"📝 URL change detected: {before_url} → {after_url}"
+                                    self.logger.debug(
+                                        "📝 URL change detected: %s → %s",
+                                        before_url,
+                                        after_url,
                                     )
 
                                 # Check if unsubscribe is successful
@@ -2415,7 +2702,9 @@ Answer:
                                     }
 
                 except Exception as e:
-                    print(f"⚠️ Failed to handle enhanced selector {selector}: {str(e)}")
+                    self.logger.warning(
+                        "⚠️ Failed to handle enhanced selector %s: %s", selector, e
+                    )
                     continue
 
             return {"success": False, "message": "Failed to handle enhanced selectors"}
@@ -2431,7 +2720,7 @@ Answer:
     ) -> Dict:
         """Handle link-based unsubscribe"""
         try:
-            print(f"📝 Starting link-based unsubscribe process")
+            self.logger.debug("📝 Starting link-based unsubscribe process")
 
             # Find all links
             links = await page.query_selector_all("a[href]")
@@ -2457,8 +2746,8 @@ Answer:
                     )
 
                     if is_resubscribe_link:
-                        print(
-                            f"🎉 Resubscribe link found - considered successful (no click)"
+                        self.logger.info(
+                            "🎉 Resubscribe link found - considered successful (no click)"
                         )
                         return {
                             "success": True,
@@ -2471,8 +2760,10 @@ Answer:
                         keyword in href.lower()
                         for keyword in ["unsubscribe", "opt-out", "remove", "cancel"]
                     ):
-                        print(
-                            f"📝 Unsubscribe link found: {href} - text: '{link_text}'"
+                        self.logger.debug(
+                            "📝 Unsubscribe link found: %s - text: '%s'",
+                            href,
+                            link_text,
                         )
 
                         # Click link
@@ -2481,12 +2772,13 @@ Answer:
                         # Wait for network requests to complete
                         try:
                             await page.wait_for_load_state("networkidle", timeout=10000)
-                            print(
+                            self.logger.debug(
                                 "📝 Link clicked, network requests completed successfully"
                             )
                         except Exception as e:
-                            print(
-                                f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
+                            self.logger.warning(
+                                "⚠️ Failed to wait for network idle, falling back to default wait: %s",
+                                e,
                             )
                             await page.wait_for_timeout(5000)
 
@@ -2508,7 +2800,7 @@ Answer:
                             }
 
                 except Exception as e:
-                    print(f"⚠️ Error processing link: {str(e)}")
+                    self.logger.warning("⚠️ Error processing link: %s", e)
                     continue
 
             return {
@@ -2525,9 +2817,24 @@ Answer:
     async def _analyze_page_with_ai(self, page: Page, user_email: str = None) -> Dict:
         """Analyze page using AI"""
         try:
+            # Success text that appeared during the earlier steps needs no AI call
+            if self._has_success_indicator(page.url, await page.content()):
+                return {"success": True, "message": "Unsubscribe completed."}
+
             # Extract page information
             page_info = await self._extract_page_info(page)
 
+            # Nothing the AI could tell us to click or submit
+            if not (
+                page_info.get("links")
+                or page_info.get("buttons")
+                or page_info.get("forms")
+            ):
+                return {
+                    "success": False,
+                    "message": "No links, buttons or forms for AI analysis",
+                }
+
             # Create AI prompt
             prompt = self._create_ai_prompt(page_info, user_email)
 
@@ -2600,7 +2907,7 @@ Answer:
             }
 
         except Exception as e:
-            print(f"⚠️ Failed to extract page information: {str(e)}")
+            self.logger.warning("⚠️ Failed to extract page information: %s", e)
             return {"error": str(e)}
 
     def _create_ai_prompt(self, page_info: Dict, user_email: str = None) -> str:
@@ -2621,13 +2928,15 @@ Available elements:
         if page_info.get("links"):
             prompt += "\nLinks:\n"
             for link in page_info["links"][:10]:  # Only first 10
-                prompt += f"- Text: '{link['text']}', href: '{link['href']}'\n"
+                prompt += (
+                    f"- Text: '{link['text'][:80]}', href: '{link['href'][:200]}'\n"
+                )
 
         # Add button information
         if page_info.get("buttons"):
             prompt += "\nButtons:\n"
             for button in page_info["buttons"][:10]:  # Only first 10
-                prompt += f"- Text: '{button['text']}', type: '{button['type']}'\n"
+                prompt += f"- Text: '{button['text'][:80]}', type: '{button['type']}'\n"
 
         prompt += """
 Please choose one of the following actions and execute it:
@@ -2652,7 +2961,7 @@ Response format:
             client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
             response = client.chat.completions.create(
-                model="gpt-4",
+                model=self.ai_model,
                 messages=[
                     {
                         "role": "system",
@@ -2660,22 +2969,23 @@ Response format:
                     },
                     {"role": "user", "content": prompt},
                 ],
-                max_tokens=500,
-                temperature=0.1,
+                # The answer is a three-field JSON object
+                max_tokens=100,
+                temperature=0,
+                response_format={"type": "json_object"},
             )
 
             content = response.choices[0].message.content
-            print(f"🤖 AI response: {content}")
+            self.logger.debug("🤖 AI response: %s", content)
 
-            # Try JSON parsing
             try:
                 return json.loads(content)
-            except:
-                # If not JSON, use default response
+            except json.JSONDecodeError as e:
+                self.logger.warning("⚠️ Failed to parse AI response: %s", e)
                 return {"action": "none", "reason": "Failed to parse AI response"}
 
         except Exception as e:
-            print(f"⚠️ Failed to call OpenAI API: {str(e)}")
+            self.logger.warning("⚠️ Failed to call OpenAI API: %s", e)
             return {"action": "none", "reason": f"OpenAI API error: {str(e)}"}
 
     async def _execute_ai_instructions(
@@ -2696,105 +3006,100 @@ Response format:
 
             elif action == "link_click":
                 # Handle link click
-                elements = await page.query_selector_all("a")
-                for element in elements:
+                # The browser matches the text (case-insensitive substring) and
+                # returns only the first link that contains it; has_text keeps
+                # non-ASCII targets intact, unlike a hand-built :has-text() selector
+                element = page.locator("a").filter(has_text=target).first
+                if await element.count():
                     element_text = await element.text_content()
-                    if target.lower() in element_text.lower():
-                        print(
-                            f"📝 Clicking link based on AI instructions: {element_text}"
-                        )
+                    self.logger.debug(
+                        "📝 Clicking link based on AI instructions: %s",
+                        element_text,
+                    )
 
-                        # Save current URL before click
-                        before_url = page.url
+                    # Save current URL before click
+                    before_url = page.url
 
-                        # Execute click
-                        await element.click()
+                    # Execute click
+                    await element.click()
 
-                        # Wait for network requests to complete
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=15000)
-                            print("📝 Network requests completed successfully")
-                        except Exception as e:
-                            print(
-                                f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
-                            )
-                            await page.wait_for_timeout(5000)
+                    # Continue as soon as the click navigates or settles
+                    await self._wait_for_click_result(page, before_url, 15000)
 
-                        # Check if unsubscribe is successful
-                        print("🤖 Starting AI-based unsubscribe completion analysis...")
-                        ai_result = await self._analyze_unsubscribe_completion_with_ai(
-                            page
-                        )
+                    # Check if unsubscribe is successful
+                    self.logger.debug(
+                        "🤖 Starting AI-based unsubscribe completion analysis..."
+                    )
+                    ai_result = await self._analyze_unsubscribe_completion_with_ai(page)
 
-                        if ai_result["success"] and ai_result["confidence"] >= 70:
-                            print(
-                                f"🤖 Unsubscribe confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
-                            )
-                            return {
-                                "success": True,
-                                "message": f"Unsubscribe successful via AI instructions (AI confidence: {ai_result['confidence']}%)",
-                                "ai_confidence": ai_result["confidence"],
-                                "ai_reason": ai_result["reason"],
-                            }
-                        else:
-                            print(
-                                f"🤖 AI analysis result: Unsubscribe not completed (confidence: {ai_result['confidence']}%)"
-                            )
-                            return {
-                                "success": True,
-                                "message": "Unsubscribe successful via AI instructions",
-                            }
+                    if ai_result["success"] and ai_result["confidence"] >= 70:
+                        self.logger.debug(
+                            "🤖 Unsubscribe confirmed by AI analysis (confidence: %s%%)",
+                            ai_result["confidence"],
+                        )
+                        return {
+                            "success": True,
+                            "message": f"Unsubscribe successful via AI instructions (AI confidence: {ai_result['confidence']}%)",
+                            "ai_confidence": ai_result["confidence"],
+                            "ai_reason": ai_result["reason"],
+                        }
+                    else:
+                        self.logger.debug(
+                            "🤖 AI analysis result: Unsubscribe not completed (confidence: %s%%)",
+                            ai_result["confidence"],
+                        )
+                        return {
+                            "success": True,
+                            "message": "Unsubscribe successful via AI instructions",
+                        }
 
             elif action == "button_click":
                 # Handle button click
-                elements = await page.query_selector_all("button")
-                for element in elements:
+                # The browser matches the text (case-insensitive substring) and
+                # returns only the first button that contains it
+                element = page.locator("button").filter(has_text=target).first
+                if await element.count():
                     element_text = await element.text_content()
-                    if target.lower() in element_text.lower():
-                        print(
-                            f"📝 Clicking button based on AI instructions: {element_text}"
-                        )
+                    self.logger.debug(
+                        "📝 Clicking button based on AI instructions: %s",
+                        element_text,
+                    )
 
-                        # Save current URL before click
-                        before_url = page.url
+                    # Save current URL before click
+                    before_url = page.url
 
-                        # Execute click
-                        await element.click()
+                    # Execute click
+                    await element.click()
 
-                        # Wait for network requests to complete
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                            print("📝 Network requests completed successfully")
-                        except Exception as e:
-                            print(
-                                f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
-                            )
-                            await page.wait_for_timeout(2000)
+                    # Continue as soon as the click navigates or settles
+                    await self._wait_for_click_result(page, before_url, 10000)
 
-                        # Check if unsubscribe is successful
-                        print("🤖 Starting AI-based unsubscribe completion analysis...")
-                        ai_result = await self._analyze_unsubscribe_completion_with_ai(
-                            page
-                        )
+                    # Check if unsubscribe is successful
+                    self.logger.debug(
+                        "🤖 Starting AI-based unsubscribe completion analysis..."
+                    )
+                    ai_result = await self._analyze_unsubscribe_completion_with_ai(page)
 
-                        if ai_result["success"] and ai_result["confidence"] >= 70:
-                            print(
-                                f"🤖 Unsubscribe confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
-                            )
-                            return {
-                                "success": True,
-                                "message": f"Unsubscribe successful via AI instructions (AI confidence: {ai_result['confidence']}%)",
-                                "ai_confidence": ai_result["confidence"],
-                                "ai_reason": ai_result["reason"],
-                            }
-                        else:
-                            print(
-                                f"🤖 AI analysis result: Unsubscribe not completed (confidence: {ai_result['confidence']}%)"
-                            )
-                            return {
-                                "success": True,
-                                "message": "Unsubscribe successful via AI instructions",
-                            }
+                    if ai_result["success"] and ai_result["confidence"] >= 70:
+                        self.logger.debug(
+                            "🤖 Unsubscribe confirmed by AI analysis (confidence: %s%%)",
+                            ai_result["confidence"],
+                        )
+                        return {
+                            "success": True,
+                            "message": f"Unsubscribe successful via AI instructions (AI confidence: {ai_result['confidence']}%)",
+                            "ai_confidence": ai_result["confidence"],
+                            "ai_reason": ai_result["reason"],
+                        }
+                    else:
+                        self.logger.debug(
+                            "🤖 AI analysis result: Unsubscribe not completed (confidence: %s%%)",
+                            ai_result["confidence"],
+                        )
+                        return {
+                            "success": True,
+                            "message": "Unsubscribe successful via AI instructions",
+                        }
 
             elif action == "form_submit":
                 # Handle form submission
@@ -2813,8 +3118,8 @@ Response format:
                     )
                     for button in submit_buttons:
                         button_text = await button.text_content()
-                        print(
-                            f"📝 Submitting form using AI instructions: {button_text}"
+                        self.logger.debug(
+                            "📝 Submitting form using AI instructions: %s", button_text
                         )
 
                         # Save current URL before submission
@@ -2823,25 +3128,21 @@ Response format:
                         # Submit form
                         await button.click()
 
-                        # Wait for network requests to complete
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                            print("📝 Network requests completed successfully")
-                        except Exception as e:
-                            print(
-                                f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
-                            )
-                            await page.wait_for_timeout(2000)
+                        # Continue as soon as the click navigates or settles
+                        await self._wait_for_click_result(page, before_url, 10000)
 
                         # Check if unsubscribe is successful
-                        print("🤖 Starting AI-based unsubscribe completion analysis...")
+                        self.logger.debug(
+                            "🤖 Starting AI-based unsubscribe completion analysis..."
+                        )
                         ai_result = await self._analyze_unsubscribe_completion_with_ai(
                             page
                         )
 
                         if ai_result["success"] and ai_result["confidence"] >= 70:
-                            print(
-                                f"🤖 Unsubscribe confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
+                            self.logger.debug(
+                                "🤖 Unsubscribe confirmed by AI analysis (confidence: %s%%)",
+                                ai_result["confidence"],
                             )
                             return {
                                 "success": True,
@@ -2850,8 +3151,9 @@ Response format:
                                 "ai_reason": ai_result["reason"],
                             }
                         else:
-                            print(
-                                f"🤖 AI analysis result: Unsubscribe not completed (confidence: {ai_result['confidence']}%)"
+                            self.logger.debug(
+                                "🤖 AI analysis result: Unsubscribe not completed (confidence: %s%%)",
+                                ai_result["confidence"],
                             )
                             return {
                                 "success": True,
@@ -2863,11 +3165,13 @@ Response format:
                 elements = await page.query_selector_all(
                     "button:has-text('확인'), button:has-text('Confirm')"
                 )
-                for element in elements:
-                    element_text = await element.text_content()
+                # All texts in one browser round-trip instead of one per element
+                texts = await page.evaluate(ELEMENT_TEXTS_SCRIPT, elements)
+                for element, element_text in zip(elements, texts):
                     if target.lower() in element_text.lower():
-                        print(
-                            f"📝 Clicking confirm button based on AI instructions: {element_text}"
+                        self.logger.debug(
+                            "📝 Clicking confirm button based on AI instructions: %s",
+                            element_text,
                         )
 
                         # Save current URL before click
@@ -2876,25 +3180,21 @@ Response format:
                         # Execute click
                         await element.click()
 
-                        # Wait for network requests to complete
-                        try:
-                            await page.wait_for_load_state("networkidle", timeout=10000)
-                            print("📝 Network requests completed successfully")
-                        except Exception as e:
-                            print(
-                                f"⚠️ Failed to wait for network idle, falling back to default wait: {str(e)}"
-                            )
-                            await page.wait_for_timeout(2000)
+                        # Continue as soon as the click navigates or settles
+                        await self._wait_for_click_result(page, before_url, 10000)
 
                         # Check if unsubscribe is successful
-                        print("🤖 Starting AI-based unsubscribe completion analysis...")
+                        self.logger.debug(
+                            "🤖 Starting AI-based unsubscribe completion analysis..."
+                        )
                         ai_result = await self._analyze_unsubscribe_completion_with_ai(
                             page
                         )
 
                         if ai_result["success"] and ai_result["confidence"] >= 70:
-                            print(
-                                f"🤖 Unsubscribe confirmed by AI analysis (confidence: {ai_result['confidence']}%)"
+                            self.logger.debug(
+                                "🤖 Unsubscribe confirmed by AI analysis (confidence: %s%%)",
+                                ai_result["confidence"],
                             )
                             return {
                                 "success": True,
@@ -2903,8 +3203,9 @@ Response format:
                                 "ai_reason": ai_result["reason"],
                             }
                         else:
-                            print(
-                                f"🤖 AI analysis result: Unsubscribe not completed (confidence: {ai_result['confidence']}%)"
+                            self.logger.debug(
+                                "🤖 AI analysis result: Unsubscribe not completed (confidence: %s%%)",
+                                ai_result["confidence"],
                             )
                             return {
                                 "success": True,
@@ -3058,7 +3359,9 @@ Response format:
         )
         self.logger = logging.getLogger(__name__)
 
-        # Add file logging
+        # Add file logging (once: every service instance shares this logger)
+        if any(isinstance(h, logging.FileHandler) for h in self.logger.handlers):
+            return
         if not os.path.exists("logs"):
             os.makedirs("logs")
         file_handler = logging.FileHandler("logs/playwright_unsubscribe_service.log")
@@ -3078,7 +3381,8 @@ Response format:
                 headless=True,
                 args=["--no-sandbox", "--disable-setuid-sandbox"],
             )
-            print("[INFO] Browser initialized.")
+            await self.context.route("**/*", block_unneeded_requests)
+            self.logger.info("[INFO] Browser initialized.")
 
     async def _close_browser(self):
         """Close browser instance"""
@@ -3088,7 +3392,7 @@ Response format:
         if self.browser:
             await self.browser.stop()
             self.browser = None
-        print("[INFO] Browser closed.")
+        self.logger.info("[INFO] Browser closed.")
 
     async def process_unsubscribe(self, url: str) -> dict:
         """Process unsubscribe using Playwright"""
@@ -3096,17 +3400,17 @@ Response format:
         page = await self.context.new_page()
         try:
             await page.goto(url)
-            print(f"[INFO] Navigated to {url}")
+            self.logger.info("[INFO] Navigated to %s", url)
             # ... existing code ...
         except Exception as e:
-            print(f"[ERROR] Unsubscribe process failed: {str(e)}")
+            self.logger.error("[ERROR] Unsubscribe process failed: %s", e)
             return {
                 "success": False,
                 "message": f"Unsubscribe process failed: {str(e)}",
             }
         finally:
             await page.close()
-            print("[INFO] Page closed.")
+            self.logger.info("[INFO] Page closed.")
 
     async def extract_unsubscribe_links_with_ai_fallback(
         self, email_content: str, email_headers: Dict = None, user_email: str = None
@@ -3119,18 +3423,20 @@ Response format:
             email_content, email_headers, user_email
         )
         # 3. 두 결과를 합치고, 중복 제거
-        all_links = list({*links, *ai_links})
+        all_links = list(dict.fromkeys([*links, *ai_links]))
         if all_links:
-            print(f"📝 [COMBINED] Unsubscribe links (rule+AI): {all_links}")
+            self.logger.debug(
+                "📝 [COMBINED] Unsubscribe links (rule+AI): %s", all_links
+            )
             return all_links
-        print(
+        self.logger.debug(
             "🤖 No unsubscribe links found by keyword or AI-based context analysis..."
         )
         # 4. Playwright 브라우저/컨텍스트 초기화 (기존 AI fallback)
         await self.initialize_browser()
         temp_page = await self._create_temp_page_from_response(email_content)
         if not temp_page:
-            print("❌ Failed to create temp page for AI analysis.")
+            self.logger.error("❌ Failed to create temp page for AI analysis.")
             return []
         try:
             ai_result = await self._analyze_page_with_ai(temp_page, user_email)
@@ -3141,7 +3447,10 @@ Response format:
                 if target:
                     from bs4 import BeautifulSoup
 
-                    soup = BeautifulSoup(email_content, "html.parser")
+                    # Only anchor text is read here, so only <a> tags are built
+                    soup = BeautifulSoup(
+                        email_content, HTML_PARSER, parse_only=SoupStrainer("a")
+                    )
                     for link in soup.find_all("a", href=True):
                         if target.lower() in link.get_text().lower():
                             return [link["href"]]
@@ -3155,7 +3464,7 @@ Response format:
         """Use AI to judge whether each anchor tag is an unsubscribe link."""
         from bs4 import BeautifulSoup
 
-        soup = BeautifulSoup(email_content, "html.parser")
+        soup = BeautifulSoup(email_content, HTML_PARSER)
         candidates = []
         for link in soup.find_all("a", href=True):
             link_text = link.get_text().strip()
@@ -3197,8 +3506,10 @@ Response format:
             links = [item["href"] for item in result if item.get("is_unsubscribe")]
             return links
         except Exception as e:
-            print(
-                f"⚠️ Failed to parse AI link judgement response: {str(e)} | Raw: {ai_response}"
+            self.logger.warning(
+                "⚠️ Failed to parse AI link judgement response: %s | Raw: %s",
+                e,
+                ai_response,
             )
             return []
 
@@ -3217,6 +3528,14 @@ def process_unsubscribe_sync(unsubscribe_url: str, user_email: str = None) -> Di
             "process_unsubscribe_sync cannot be called from a running event loop. Use this only in synchronous environments like Flask. In async environments, directly await service.process_unsubscribe_with_playwright_ai(...)."
         )
     else:
-        return asyncio.run(
-            service.process_unsubscribe_with_playwright_ai(unsubscribe_url, user_email)
-        )
+
+        async def run():
+            # The browser belongs to this event loop, so close it before the loop ends
+            try:
+                return await service.process_unsubscribe_with_playwright_ai(
+                    unsubscribe_url, user_email
+                )
+            finally:
+                await service.cleanup_browser()
+
+        return asyncio.run(run())
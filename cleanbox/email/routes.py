@@ -1,7 +1,11 @@
 # Standard library imports
+import hashlib
+import json
 import os
-import traceback
+import time
 import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import asyncio
 
@@ -15,17 +19,23 @@ from flask import (
     redirect,
     url_for,
     session,
+    make_response,
+    current_app,
+    g,
 )
 from flask_login import login_required, current_user
 from flask_apscheduler import APScheduler
+from sqlalchemy import tuple_, update
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 # Local imports
-from ..models import Email, Category, UserAccount, WebhookStatus, db
+from ..models import Email, Category, UserAccount, UserToken, WebhookStatus, db
 from .. import cache
 from .gmail_service import GmailService
-from .ai_classifier import AIClassifier
+from .ai_classifier import AIClassifier, get_classifier
 from ..auth.routes import (
     check_and_refresh_token,
+    get_active_accounts,
     get_current_account_id,
     grant_service_account_pubsub_permissions,
 )
@@ -34,6 +44,32 @@ logger = logging.getLogger(__name__)
 
 email_bp = Blueprint("email", __name__)
 
+# Emails per page of the email list
+EMAILS_PER_PAGE = 100
+
+# Upper bound on a process_new_emails run; its lock expires after this even if
+# the worker died mid-run
+PROCESS_NEW_EMAILS_LOCK_TIMEOUT = 300
+
+# Accounts unsubscribed in parallel by bulk unsubscribe (each runs its own browser)
+BULK_UNSUBSCRIBE_WORKERS = 2
+
+# Email columns the list and category templates render (skips content, recipients,
+# unsubscribe_links and the other wide columns)
+EMAIL_LIST_COLUMNS = (
+    Email.id,
+    Email.account_id,
+    Email.category_id,
+    Email.subject,
+    Email.sender,
+    Email.summary,
+    Email.is_read,
+    Email.is_archived,
+    Email.is_unsubscribed,
+    Email.received_at,
+    Email.created_at,
+)
+
 
 # Lazy imports to avoid circular import issues
 def get_scheduler():
@@ -50,6 +86,100 @@ def get_scheduled_webhook_monitoring():
     return scheduled_webhook_monitoring
 
 
+def get_account_stats(user_id, accounts, category_id=None, account_ids=None):
+    """Per-account email counts computed with a single grouped query"""
+    if account_ids is None:
+        account_ids = [account.id for account in accounts]
+
+    query = db.session.query(
+        Email.account_id,
+        db.func.count(Email.id).label("count"),
+        db.func.sum(db.case((Email.is_read.is_(False), 1), else_=0)).label("unread"),
+        db.func.sum(db.case((Email.is_archived.is_(True), 1), else_=0)).label(
+            "archived"
+        ),
+        db.func.sum(db.case((Email.summary.isnot(None), 1), else_=0)).label("analyzed"),
+        db.func.max(Email.updated_at).label("last_updated"),
+    ).filter(
+        Email.user_id == user_id,
+        Email.account_id.in_(account_ids),
+    )
+    if category_id is not None:
+        query = query.filter(Email.category_id == category_id)
+
+    rows = {row.account_id: row for row in query.group_by(Email.account_id).all()}
+
+    account_stats = {}
+    for account in accounts:
+        row = rows.get(account.id)
+        account_stats[account.id] = {
+            "email": account.account_email,
+            "name": account.account_name,
+            "count": row.count if row else 0,
+            "unread": (row.unread or 0) if row else 0,
+            "archived": (row.archived or 0) if row else 0,
+            "analyzed": (row.analyzed or 0) if row else 0,
+            "last_updated": row.last_updated if row else None,
+        }
+
+    return account_stats
+
+
+def _email_query(*options):
+    """Email query with the given loader options
+
+    With RAISELOAD_ENABLED (tests, or CLEANBOX_RAISELOAD=true in development),
+    any relationship not eager-loaded raises instead of lazy loading per row.
+    """
+    if current_app.config.get("RAISELOAD_ENABLED"):
+        options = (*options, raiseload("*"))
+    return Email.query.options(*options)
+
+
+def _parse_before_cursor():
+    """Keyset pagination cursor: (created_at, id) of the last email shown
+
+    id is None for links made before the id was part of the cursor.
+    """
+    try:
+        if request.args.get("before"):
+            return (
+                datetime.fromisoformat(request.args["before"]),
+                request.args.get("before_id", type=int),
+            )
+    except ValueError:
+        pass
+    return None
+
+
+def _filter_before(email_query, before):
+    """Emails after the cursor in (created_at desc, id desc) order
+
+    The id breaks created_at ties, so emails saved in the same instant are
+    not skipped at a page boundary.
+    """
+    before_created_at, before_id = before
+    if before_id is None:
+        return email_query.filter(Email.created_at < before_created_at)
+    return email_query.filter(
+        tuple_(Email.created_at, Email.id) < (before_created_at, before_id)
+    )
+
+
+def _next_page_cursor(emails):
+    """URL arguments of the next page's cursor, or None on the last page"""
+    if len(emails) < EMAILS_PER_PAGE:
+        return None
+    return {"before": emails[-1].created_at.isoformat(), "before_id": emails[-1].id}
+
+
+def _email_list_cache_key(user_id, before, account_stats):
+    """Page cache key that changes whenever any listed email is added, changed or removed"""
+    fingerprint = repr((before, sorted(account_stats.items())))
+    digest = hashlib.md5(fingerprint.encode()).hexdigest()
+    return f"email_list_{user_id}_{_email_cache_version(user_id)}_{digest}"
+
+
 @email_bp.route("/")
 @login_required
 def list_emails():
@@ -80,9 +210,7 @@ def list_emails():
                 print(f"Notification file handling failed: {str(e)}")
 
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             flash("No connected accounts.", "error")
@@ -108,66 +236,68 @@ def list_emails():
             except Exception as e:
                 print(f"Token check failed: {str(e)}")
 
-        # Query emails for all accounts (sorted by creation time desc)
-        emails = (
-            Email.query.filter(
-                Email.user_id == current_user.id,
-                Email.account_id.in_([acc.id for acc in accounts]),
-            )
-            .order_by(Email.created_at.desc())
-            .limit(100)
-            .all()
-        )
+        account_ids = [acc.id for acc in accounts]
 
-        # Add account info to emails
-        account_dict = {acc.id: acc for acc in accounts}
-        for email in emails:
-            email.account_info = account_dict.get(email.account_id)
+        before = _parse_before_cursor()
 
         # Calculate email count per account
-        account_stats = {}
-        for account in accounts:
-            account_emails = Email.query.filter_by(
-                user_id=current_user.id, account_id=account.id
-            ).count()
-            account_unread = Email.query.filter_by(
-                user_id=current_user.id, account_id=account.id, is_read=False
-            ).count()
-            account_archived = Email.query.filter_by(
-                user_id=current_user.id, account_id=account.id, is_archived=True
-            ).count()
-            account_analyzed = (
-                Email.query.filter_by(user_id=current_user.id, account_id=account.id)
-                .filter(Email.summary.isnot(None))
-                .count()
-            )
+        account_stats = get_account_stats(
+            current_user.id, accounts, account_ids=account_ids
+        )
 
-            account_stats[account.id] = {
-                "email": account.account_email,
-                "name": account.account_name,
-                "count": account_emails,
-                "unread": account_unread,
-                "archived": account_archived,
-                "analyzed": account_analyzed,
-            }
+        # Serve the rendered page from cache while nothing listed has changed
+        # (pages carrying flash messages or notifications are never cached)
+        page_cache_key = None
+        if not new_emails_notification and "_flashes" not in session:
+            page_cache_key = _email_list_cache_key(
+                current_user.id, before, account_stats
+            )
+            cached_page = cache.get(page_cache_key)
+            if cached_page is not None:
+                return cached_page
+
+        # Query emails for all accounts (sorted by creation time desc), batch-loading
+        # the account and category each row renders
+        email_query = _email_query(
+            load_only(*EMAIL_LIST_COLUMNS),
+            selectinload(Email.account).load_only(UserAccount.account_email),
+            selectinload(Email.category).load_only(
+                Category.name, Category.color, Category.icon
+            ),
+        ).filter(
+            Email.user_id == current_user.id,
+            Email.account_id.in_(account_ids),
+        )
+        if before:
+            email_query = _filter_before(email_query, before)
+        emails = (
+            email_query.order_by(Email.created_at.desc(), Email.id.desc())
+            .limit(EMAILS_PER_PAGE)
+            .all()
+        )
+        next_before = _next_page_cursor(emails)
 
-        # Stats info
+        # Mailbox-wide totals, summed from the grouped per-account query
         stats = {
-            "total": len(emails),
-            "unread": sum(1 for e in emails if not e.is_read),
-            "archived": sum(1 for e in emails if e.is_archived),
-            "analyzed": sum(1 for e in emails if e.summary),
+            "total": sum(acc["count"] for acc in account_stats.values()),
+            "unread": sum(acc["unread"] for acc in account_stats.values()),
+            "archived": sum(acc["archived"] for acc in account_stats.values()),
+            "analyzed": sum(acc["analyzed"] for acc in account_stats.values()),
             "account_stats": account_stats,
         }
 
-        return render_template(
+        page = render_template(
             "email/list.html",
             user=current_user,
             emails=emails,
             stats=stats,
             accounts=accounts,
             new_emails_notification=new_emails_notification,
+            next_before=next_before,
         )
+        if page_cache_key:
+            cache.set(page_cache_key, page, timeout=300)
+        return page
 
     except Exception as e:
         flash(f"Error loading email list: {str(e)}", "error")
@@ -190,35 +320,33 @@ def category_emails(category_id):
             return redirect(url_for("email.list_emails"))
 
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
-
-        # Query emails for the category from all accounts
+        accounts = get_active_accounts(current_user.id)
+        account_ids = [acc.id for acc in accounts]
+
+        # Query one page of the category's emails from all accounts, batch-loading
+        # each row's account
+        email_query = _email_query(
+            load_only(*EMAIL_LIST_COLUMNS),
+            selectinload(Email.account).load_only(UserAccount.account_email),
+        ).filter(
+            Email.user_id == current_user.id,
+            Email.category_id == category_id,
+            Email.account_id.in_(account_ids),
+        )
+        before = _parse_before_cursor()
+        if before:
+            email_query = _filter_before(email_query, before)
         emails = (
-            Email.query.filter(
-                Email.user_id == current_user.id,
-                Email.category_id == category_id,
-                Email.account_id.in_([acc.id for acc in accounts]),
-            )
-            .order_by(Email.created_at.desc())
+            email_query.order_by(Email.created_at.desc(), Email.id.desc())
+            .limit(EMAILS_PER_PAGE)
             .all()
         )
-
-        # Add account info to emails
-        account_dict = {acc.id: acc for acc in accounts}
-        for email in emails:
-            email.account_info = account_dict.get(email.account_id)
+        next_before = _next_page_cursor(emails)
 
         # Calculate email count per account
-        account_stats = {}
-        for account in accounts:
-            account_emails = [e for e in emails if e.account_id == account.id]
-            account_stats[account.id] = {
-                "email": account.account_email,
-                "name": account.account_name,
-                "count": len(account_emails),
-            }
+        account_stats = get_account_stats(
+            current_user.id, accounts, category_id, account_ids=account_ids
+        )
 
         return render_template(
             "email/category.html",
@@ -227,6 +355,7 @@ def category_emails(category_id):
             emails=emails,
             accounts=accounts,
             account_stats=account_stats,
+            next_before=next_before,
         )
 
     except Exception as e:
@@ -234,109 +363,134 @@ def category_emails(category_id):
         return redirect(url_for("email.list_emails"))
 
 
-@email_bp.route("/process-new", methods=["POST"])
-@login_required
-def process_new_emails():
-    """Process new emails"""
-    try:
-        # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+# Category fields shown in menus and sent to the AI classifier
+ActiveCategory = namedtuple("ActiveCategory", "id name description color icon")
 
-        if not accounts:
-            return jsonify({"success": False, "message": "No connected accounts."})
+# Per-account outcome of process_new_emails
+AccountSyncResult = namedtuple(
+    "AccountSyncResult", "account status processed classified error"
+)
 
-        total_processed = 0
-        total_classified = 0
-        account_results = []
-        new_emails_processed = False  # Whether new emails were processed
 
-        for account in accounts:
-            try:
-                print(f"🔍 Processing new emails for account {account.account_email}")
-                gmail_service = GmailService(current_user.id, account.id)
+def _process_new_emails_for_account(
+    app, user_id, account_id, account_email, categories
+):
+    """Fetch, save and classify new emails of one account (runs in a worker thread)
 
-                # Get new emails
-                new_emails = gmail_service.get_new_emails()
-                print(
-                    f"📧 Found {len(new_emails)} new emails in account {account.account_email}"
-                )
+    categories are the user's AI category dicts, fetched once for all accounts.
+    """
+    with app.app_context():
+        try:
+            logger.debug(f"🔍 Processing new emails for account {account_email}")
+            gmail_service = GmailService(user_id, account_id)
 
-                if not new_emails:
-                    account_results.append(
-                        {
-                            "account": account.account_email,
-                            "status": "no_new_emails",
-                            "processed": 0,
-                            "classified": 0,
-                        }
+            # Get new emails
+            new_emails = gmail_service.get_new_emails()
+            logger.info(
+                f"📧 Found {len(new_emails)} new emails in account {account_email}"
+            )
+
+            if not new_emails:
+                return AccountSyncResult(account_email, "no_new_emails", 0, 0, None)
+
+            # Save emails to DB (committed once per account below); already
+            # saved ids are fetched in one query instead of one per email
+            existing_ids = gmail_service.get_existing_gmail_ids(
+                [email_data["gmail_id"] for email_data in new_emails]
+            )
+            saved_emails = []
+            for email_data in new_emails:
+                if email_data["gmail_id"] in existing_ids:
+                    continue
+                try:
+                    saved_emails.append(
+                        gmail_service.save_email_to_db(
+                            email_data, commit=False, check_existing=False
+                        )
                     )
+                    existing_ids.add(email_data["gmail_id"])
+                except Exception as e:
+                    logger.error(f"❌ Failed to process email: {str(e)}")
                     continue
+            processed_count = len(saved_emails)
 
-                # Process new emails
-                processed_count = 0
-                classified_count = 0
+            # AI classification of all saved emails with concurrent API calls
+            ai_results = get_classifier().classify_and_summarize_emails(
+                [
+                    {
+                        "content": email_obj.content,
+                        "subject": email_obj.subject,
+                        "sender": email_obj.sender,
+                    }
+                    for email_obj in saved_emails
+                ],
+                categories,
+            )
 
-                for email_data in new_emails:
-                    try:
-                        # Save email to DB
-                        email_obj = gmail_service.save_email_to_db(email_data)
-                        processed_count += 1
+            classified_count = 0
+            for email_obj, (category_id, summary) in zip(saved_emails, ai_results):
+                if category_id:
+                    # Update category
+                    email_obj.category_id = category_id
+                    email_obj.updated_at = datetime.utcnow()
+                    classified_count += 1
 
-                        # AI classification
-                        ai_classifier = AIClassifier()
-                        categories = ai_classifier.get_user_categories_for_ai(
-                            current_user.id
-                        )
-                        category_id, summary = (
-                            ai_classifier.classify_and_summarize_email(
-                                email_obj.content,
-                                email_obj.subject,
-                                email_obj.sender,
-                                categories,
-                            )
-                        )
+            # Single commit for all emails of this account
+            db.session.commit()
 
-                        if category_id:
-                            # Update category
-                            gmail_service.update_email_category(
-                                email_obj.gmail_id, category_id
-                            )
-                            classified_count += 1
+            logger.info(
+                f"✅ Finished processing account {account_email} - Processed: {processed_count}, Classified: {classified_count}"
+            )
 
-                    except Exception as e:
-                        print(f"❌ Failed to process email: {str(e)}")
-                        continue
+            return AccountSyncResult(
+                account_email, "success", processed_count, classified_count, None
+            )
 
-                total_processed += processed_count
-                total_classified += classified_count
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"❌ Failed to process account {account_email}: {str(e)}")
+            return AccountSyncResult(account_email, "error", 0, 0, str(e))
 
-                if processed_count > 0:
-                    new_emails_processed = True
 
-                account_results.append(
-                    {
-                        "account": account.account_email,
-                        "status": "success",
-                        "processed": processed_count,
-                        "classified": classified_count,
-                    }
-                )
+@email_bp.route("/process-new", methods=["POST"])
+@login_required
+def process_new_emails():
+    """Process new emails"""
+    # A second submit (double click) while this user's run is still going is
+    # dropped instead of fetching and classifying the same emails again
+    lock_key = f"process_new_emails_lock_{current_user.id}"
+    if not cache.add(lock_key, True, timeout=PROCESS_NEW_EMAILS_LOCK_TIMEOUT):
+        flash("New email processing is already in progress.", "info")
+        return redirect(url_for("email.list_emails"))
 
-                print(
-                    f"✅ Finished processing account {account.account_email} - Processed: {processed_count}, Classified: {classified_count}"
-                )
+    try:
+        # Get all active accounts
+        accounts = get_active_accounts(current_user.id)
 
-            except Exception as e:
-                print(f"❌ Failed to process account {account.account_email}: {str(e)}")
-                account_results.append(
-                    {
-                        "account": account.account_email,
-                        "status": "error",
-                        "error": str(e),
-                    }
+        if not accounts:
+            return jsonify({"success": False, "message": "No connected accounts."})
+
+        # Categories are user-scoped, so fetch them once for all accounts
+        categories = get_classifier().get_user_categories_for_ai(current_user.id)
+
+        # Accounts are independent and Gmail-bound, so process them in parallel
+        app = current_app._get_current_object()
+        with ThreadPoolExecutor(max_workers=min(8, len(accounts))) as executor:
+            futures = [
+                executor.submit(
+                    _process_new_emails_for_account,
+                    app,
+                    current_user.id,
+                    account.id,
+                    account.account_email,
+                    categories,
                 )
+                for account in accounts
+            ]
+            account_results = [future.result() for future in futures]
+
+        total_processed = sum(result.processed for result in account_results)
+        total_classified = sum(result.classified for result in account_results)
 
         # Return result
         if total_processed == 0:
@@ -346,7 +500,8 @@ def process_new_emails():
         # Invalidate cache (recalculate max email id since new emails were processed)
         cache_key = f"max_email_id_{current_user.id}"
         cache.delete(cache_key)
-        print(f"✅ Cache invalidated: {cache_key}")
+        invalidate_email_caches(current_user.id)
+        logger.debug("✅ Cache invalidated: %s", cache_key)
 
         # Create success message
         success_message = f"New email processing complete: {total_processed} processed, {total_classified} AI classified"
@@ -354,41 +509,69 @@ def process_new_emails():
         if account_results and len(account_results) > 0:
             success_message += "\n\nResults by account:"
             for result in account_results:
-                if result["status"] == "success":
-                    success_message += f"\n• {result['account']}: {result['processed']} processed, {result['classified']} classified"
-                elif result["status"] == "no_new_emails":
-                    success_message += f"\n• {result['account']}: No new emails"
+                if result.status == "success":
+                    success_message += f"\n• {result.account}: {result.processed} processed, {result.classified} classified"
+                elif result.status == "no_new_emails":
+                    success_message += f"\n• {result.account}: No new emails"
                 else:
-                    success_message += (
-                        f"\n• {result['account']}: Error - {result['error']}"
-                    )
+                    success_message += f"\n• {result.account}: Error - {result.error}"
 
         flash(success_message, "success")
         return redirect(url_for("email.list_emails"))
 
     except Exception as e:
-        print(f"❌ Error processing new emails: {str(e)}")
+        logger.error("❌ Error processing new emails: %s", e)
         flash(f"Error occurred while processing new emails: {str(e)}", "error")
         return redirect(url_for("email.list_emails"))
 
+    finally:
+        cache.delete(lock_key)
+
+
+def _wants_json():
+    """Whether the caller (fetch from the list pages) asked for a JSON response"""
+    return request.accept_mimetypes.best == "application/json"
+
 
 @email_bp.route("/<int:email_id>/read")
 @login_required
 def mark_as_read(email_id):
     """Mark email as read"""
     try:
-        email_obj = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
-        if not email_obj:
+        # Update the row and get its Gmail id/account in one statement
+        user_id = current_user.id
+        email_row = db.session.execute(
+            update(Email)
+            .where(Email.id == email_id, Email.user_id == user_id)
+            .values(is_read=True, updated_at=datetime.utcnow())
+            .returning(Email.gmail_id, Email.account_id)
+        ).first()
+        if not email_row:
+            db.session.rollback()
+            if _wants_json():
+                return jsonify({"success": False, "message": "Email not found."})
             flash("Email not found.", "error")
             return redirect(url_for("email.list_emails"))
 
-        gmail_service = GmailService(current_user.id)
-        gmail_service.mark_as_read(email_obj.gmail_id)
+        gmail_service = GmailService(user_id, email_row.account_id)
+        gmail_service.mark_as_read(email_row.gmail_id, update_db=False)
+        db.session.commit()
+        invalidate_email_caches(user_id)
 
+        if _wants_json():
+            return jsonify({"success": True, "email_id": email_id})
         flash("Marked as read.", "success")
         return redirect(url_for("email.list_emails"))
 
     except Exception as e:
+        db.session.rollback()
+        if _wants_json():
+            return jsonify(
+                {
+                    "success": False,
+                    "message": f"Error occurred while changing email status: {str(e)}",
+                }
+            )
         flash(f"Error occurred while changing email status: {str(e)}", "error")
         return redirect(url_for("email.list_emails"))
 
@@ -398,18 +581,40 @@ def mark_as_read(email_id):
 def archive_email(email_id):
     """Archive email"""
     try:
-        email_obj = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
-        if not email_obj:
+        # Update the row and get its Gmail id/account in one statement
+        user_id = current_user.id
+        email_row = db.session.execute(
+            update(Email)
+            .where(Email.id == email_id, Email.user_id == user_id)
+            .values(is_archived=True, updated_at=datetime.utcnow())
+            .returning(Email.gmail_id, Email.account_id)
+        ).first()
+        if not email_row:
+            db.session.rollback()
+            if _wants_json():
+                return jsonify({"success": False, "message": "Email not found."})
             flash("Email not found.", "error")
             return redirect(url_for("email.list_emails"))
 
-        gmail_service = GmailService(current_user.id)
-        gmail_service.archive_email(email_obj.gmail_id)
+        gmail_service = GmailService(user_id, email_row.account_id)
+        gmail_service.archive_email(email_row.gmail_id, update_db=False)
+        db.session.commit()
+        invalidate_email_caches(user_id)
 
+        if _wants_json():
+            return jsonify({"success": True, "email_id": email_id})
         flash("Email archived.", "success")
         return redirect(url_for("email.list_emails"))
 
     except Exception as e:
+        db.session.rollback()
+        if _wants_json():
+            return jsonify(
+                {
+                    "success": False,
+                    "message": f"Error occurred while archiving email: {str(e)}",
+                }
+            )
         flash(f"Error occurred while archiving email: {str(e)}", "error")
         return redirect(url_for("email.list_emails"))
 
@@ -419,20 +624,22 @@ def archive_email(email_id):
 def classify_email(email_id):
     """Manual email classification"""
     try:
-        email_obj = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
-        if not email_obj:
-            return jsonify({"success": False, "message": "Email not found."})
-
         category_id = request.form.get("category_id")
         if category_id:
             category_id = int(category_id)
             if category_id == 0:  # Unclassified
                 category_id = None
 
-        # Direct database update
-        email_obj.category_id = category_id
-        email_obj.updated_at = datetime.utcnow()
+        # Direct database update (single UPDATE, no prior SELECT)
+        user_id = current_user.id
+        updated = Email.query.filter_by(id=email_id, user_id=user_id).update(
+            {"category_id": category_id, "updated_at": datetime.utcnow()},
+            synchronize_session=False,
+        )
+        if not updated:
+            return jsonify({"success": False, "message": "Email not found."})
         db.session.commit()
+        invalidate_email_caches(user_id)
 
         return jsonify({"success": True, "message": "Email classified."})
 
@@ -446,14 +653,17 @@ def classify_email(email_id):
 def analyze_email(email_id):
     """Email AI analysis - classification and summary"""
     try:
-        email_obj = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
-        if not email_obj:
+        # Kept for after commit (which expires current_user)
+        user_id = current_user.id
+
+        email_obj = db.session.get(Email, email_id)
+        if not email_obj or email_obj.user_id != user_id:
             return jsonify({"success": False, "message": "Email not found."})
 
-        ai_classifier = AIClassifier()
+        ai_classifier = get_classifier()
 
         # Get user categories for AI
-        categories = ai_classifier.get_user_categories_for_ai(current_user.id)
+        categories = ai_classifier.get_user_categories_for_ai(user_id)
 
         if not categories:
             return jsonify({"success": False, "message": "No available categories."})
@@ -488,31 +698,29 @@ def analyze_email(email_id):
         ):
             email_obj.summary = summary
 
-        # AI analysis completed, archive email in Gmail
+        # AI analysis completed, archive email in Gmail (row saved by the commit below)
         try:
-            gmail_service = GmailService(current_user.id, email_obj.account_id)
-            gmail_service.archive_email(email_obj.gmail_id)
+            gmail_service = GmailService(user_id, email_obj.account_id)
+            gmail_service.archive_email(email_obj.gmail_id, update_db=False)
             email_obj.is_archived = True
             print(f"✅ Email archived: {email_obj.subject}")
         except Exception as e:
             print(f"❌ Failed to archive email: {str(e)}")
 
+        archived = email_obj.is_archived
         db.session.commit()
 
-        # Get category information
-        category_name = "Unclassified"
-        if category_id:
-            category = Category.query.filter_by(
-                id=category_id, user_id=current_user.id
-            ).first()
-            if category:
-                category_name = category.name
+        # Category name from the categories sent to the classifier
+        category_name = next(
+            (cat["name"] for cat in categories if cat["id"] == category_id),
+            "Unclassified",
+        )
 
         analysis = {
             "category_id": category_id,
             "category_name": category_name,
             "summary": summary,
-            "archived": email_obj.is_archived,
+            "archived": archived,
             "success": True,
         }
 
@@ -524,15 +732,68 @@ def analyze_email(email_id):
         )
 
 
+def get_active_categories(user_id):
+    """Active categories of a user, cached per request and for 5 minutes across requests"""
+    request_categories = g.setdefault("active_categories", {})
+    if user_id in request_categories:
+        return request_categories[user_id]
+
+    cache_key = f"active_categories_{user_id}"
+    categories = cache.get(cache_key)
+    if categories is None:
+        categories = [
+            ActiveCategory(*row)
+            for row in db.session.query(
+                Category.id,
+                Category.name,
+                Category.description,
+                Category.color,
+                Category.icon,
+            )
+            .filter_by(user_id=user_id, is_active=True)
+            .all()
+        ]
+        cache.set(cache_key, categories, timeout=300)
+
+    request_categories[user_id] = categories
+    return categories
+
+
+def invalidate_active_categories(user_id):
+    """Drop cached active categories after a category is added, changed or removed"""
+    cache.delete_many(f"active_categories_{user_id}", f"ai_categories_{user_id}")
+    g.get("active_categories", {}).pop(user_id, None)
+
+
+def _email_cache_version(user_id):
+    """Current email cache version of a user (part of stats and list page keys)"""
+    return cache.get(f"email_cache_version_{user_id}") or 0
+
+
+def invalidate_email_caches(user_id):
+    """Drop a user's cached statistics and list pages by moving to a new key version"""
+    cache.set(f"email_cache_version_{user_id}", time.time_ns(), timeout=0)
+
+
+def _get_account_statistics(app, user_id, account_id, version):
+    """Statistics of one account, cached for 60 seconds (runs in a worker thread)"""
+    with app.app_context():
+        account_cache_key = f"email_stats_{user_id}_{version}_{account_id}"
+        account_stats = cache.get(account_cache_key)
+        if account_stats is None:
+            gmail_service = GmailService(user_id, account_id)
+            account_stats = gmail_service.get_email_statistics()
+            cache.set(account_cache_key, account_stats, timeout=60)
+        return account_stats
+
+
 @email_bp.route("/statistics")
 @login_required
 def email_statistics():
     """Email statistics (all accounts combined)"""
     try:
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify(
@@ -547,13 +808,36 @@ def email_statistics():
                 }
             )
 
+        # Repeat polls within the TTL reuse the summed result
+        stats_version = _email_cache_version(current_user.id)
+        account_ids = sorted(account.id for account in accounts)
+        sum_cache_key = f"email_stats_sum_{current_user.id}_{stats_version}_{'-'.join(map(str, account_ids))}"
+        cached_total = cache.get(sum_cache_key)
+        if cached_total is not None:
+            return jsonify({"success": True, "statistics": cached_total})
+
         # Sum statistics for all accounts
         total_stats = {"total": 0, "unread": 0, "archived": 0, "categories": {}}
 
-        for account in accounts:
+        app = current_app._get_current_object()
+        with ThreadPoolExecutor(max_workers=min(8, len(accounts))) as executor:
+            futures = [
+                (
+                    account.account_email,
+                    executor.submit(
+                        _get_account_statistics,
+                        app,
+                        current_user.id,
+                        account.id,
+                        stats_version,
+                    ),
+                )
+                for account in accounts
+            ]
+
+        for account_email, future in futures:
             try:
-                gmail_service = GmailService(current_user.id, account.id)
-                account_stats = gmail_service.get_email_statistics()
+                account_stats = future.result()
 
                 # Basic statistics addition
                 total_stats["total"] += account_stats.get("total", 0)
@@ -569,10 +853,11 @@ def email_statistics():
 
             except Exception as e:
                 print(
-                    f"Failed to retrieve statistics for account {account.account_email}: {str(e)}"
+                    f"Failed to retrieve statistics for account {account_email}: {str(e)}"
                 )
                 continue
 
+        cache.set(sum_cache_key, total_stats, timeout=30)
         return jsonify({"success": True, "statistics": total_stats})
 
     except Exception as e:
@@ -586,7 +871,22 @@ def email_statistics():
 def view_email(email_id):
     """Email detail page"""
     try:
-        email_obj = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
+        # 읽음 처리(자동 마킹) - 조회 전에 처리해 commit 후 재로딩을 피함
+        marked_read = Email.query.filter_by(
+            id=email_id, user_id=current_user.id, is_read=False
+        ).update(
+            {"is_read": True, "updated_at": datetime.utcnow()},
+            synchronize_session=False,
+        )
+        db.session.commit()
+        if marked_read:
+            invalidate_email_caches(current_user.id)
+
+        email_obj = (
+            _email_query(selectinload(Email.category))
+            .filter_by(id=email_id, user_id=current_user.id)
+            .first()
+        )
         if not email_obj:
             flash("Email not found.", "error")
             return redirect(url_for("email.list_emails"))
@@ -606,26 +906,13 @@ def view_email(email_id):
         ]
         is_html = any(tag in (email_obj.content or "") for tag in html_indicators)
 
-        # 읽음 처리(자동 마킹)
-        if not email_obj.is_read:
-            email_obj.is_read = True
-            email_obj.updated_at = datetime.utcnow()
-            db.session.commit()
-
-        # 카테고리 정보
-        category = None
-        if email_obj.category_id:
-            category = Category.query.filter_by(
-                id=email_obj.category_id, user_id=current_user.id
-            ).first()
-            if not category:
-                email_obj.category_id = None
-                db.session.commit()
+        # 카테고리 정보 (eager-loaded)
+        category = email_obj.category
+        if category and category.user_id != current_user.id:
+            category = None
 
         # 사용자 카테고리 리스트
-        user_categories = Category.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        user_categories = get_active_categories(current_user.id)
 
         return render_template(
             "email/view.html",
@@ -640,6 +927,116 @@ def view_email(email_id):
         return redirect(url_for("email.list_emails"))
 
 
+def _unsubscribe_account_senders(app, user_id, account_id, items):
+    """Unsubscribe one account's senders (runs in a worker thread)
+
+    items are (sender, representative email id) pairs. Returns
+    {sender: result dict or the exception raised}. All senders share one event
+    loop so the account's unsubscribe browser is launched once and reused
+    (Playwright objects are bound to the loop that created them).
+    """
+    with app.app_context():
+        results = {}
+        loop = asyncio.new_event_loop()
+        try:
+            gmail_service = GmailService(user_id, account_id)
+            logger.debug(f"📝 GmailService initialized - Account: {account_id}")
+            for sender, email_id in items:
+                try:
+                    # Loaded in this thread's session, which commits the updates
+                    email_obj = db.session.get(Email, email_id)
+                    results[sender] = loop.run_until_complete(
+                        gmail_service.process_unsubscribe(
+                            email_obj, close_browser=False
+                        )
+                    )
+                except Exception as e:
+                    results[sender] = e
+            loop.run_until_complete(gmail_service.close_unsubscribe_browser())
+        except Exception as e:
+            for sender, _ in items:
+                results.setdefault(sender, e)
+        finally:
+            loop.close()
+        return results
+
+
+def _apply_bulk_gmail_action(
+    user_id, email_ids, emails_by_id, gmail_call, forbidden_details
+):
+    """Run a batched Gmail call once per account for the selected emails
+
+    Returns the email objects that succeeded and the failure entries (missing
+    emails, or every email of an account whose Gmail call failed).
+    """
+    failed_emails = []
+    emails_by_account = {}
+    for email_id in email_ids:
+        email_obj = emails_by_id.get(int(email_id)) if email_id.isdigit() else None
+        if not email_obj:
+            logger.warning(f"❌ Email {email_id} not found")
+            failed_emails.append(
+                {
+                    "id": email_id,
+                    "subject": "Unknown",
+                    "error": "Email not found",
+                    "error_type": "not_found",
+                }
+            )
+            continue
+        emails_by_account.setdefault(email_obj.account_id, []).append(email_obj)
+
+    succeeded = []
+    for account_id, account_emails in emails_by_account.items():
+        try:
+            gmail_service = GmailService(user_id, account_id)
+            gmail_call(
+                gmail_service, [email_obj.gmail_id for email_obj in account_emails]
+            )
+            succeeded.extend(account_emails)
+            logger.info(
+                f"✅ {len(account_emails)} emails processed (account: {account_id})"
+            )
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(
+                f"❌ Gmail batch request failed (account: {account_id}): {error_msg}"
+            )
+
+            # Classify error type
+            error_type = "unknown"
+            if "404" in error_msg and "not found" in error_msg.lower():
+                error_type = "not_found"
+                error_details = "Email already deleted or not found"
+            elif "403" in error_msg:
+                error_type = "forbidden"
+                error_details = forbidden_details
+            elif "401" in error_msg:
+                error_type = "unauthorized"
+                error_details = "Authentication failed"
+            elif "500" in error_msg:
+                error_type = "server_error"
+                error_details = "Server error occurred"
+            elif "network" in error_msg.lower() or "connection" in error_msg.lower():
+                error_type = "network_error"
+                error_details = "Network connection error"
+            else:
+                error_details = error_msg
+
+            failed_emails.extend(
+                {
+                    "id": str(email_obj.id),
+                    "subject": email_obj.subject,
+                    "error": error_details,
+                    "error_type": error_type,
+                }
+                for email_obj in account_emails
+            )
+
+    return succeeded, failed_emails
+
+
 @email_bp.route("/bulk-actions", methods=["POST"])
 @login_required
 def bulk_actions():
@@ -654,85 +1051,49 @@ def bulk_actions():
                 400,
             )
 
-        gmail_service = GmailService(current_user.id)
-        processed_count = 0
+        if action not in ("delete", "archive", "mark_read", "unsubscribe"):
+            return (
+                jsonify({"success": False, "message": "Unsupported action."}),
+                400,
+            )
+
+        # Kept for after commit (which expires current_user)
+        user_id = current_user.id
+
+        # Fetch all selected emails in one query instead of one SELECT per id
+        selected_ids = [int(email_id) for email_id in email_ids if email_id.isdigit()]
+        emails_by_id = {
+            email_obj.id: email_obj
+            for email_obj in _email_query()
+            .filter(Email.user_id == current_user.id, Email.id.in_(selected_ids))
+            .all()
+        }
 
         if action == "delete":
             # Bulk deletion (improved version)
-            print(
+            logger.debug(
                 f"🔍 Bulk deletion started - Number of selected emails: {len(email_ids)}"
             )
 
-            # Variables for collecting results
-            success_count = 0
-            failed_emails = []
-            result_message = ""
-
-            for email_id in email_ids:
-                try:
-                    email_obj = Email.query.filter_by(
-                        id=int(email_id), user_id=current_user.id
-                    ).first()
-
-                    if not email_obj:
-                        print(f"❌ Email {email_id} not found")
-                        failed_emails.append(
-                            {
-                                "id": email_id,
-                                "subject": "Unknown",
-                                "error": "Email not found",
-                                "error_type": "not_found",
-                            }
-                        )
-                        continue
-
-                    # Delete from Gmail
-                    gmail_service = GmailService(current_user.id, email_obj.account_id)
-                    gmail_service.delete_email(email_obj.gmail_id)
-
-                    # Delete from DB
-                    db.session.delete(email_obj)
-                    success_count += 1
-                    print(f"✅ Email {email_id} deletion successful")
-
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"❌ Failed to delete email (ID: {email_id}): {error_msg}")
-
-                    # Classify error type
-                    error_type = "unknown"
-                    if "404" in error_msg and "not found" in error_msg.lower():
-                        error_type = "not_found"
-                        error_details = "Email already deleted or not found"
-                    elif "403" in error_msg:
-                        error_type = "forbidden"
-                        error_details = "No permission to delete"
-                    elif "401" in error_msg:
-                        error_type = "unauthorized"
-                        error_details = "Authentication failed"
-                    elif "500" in error_msg:
-                        error_type = "server_error"
-                        error_details = "Server error occurred"
-                    elif (
-                        "network" in error_msg.lower()
-                        or "connection" in error_msg.lower()
-                    ):
-                        error_type = "network_error"
-                        error_details = "Network connection error"
-                    else:
-                        error_details = error_msg
-
-                    failed_emails.append(
-                        {
-                            "id": email_id,
-                            "subject": email_obj.subject if email_obj else "Unknown",
-                            "error": error_details,
-                            "error_type": error_type,
-                        }
-                    )
-
-            # Commit DB changes
+            # One batchDelete call per account instead of one request per email
+            succeeded, failed_emails = _apply_bulk_gmail_action(
+                user_id,
+                email_ids,
+                emails_by_id,
+                lambda gmail_service, gmail_ids: gmail_service.batch_delete(gmail_ids),
+                "No permission to delete",
+            )
+            deleted_ids = [email_obj.id for email_obj in succeeded]
+            success_count = len(deleted_ids)
+
+            # Delete successfully removed emails from DB in a single statement
+            if deleted_ids:
+                Email.query.filter(
+                    Email.user_id == current_user.id, Email.id.in_(deleted_ids)
+                ).delete(synchronize_session=False)
             db.session.commit()
+            if deleted_ids:
+                invalidate_email_caches(user_id)
 
             # Group errors by type
             error_groups = {}
@@ -768,79 +1129,39 @@ def bulk_actions():
                 + "\n".join(message_parts)
             )
 
-            print(f"🎉 Bulk deletion completed - {result_message}")
+            logger.info(f"🎉 Bulk deletion completed - {result_message}")
 
             return jsonify({"success": True, "message": result_message})
 
         elif action == "archive":
             # Bulk archiving (improved version)
-            print(
+            logger.debug(
                 f"🔍 Bulk archiving started - Number of selected emails: {len(email_ids)}"
             )
 
-            # Variables for collecting results
-            success_count = 0
-            failed_emails = []
-            result_message = ""
-
-            for email_id in email_ids:
-                try:
-                    email_obj = Email.query.filter_by(
-                        id=int(email_id), user_id=current_user.id
-                    ).first()
-
-                    if not email_obj:
-                        print(f"❌ Email {email_id} not found")
-                        failed_emails.append(
-                            {
-                                "id": email_id,
-                                "subject": "Unknown",
-                                "error": "Email not found",
-                                "error_type": "not_found",
-                            }
-                        )
-                        continue
-
-                    gmail_service = GmailService(current_user.id, email_obj.account_id)
-                    gmail_service.archive_email(email_obj.gmail_id)
-                    success_count += 1
-                    print(f"✅ Email {email_id} archiving successful")
-
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"❌ Failed to archive email (ID: {email_id}): {error_msg}")
-
-                    # Classify error type
-                    error_type = "unknown"
-                    if "404" in error_msg and "not found" in error_msg.lower():
-                        error_type = "not_found"
-                        error_details = "Email already deleted or not found"
-                    elif "403" in error_msg:
-                        error_type = "forbidden"
-                        error_details = "No permission to archive"
-                    elif "401" in error_msg:
-                        error_type = "unauthorized"
-                        error_details = "Authentication failed"
-                    elif "500" in error_msg:
-                        error_type = "server_error"
-                        error_details = "Server error occurred"
-                    elif (
-                        "network" in error_msg.lower()
-                        or "connection" in error_msg.lower()
-                    ):
-                        error_type = "network_error"
-                        error_details = "Network connection error"
-                    else:
-                        error_details = error_msg
-
-                    failed_emails.append(
-                        {
-                            "id": email_id,
-                            "subject": email_obj.subject if email_obj else "Unknown",
-                            "error": error_details,
-                            "error_type": error_type,
-                        }
-                    )
+            # One batchModify call per account instead of one request per email
+            succeeded, failed_emails = _apply_bulk_gmail_action(
+                user_id,
+                email_ids,
+                emails_by_id,
+                lambda gmail_service, gmail_ids: gmail_service.batch_modify(
+                    gmail_ids, remove_labels=["INBOX"]
+                ),
+                "No permission to archive",
+            )
+            updated_ids = [email_obj.id for email_obj in succeeded]
+            success_count = len(updated_ids)
+
+            # Update local state for all successful emails in one statement
+            if updated_ids:
+                Email.query.filter(
+                    Email.user_id == current_user.id, Email.id.in_(updated_ids)
+                ).update(
+                    {"is_archived": True, "updated_at": datetime.utcnow()},
+                    synchronize_session=False,
+                )
+                db.session.commit()
+                invalidate_email_caches(user_id)
 
             # Group errors by type
             error_groups = {}
@@ -876,80 +1197,39 @@ def bulk_actions():
                 + "\n".join(message_parts)
             )
 
-            print(f"🎉 Bulk archiving completed - {result_message}")
+            logger.info(f"🎉 Bulk archiving completed - {result_message}")
 
             return jsonify({"success": True, "message": result_message})
 
         elif action == "mark_read":
             # Bulk marking as read (improved version)
-            print(
+            logger.debug(
                 f"🔍 Bulk marking as read started - Number of selected emails: {len(email_ids)}"
             )
 
-            # Variables for collecting results
-            success_count = 0
-            failed_emails = []
-
-            for email_id in email_ids:
-                try:
-                    email_obj = Email.query.filter_by(
-                        id=int(email_id), user_id=current_user.id
-                    ).first()
-
-                    if not email_obj:
-                        print(f"❌ Email {email_id} not found")
-                        failed_emails.append(
-                            {
-                                "id": email_id,
-                                "subject": "Unknown",
-                                "error": "Email not found",
-                                "error_type": "not_found",
-                            }
-                        )
-                        continue
-
-                    gmail_service = GmailService(current_user.id, email_obj.account_id)
-                    gmail_service.mark_as_read(email_obj.gmail_id)
-                    success_count += 1
-                    print(f"✅ Email {email_id} marking as read successful")
-
-                except Exception as e:
-                    error_msg = str(e)
-                    print(
-                        f"❌ Failed to mark email as read (ID: {email_id}): {error_msg}"
-                    )
-
-                    # Classify error type
-                    error_type = "unknown"
-                    if "404" in error_msg and "not found" in error_msg.lower():
-                        error_type = "not_found"
-                        error_details = "Email already deleted or not found"
-                    elif "403" in error_msg:
-                        error_type = "forbidden"
-                        error_details = "No permission to mark as read"
-                    elif "401" in error_msg:
-                        error_type = "unauthorized"
-                        error_details = "Authentication failed"
-                    elif "500" in error_msg:
-                        error_type = "server_error"
-                        error_details = "Server error occurred"
-                    elif (
-                        "network" in error_msg.lower()
-                        or "connection" in error_msg.lower()
-                    ):
-                        error_type = "network_error"
-                        error_details = "Network connection error"
-                    else:
-                        error_details = error_msg
-
-                    failed_emails.append(
-                        {
-                            "id": email_id,
-                            "subject": email_obj.subject if email_obj else "Unknown",
-                            "error": error_details,
-                            "error_type": error_type,
-                        }
-                    )
+            # One batchModify call per account instead of one request per email
+            succeeded, failed_emails = _apply_bulk_gmail_action(
+                user_id,
+                email_ids,
+                emails_by_id,
+                lambda gmail_service, gmail_ids: gmail_service.batch_modify(
+                    gmail_ids, remove_labels=["UNREAD"]
+                ),
+                "No permission to mark as read",
+            )
+            updated_ids = [email_obj.id for email_obj in succeeded]
+            success_count = len(updated_ids)
+
+            # Update local state for all successful emails in one statement
+            if updated_ids:
+                Email.query.filter(
+                    Email.user_id == current_user.id, Email.id.in_(updated_ids)
+                ).update(
+                    {"is_read": True, "updated_at": datetime.utcnow()},
+                    synchronize_session=False,
+                )
+                db.session.commit()
+                invalidate_email_caches(user_id)
 
             # Group errors by type
             error_groups = {}
@@ -985,40 +1265,32 @@ def bulk_actions():
                 + "\n".join(message_parts)
             )
 
-            print(f"🎉 Bulk marking as read completed - {result_message}")
+            logger.info(f"🎉 Bulk marking as read completed - {result_message}")
 
             return jsonify({"success": True, "message": result_message})
 
         elif action == "unsubscribe":
             # Bulk unsubscription (grouped by sender)
-            print(
+            logger.debug(
                 f"🔍 Bulk unsubscription started - Number of selected emails: {len(email_ids)}"
             )
 
             # Group selected emails by sender
             sender_groups = {}
             for email_id in email_ids:
-                try:
-                    email_obj = Email.query.filter_by(
-                        id=int(email_id), user_id=current_user.id
-                    ).first()
-
-                    if not email_obj:
-                        print(f"❌ Email {email_id} not found")
-                        continue
-
-                    sender = email_obj.sender
-                    if sender not in sender_groups:
-                        sender_groups[sender] = []
-                    sender_groups[sender].append(email_obj)
-
-                except Exception as e:
-                    print(
-                        f"❌ Exception occurred while retrieving email {email_id}: {str(e)}"
-                    )
+                email_obj = (
+                    emails_by_id.get(int(email_id)) if email_id.isdigit() else None
+                )
+                if not email_obj:
+                    logger.warning(f"❌ Email {email_id} not found")
                     continue
 
-            print(
+                sender = email_obj.sender
+                if sender not in sender_groups:
+                    sender_groups[sender] = []
+                sender_groups[sender].append(email_obj)
+
+            logger.debug(
                 f"📝 Grouping emails by sender completed - {len(sender_groups)} senders"
             )
 
@@ -1026,102 +1298,102 @@ def bulk_actions():
             successful_senders = []  # List of successful senders
             failed_senders = []  # List of failed senders (sender, reason)
             already_unsubscribed_senders = []  # List of already unsubscribed senders
+            representatives = {}  # sender -> representative email
+            account_work = {}  # account_id -> [(sender, representative email id)]
 
-            # Process each sender group
+            # Pick one representative email per sender
             for sender, emails in sender_groups.items():
-                print(f"📝 Processing sender '{sender}' - {len(emails)} emails")
-
-                # Check if any email has already been unsubscribed
-                unsubscribed_count = sum(1 for email in emails if email.is_unsubscribed)
-                if unsubscribed_count == len(emails):
-                    print(
-                        f"⏭️ All emails for sender '{sender}' have already been unsubscribed"
-                    )
-                    already_unsubscribed_senders.append(sender)
-                    continue
+                logger.debug(f"📝 Processing sender '{sender}' - {len(emails)} emails")
 
                 # Select a representative email (first non-unsubscribed email)
-                representative_email = None
-                for email in emails:
-                    if not email.is_unsubscribed:
-                        representative_email = email
-                        break
-
+                representative_email = next(
+                    (email for email in emails if not email.is_unsubscribed), None
+                )
                 if not representative_email:
-                    print(
+                    logger.info(
                         f"⏭️ All emails for sender '{sender}' have already been unsubscribed"
                     )
                     already_unsubscribed_senders.append(sender)
                     continue
 
-                print(
+                logger.debug(
                     f"📝 Selecting representative email for sender '{sender}': {representative_email.subject}"
                 )
+                representatives[sender] = representative_email
+                account_work.setdefault(representative_email.account_id, []).append(
+                    (sender, representative_email.id)
+                )
 
-                try:
-                    # Process unsubscription
-                    gmail_service = GmailService(
-                        current_user.id, representative_email.account_id
-                    )
-                    print(
-                        f"📝 GmailService initialized - Account: {representative_email.account_id}"
+            # Accounts are unsubscribed in parallel, each with its own Gmail
+            # service and browser; one account's senders share its browser
+            unsubscribe_results = {}
+            if account_work:
+                app = current_app._get_current_object()
+                with ThreadPoolExecutor(
+                    max_workers=min(BULK_UNSUBSCRIBE_WORKERS, len(account_work))
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            _unsubscribe_account_senders,
+                            app,
+                            user_id,
+                            account_id,
+                            items,
+                        )
+                        for account_id, items in account_work.items()
+                    ]
+                    for future in futures:
+                        unsubscribe_results.update(future.result())
+
+            for sender, representative_email in representatives.items():
+                emails = sender_groups[sender]
+                result = unsubscribe_results.get(sender)
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"❌ Exception occurred while processing sender '{sender}': {str(result)}"
                     )
-
-                    result = asyncio.run(
-                        gmail_service.process_unsubscribe(representative_email)
+                    failed_senders.append(
+                        {
+                            "sender": sender,
+                            "email_count": len(emails),
+                            "error": f"Processing error: {str(result)}",
+                            "error_type": "processing_error",
+                            "representative_subject": representative_email.subject,
+                        }
                     )
-                    print(f"📝 process_unsubscribe result: {result}")
+                    continue
 
-                    if result["success"]:
-                        print(f"✅ Successfully unsubscribed sender '{sender}'")
-                        successful_senders.append(
-                            {
-                                "sender": sender,
-                                "email_count": len(emails),
-                                "bulk_updated_count": result.get(
-                                    "bulk_updated_count", 0
-                                ),
-                                "representative_subject": representative_email.subject,
-                            }
-                        )
-                    else:
-                        # Analyze failure reason
-                        error_type = result.get("error_type", "unknown")
-                        error_details = result.get("error_details", "Unknown error")
-                        error_message = result.get("message", "Failed to unsubscribe")
+                logger.debug(f"📝 process_unsubscribe result: {result}")
 
-                        if error_type == "already_unsubscribed":
-                            already_unsubscribed_senders.append(sender)
-                            continue
+                if result["success"]:
+                    logger.info(f"✅ Successfully unsubscribed sender '{sender}'")
+                    successful_senders.append(
+                        {
+                            "sender": sender,
+                            "email_count": len(emails),
+                            "bulk_updated_count": result.get("bulk_updated_count", 0),
+                            "representative_subject": representative_email.subject,
+                        }
+                    )
+                else:
+                    # Analyze failure reason
+                    error_type = result.get("error_type", "unknown")
+                    error_message = result.get("message", "Failed to unsubscribe")
 
-                        print(
-                            f"❌ Failed to unsubscribe sender '{sender}': {error_message}"
-                        )
-                        failed_senders.append(
-                            {
-                                "sender": sender,
-                                "email_count": len(emails),
-                                "error": error_message,
-                                "error_type": error_type,
-                                "representative_subject": representative_email.subject,
-                            }
-                        )
+                    if error_type == "already_unsubscribed":
+                        already_unsubscribed_senders.append(sender)
+                        continue
 
-                except Exception as e:
-                    print(
-                        f"❌ Exception occurred while processing sender '{sender}': {str(e)}"
+                    logger.error(
+                        f"❌ Failed to unsubscribe sender '{sender}': {error_message}"
                     )
                     failed_senders.append(
                         {
                             "sender": sender,
                             "email_count": len(emails),
-                            "error": f"Processing error: {str(e)}",
-                            "error_type": "processing_error",
-                            "representative_subject": (
-                                representative_email.subject
-                                if representative_email
-                                else "Unknown"
-                            ),
+                            "error": error_message,
+                            "error_type": error_type,
+                            "representative_subject": representative_email.subject,
                         }
                     )
 
@@ -1182,16 +1454,10 @@ def bulk_actions():
                 + "\n".join(message_parts)
             )
 
-            print(f"🎉 Bulk unsubscription completed - {result_message}")
+            logger.info(f"🎉 Bulk unsubscription completed - {result_message}")
 
             return jsonify({"success": True, "message": result_message})
 
-        else:
-            return (
-                jsonify({"success": False, "message": "Unsupported action."}),
-                400,
-            )
-
     except Exception as e:
         return (
             jsonify(
@@ -1211,9 +1477,9 @@ def unsubscribe_email(email_id):
     print(f"🔍 Individual unsubscription started - Email ID: {email_id}")
     try:
         # Retrieve email
-        email = Email.query.filter_by(id=email_id, user_id=current_user.id).first()
+        email = db.session.get(Email, email_id)
 
-        if not email:
+        if not email or email.user_id != current_user.id:
             print(f"❌ Email {email_id} not found")
             return (
                 jsonify({"success": False, "message": "Email not found."}),
@@ -1382,20 +1648,23 @@ def clear_bulk_result():
 
 
 def process_missed_emails_for_account(
-    user_id: str, account_id: int, from_date: datetime
+    user_id: str, account_id: int, from_date: datetime, categories: list = None
 ) -> dict:
-    """Process missed emails for a specific account"""
+    """Process missed emails for a specific account
+
+    categories (AI classification format) can be passed in when several
+    accounts of the same user are processed; otherwise they are queried here.
+    """
     try:
         from .gmail_service import GmailService
-        from .ai_classifier import AIClassifier
 
-        print(
+        logger.info(
             f"📧 Processing missed emails started - Account: {account_id}, Start date: {from_date}"
         )
 
-        # Initialize Gmail service and AI classifier
+        # Initialize Gmail service and get the shared AI classifier
         gmail_service = GmailService(user_id, account_id)
-        ai_classifier = AIClassifier()
+        ai_classifier = get_classifier()
 
         # Fetch missed emails from the specified period
         missed_emails = gmail_service.fetch_recent_emails(
@@ -1403,7 +1672,7 @@ def process_missed_emails_for_account(
         )
 
         if not missed_emails:
-            print(f"�� No missed emails - Account: {account_id}")
+            logger.info(f"�� No missed emails - Account: {account_id}")
             return {
                 "success": True,
                 "processed_count": 0,
@@ -1411,78 +1680,70 @@ def process_missed_emails_for_account(
                 "message": "No missed emails.",
             }
 
-        print(f"📥 Found {len(missed_emails)} missed emails - Account: {account_id}")
+        logger.info(
+            f"📥 Found {len(missed_emails)} missed emails - Account: {account_id}"
+        )
 
         # Get user categories (AI classification format)
-        category_objects = gmail_service.get_user_categories()
-        categories = [
-            {"id": cat.id, "name": cat.name, "description": cat.description or ""}
-            for cat in category_objects
-        ]
+        if categories is None:
+            category_objects = gmail_service.get_user_categories()
+            categories = [
+                {"id": cat.id, "name": cat.name, "description": cat.description or ""}
+                for cat in category_objects
+            ]
+
+        category_names = {cat["id"]: cat["name"] for cat in categories}
 
-        processed_count = 0
         classified_count = 0
 
+        # Fetch gmail ids already stored for this account in one query
+        existing_ids = gmail_service.get_existing_gmail_ids(
+            [email_data.get("gmail_id") for email_data in missed_emails]
+        )
+
+        # Save unseen emails first (each in its own savepoint, committed once
+        # below) so only emails that were actually stored are sent to the AI
+        saved_emails = []
         for email_data in missed_emails:
+            if email_data.get("gmail_id") in existing_ids:
+                logger.debug(
+                    f"⏭️ Skipping already processed email: {email_data.get('subject', 'No subject')}"
+                )
+                continue
             try:
-                # Check if email already exists in DB
-                existing_email = Email.query.filter_by(
-                    user_id=user_id,
-                    account_id=account_id,
-                    gmail_id=email_data.get("gmail_id"),
-                ).first()
-
-                if existing_email:
-                    print(
-                        f"⏭️ Skipping already processed email: {email_data.get('subject', 'No subject')}"
+                saved_emails.append(
+                    gmail_service.save_email_to_db(
+                        email_data, commit=False, check_existing=False
                     )
-                    continue
-
-                # Classify email
-                ai_classifier = AIClassifier()
-                category_id, summary = ai_classifier.classify_and_summarize_email(
-                    email_data.get("body", ""),
-                    email_data.get("subject", ""),
-                    email_data.get("sender", ""),
-                    categories,
                 )
-
-                # Category name 쿼리
-                category = Category.query.filter_by(id=category_id).first()
-                category_name = category.name if category else "Unclassified"
-
-                # Save email to DB
-                email = Email(
-                    user_id=user_id,
-                    account_id=account_id,
-                    gmail_id=email_data.get("gmail_id"),
-                    subject=email_data.get("subject", ""),
-                    sender=email_data.get("sender", ""),
-                    recipient=email_data.get("recipient", ""),
-                    date=email_data.get("date"),
-                    snippet=email_data.get("snippet", ""),
-                    body=email_data.get("body", ""),
-                    category_id=category_id,
-                    is_read=False,
-                    is_archived=False,
-                    created_at=datetime.utcnow(),
+                existing_ids.add(email_data.get("gmail_id"))
+            except Exception as e:
+                logger.error(
+                    f"❌ Failed to process missed email: {email_data.get('subject', 'No subject')}, Error: {str(e)}"
                 )
+        processed_count = len(saved_emails)
 
-                db.session.add(email)
-                processed_count += 1
-
-                if category_id:
-                    classified_count += 1
+        # Classify all saved emails with concurrent API calls
+        ai_results = ai_classifier.classify_and_summarize_emails(
+            [
+                {
+                    "content": email_obj.content,
+                    "subject": email_obj.subject,
+                    "sender": email_obj.sender,
+                }
+                for email_obj in saved_emails
+            ],
+            categories,
+        )
 
-                print(
-                    f"✅ Missed emails processed: {email_data.get('subject', 'No subject')} -> {category_name}"
-                )
+        for email_obj, (category_id, summary) in zip(saved_emails, ai_results):
+            if category_id:
+                email_obj.category_id = category_id
+                classified_count += 1
 
-            except Exception as e:
-                print(
-                    f"❌ Failed to process missed email: {email_data.get('subject', 'No subject')}, Error: {str(e)}"
-                )
-                continue
+            logger.debug(
+                f"✅ Missed emails processed: {email_obj.subject} -> {category_names.get(category_id, 'Unclassified')}"
+            )
 
         db.session.commit()
 
@@ -1494,14 +1755,15 @@ def process_missed_emails_for_account(
             "message": f"Processed {processed_count} missed emails (classified: {classified_count} emails)",
         }
 
-        print(
+        logger.info(
             f"🎉 Missed emails processed successfully - Account: {account_id}, Processed: {processed_count}, Classified: {classified_count}"
         )
 
         return result
 
     except Exception as e:
-        print(f"❌ Failed to process missed emails: {str(e)}")
+        db.session.rollback()
+        logger.error(f"❌ Failed to process missed emails: {str(e)}")
         return {
             "success": False,
             "error": str(e),
@@ -1609,9 +1871,7 @@ def setup_webhook():
     """Set up Gmail webhook"""
     try:
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -1679,9 +1939,7 @@ def webhook_status():
         repair_result = check_and_repair_webhooks_for_user(current_user.id)
 
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -1753,9 +2011,7 @@ def auto_renew_webhook():
     """Automatically renew expired webhook (automatic renewal of expired webhook)"""
     try:
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -1853,13 +2109,13 @@ def check_and_repair_webhooks_for_user(user_id: str) -> dict:
     try:
         from datetime import datetime, timedelta
 
-        print(f"🔍 Checking user's webhook status: {user_id}")
+        logger.debug("🔍 Checking user's webhook status: %s", user_id)
 
         # Get all active accounts of the user
         accounts = UserAccount.query.filter_by(user_id=user_id, is_active=True).all()
 
         if not accounts:
-            print(f"⚠️ User {user_id} has no active accounts")
+            logger.warning("⚠️ User %s has no active accounts", user_id)
             return {"success": False, "message": "No active accounts."}
 
         repaired_count = 0
@@ -1877,58 +2133,67 @@ def check_and_repair_webhooks_for_user(user_id: str) -> dict:
 
                 # If webhook is not set up or expired, recover it
                 if not webhook_status or webhook_status.is_expired:
-                    print(
-                        f"🔄 Trying to recover webhook - Account: {account.account_email}"
+                    logger.debug(
+                        "🔄 Trying to recover webhook - Account: %s",
+                        account.account_email,
                     )
 
                     success = setup_webhook_for_account(user_id, account.id)
 
                     if success:
                         repaired_count += 1
-                        print(
-                            f"✅ Webhook recovery successful - Account: {account.account_email}"
+                        logger.info(
+                            "✅ Webhook recovery successful - Account: %s",
+                            account.account_email,
                         )
 
                         # Check missed emails processing result (already handled in setup_webhook_for_account)
                         # Here, we just log the result
-                        print(
-                            f"📧 Missed emails processed - Account: {account.account_email}"
+                        logger.debug(
+                            "📧 Missed emails processed - Account: %s",
+                            account.account_email,
                         )
                     else:
                         failed_count += 1
-                        print(
-                            f"❌ Failed to recover webhook - Account: {account.account_email}"
+                        logger.error(
+                            "❌ Failed to recover webhook - Account: %s",
+                            account.account_email,
                         )
                 else:
                     # Check if it's time to renew (within 48 hours)
                     expiry_threshold = datetime.utcnow() + timedelta(hours=48)
                     if webhook_status.expires_at <= expiry_threshold:
-                        print(
-                            f"🔄 Preventive renewal - Account: {account.account_email}"
+                        logger.debug(
+                            "🔄 Preventive renewal - Account: %s", account.account_email
                         )
 
                         success = setup_webhook_for_account(user_id, account.id)
 
                         if success:
                             repaired_count += 1
-                            print(
-                                f"✅ Preventive renewal successful - Account: {account.account_email}"
+                            logger.info(
+                                "✅ Preventive renewal successful - Account: %s",
+                                account.account_email,
                             )
                         else:
                             failed_count += 1
-                            print(
-                                f"❌ Failed to preventively renew webhook - Account: {account.account_email}"
+                            logger.error(
+                                "❌ Failed to preventively renew webhook - Account: %s",
+                                account.account_email,
                             )
                     else:
                         healthy_count += 1
-                        print(
-                            f"✅ Webhook is in good condition - Account: {account.account_email}"
+                        logger.debug(
+                            "✅ Webhook is in good condition - Account: %s",
+                            account.account_email,
                         )
 
             except Exception as e:
                 failed_count += 1
-                print(
-                    f"❌ Error occurred while recovering webhook - Account: {account.account_email}, Error: {str(e)}"
+                logger.error(
+                    "❌ Error occurred while recovering webhook - Account: %s, Error: %s",
+                    account.account_email,
+                    e,
                 )
 
         result = {
@@ -1941,14 +2206,17 @@ def check_and_repair_webhooks_for_user(user_id: str) -> dict:
             "missed_emails_classified": missed_emails_classified,
         }
 
-        print(
-            f"🎉 User's webhook status check completed - Recovered: {repaired_count}, Failed: {failed_count}, Healthy: {healthy_count}"
+        logger.info(
+            "🎉 User's webhook status check completed - Recovered: %s, Failed: %s, Healthy: %s",
+            repaired_count,
+            failed_count,
+            healthy_count,
         )
 
         return result
 
     except Exception as e:
-        print(f"❌ Error checking user's webhook status: {str(e)}")
+        logger.error("❌ Error checking user's webhook status: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -1958,7 +2226,7 @@ def monitor_and_renew_webhooks():
         from datetime import datetime, timedelta
         from ..models import User
 
-        print("🔄 Starting webhook monitoring...")
+        logger.debug("🔄 Starting webhook monitoring...")
 
         # Get webhooks expiring within 48 hours (earlier preventive renewal)
         expiry_threshold = datetime.utcnow() + timedelta(hours=48)
@@ -1975,16 +2243,20 @@ def monitor_and_renew_webhooks():
 
         for webhook in expiring_webhooks:
             try:
-                print(
-                    f"🔄 Automatically renewing webhook - User: {webhook.user_id}, Account: {webhook.account_id}"
+                logger.debug(
+                    "🔄 Automatically renewing webhook - User: %s, Account: %s",
+                    webhook.user_id,
+                    webhook.account_id,
                 )
 
                 success = setup_webhook_for_account(webhook.user_id, webhook.account_id)
 
                 if success:
                     renewed_count += 1
-                    print(
-                        f"✅ Webhook renewal successful - User: {webhook.user_id}, Account: {webhook.account_id}"
+                    logger.info(
+                        "✅ Webhook renewal successful - User: %s, Account: %s",
+                        webhook.user_id,
+                        webhook.account_id,
                     )
 
                     # Missed email processing criteria: after expiration, if none, use service join date
@@ -2012,18 +2284,26 @@ def monitor_and_renew_webhooks():
                     )
                 else:
                     failed_count += 1
-                    print(
-                        f"❌ Failed to renew webhook - User: {webhook.user_id}, Account: {webhook.account_id}"
+                    logger.error(
+                        "❌ Failed to renew webhook - User: %s, Account: %s",
+                        webhook.user_id,
+                        webhook.account_id,
                     )
 
             except Exception as e:
                 failed_count += 1
-                print(
-                    f"❌ Error occurred while renewing webhook - User: {webhook.user_id}, Account: {webhook.account_id}, Error: {str(e)}"
+                logger.error(
+                    "❌ Error occurred while renewing webhook - User: %s, Account: %s, Error: %s",
+                    webhook.user_id,
+                    webhook.account_id,
+                    e,
                 )
 
-        print(
-            f"🎉 Webhook monitoring completed - Renewed: {renewed_count} webhooks, Failed: {failed_count}, Missed email processing: {missed_email_total} emails"
+        logger.info(
+            "🎉 Webhook monitoring completed - Renewed: %s webhooks, Failed: %s, Missed email processing: %s emails",
+            renewed_count,
+            failed_count,
+            missed_email_total,
         )
 
         return {
@@ -2036,7 +2316,7 @@ def monitor_and_renew_webhooks():
         }
 
     except Exception as e:
-        print(f"❌ Error occurred while monitoring webhooks: {str(e)}")
+        logger.error("❌ Error occurred while monitoring webhooks: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -2067,6 +2347,12 @@ def trigger_webhook_monitoring():
         )
 
 
+def _run_in_app_context(app, func, *args):
+    """Run func in its own app context (and DB session) on a worker thread"""
+    with app.app_context():
+        return func(*args)
+
+
 @email_bp.route("/process-missed-emails", methods=["POST"])
 @login_required
 def process_missed_emails():
@@ -2075,9 +2361,7 @@ def process_missed_emails():
         from datetime import datetime, timedelta
 
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -2086,14 +2370,27 @@ def process_missed_emails():
         total_classified = 0
         account_results = []
 
-        for account in accounts:
-            try:
-                # Check webhook status
-                webhook_status = WebhookStatus.query.filter_by(
-                    user_id=current_user.id, account_id=account.id, is_active=True
-                ).first()
+        # Check webhook status of all accounts in one query
+        webhook_statuses = {
+            webhook_status.account_id: webhook_status
+            for webhook_status in WebhookStatus.query.filter(
+                WebhookStatus.user_id == current_user.id,
+                WebhookStatus.account_id.in_([account.id for account in accounts]),
+                WebhookStatus.is_active.is_(True),
+            ).all()
+        }
+
+        # Categories are user-scoped, so fetch them once for all accounts
+        categories = get_classifier().get_user_categories_for_ai(current_user.id)
 
+        # Accounts are independent and Gmail-bound, so process them in parallel;
+        # their AI calls share the classifier's process-wide request limit
+        app = current_app._get_current_object()
+        futures = []
+        with ThreadPoolExecutor(max_workers=min(8, len(accounts))) as executor:
+            for account in accounts:
                 # Calculate missed period
+                webhook_status = webhook_statuses.get(account.id)
                 missed_period_start = None
                 if webhook_status and webhook_status.is_expired:
                     missed_period_start = webhook_status.expires_at
@@ -2101,14 +2398,27 @@ def process_missed_emails():
                     # If webhook is not set up or not expired, process from 7 days ago
                     missed_period_start = datetime.utcnow() - timedelta(days=7)
 
-                print(
-                    f"📧 Processing missed emails - Account: {account.account_email}, Start date: {missed_period_start}"
+                logger.info(
+                    "📧 Processing missed emails - Account: %s, Start date: %s",
+                    account.account_email,
+                    missed_period_start,
                 )
 
                 # Process missed emails
-                result = process_missed_emails_for_account(
-                    current_user.id, account.id, missed_period_start
+                future = executor.submit(
+                    _run_in_app_context,
+                    app,
+                    process_missed_emails_for_account,
+                    current_user.id,
+                    account.id,
+                    missed_period_start,
+                    categories,
                 )
+                futures.append((account.account_email, future))
+
+        for account_email, future in futures:
+            try:
+                result = future.result()
 
                 if result["success"]:
                     total_processed += result["processed_count"]
@@ -2116,7 +2426,7 @@ def process_missed_emails():
 
                     account_results.append(
                         {
-                            "account": account.account_email,
+                            "account": account_email,
                             "status": "success",
                             "processed": result["processed_count"],
                             "classified": result["classified_count"],
@@ -2126,19 +2436,21 @@ def process_missed_emails():
                 else:
                     account_results.append(
                         {
-                            "account": account.account_email,
+                            "account": account_email,
                             "status": "failed",
                             "message": result["message"],
                         }
                     )
 
             except Exception as e:
-                print(
-                    f"Failed to process missed emails for account {account.account_email}: {str(e)}"
+                logger.error(
+                    "❌ Failed to process missed emails for account %s: %s",
+                    account_email,
+                    e,
                 )
                 account_results.append(
                     {
-                        "account": account.account_email,
+                        "account": account_email,
                         "status": "error",
                         "message": str(e),
                     }
@@ -2146,6 +2458,7 @@ def process_missed_emails():
 
         # Generate result message
         if total_processed > 0:
+            invalidate_email_caches(current_user.id)
             message = f"Processed {total_processed} missed emails (classified: {total_classified} emails)"
         else:
             message = "No missed emails to process."
@@ -2237,9 +2550,21 @@ def trigger_scheduled_monitoring():
 
 
 def get_user_emails(user_id, limit=50):
-    """Helper function to retrieve user's emails"""
+    """Helper function to retrieve user's emails (metadata columns only)"""
     return (
-        Email.query.filter_by(user_id=user_id)
+        Email.query.options(
+            load_only(
+                Email.id,
+                Email.account_id,
+                Email.category_id,
+                Email.subject,
+                Email.sender,
+                Email.is_read,
+                Email.is_archived,
+                Email.created_at,
+            )
+        )
+        .filter_by(user_id=user_id)
         .order_by(Email.created_at.desc())
         .limit(limit)
         .all()
@@ -2343,9 +2668,7 @@ def debug_webhook_setup():
     """Check debug information about webhook setup"""
     try:
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -2418,9 +2741,7 @@ def check_oauth_scopes():
     """Check OAuth scopes"""
     try:
         # Get all active accounts
-        accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
+        accounts = get_active_accounts(current_user.id)
 
         if not accounts:
             return jsonify({"success": False, "message": "No connected accounts."})
@@ -2444,17 +2765,15 @@ def check_oauth_scopes():
                         gmail_service.service.users().getProfile(userId="me").execute()
                     )
 
-                    # Check token information (if available)
-                    try:
-                        # Check scope information of the current token
-                        token_info = (
-                            gmail_service.service.users()
-                            .getProfile(userId="me")
-                            .execute()
-                        )
-                        scopes_available = True
-                    except:
-                        scopes_available = False
+                    # Check scope information stored with the account's token
+                    stored_scopes = (
+                        db.session.query(UserToken.scopes)
+                        .filter_by(user_id=current_user.id, account_id=account.id)
+                        .scalar()
+                    )
+                    scopes_available = bool(
+                        json.loads(stored_scopes) if stored_scopes else []
+                    )
 
                     account_info = {
                         "account_email": account.account_email,
@@ -2560,40 +2879,46 @@ def get_ai_analyzed_emails():
         page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 20, type=int)
 
-        # Get emails with AI analysis completed (emails with summary)
+        # Get emails with AI analysis completed (emails with summary),
+        # resolving the category name in the same SELECT via an outer join
         emails = (
-            Email.query.filter_by(user_id=current_user.id)
-            .filter(Email.summary.isnot(None))
+            db.session.query(
+                Email.id,
+                Email.subject,
+                Email.sender,
+                Email.summary,
+                Email.is_archived,
+                Email.is_read,
+                Email.updated_at,
+                Category.name.label("category_name"),
+            )
+            .outerjoin(
+                Category,
+                db.and_(
+                    Category.id == Email.category_id,
+                    Category.user_id == current_user.id,
+                ),
+            )
+            .filter(Email.user_id == current_user.id, Email.summary.isnot(None))
             .order_by(Email.updated_at.desc())
             .paginate(page=page, per_page=per_page, error_out=False)
         )
 
-        # Add category information
-        for email in emails.items:
-            if email.category_id:
-                email.category_info = Category.query.filter_by(
-                    id=email.category_id, user_id=current_user.id
-                ).first()
-
         result = {
             "emails": [
                 {
-                    "id": email.id,
-                    "subject": email.subject,
-                    "sender": email.sender,
-                    "summary": email.summary,
-                    "category_name": (
-                        email.category_info.name
-                        if hasattr(email, "category_info") and email.category_info
-                        else "Unclassified"
-                    ),
-                    "is_archived": email.is_archived,
-                    "is_read": email.is_read,
+                    "id": row.id,
+                    "subject": row.subject,
+                    "sender": row.sender,
+                    "summary": row.summary,
+                    "category_name": row.category_name or "Unclassified",
+                    "is_archived": row.is_archived,
+                    "is_read": row.is_read,
                     "updated_at": (
-                        email.updated_at.isoformat() if email.updated_at else None
+                        row.updated_at.isoformat() if row.updated_at else None
                     ),
                 }
-                for email in emails.items
+                for row in emails.items
             ],
             "pagination": {
                 "page": page,
@@ -2611,6 +2936,46 @@ def get_ai_analyzed_emails():
         )
 
 
+# (second, last_check, cached_until) shared by all pollers within the same second
+_NOW_CACHE = (0, "", "")
+
+
+def _poll_timestamps():
+    """Return ISO timestamps for the current second and 10 seconds later"""
+    global _NOW_CACHE
+
+    now = int(time.time())
+    if now != _NOW_CACHE[0]:
+        _NOW_CACHE = (
+            now,
+            datetime.utcfromtimestamp(now).isoformat(),
+            datetime.utcfromtimestamp(now + 10).isoformat(),
+        )
+    return _NOW_CACHE[1], _NOW_CACHE[2]
+
+
+def _get_max_email_id(user_id):
+    """Max email id across the user's active accounts (None if no active accounts)"""
+    active_accounts = get_active_accounts(user_id)
+
+    if not active_accounts:
+        return None
+
+    # Find max email id across all user's accounts
+    max_email_id = 0
+    for account in active_accounts:
+        max_id_for_account = (
+            db.session.query(db.func.max(Email.id))
+            .filter(Email.user_id == user_id, Email.account_id == account.id)
+            .scalar()
+        )
+
+        if max_id_for_account and max_id_for_account > max_email_id:
+            max_email_id = max_id_for_account
+
+    return max_email_id
+
+
 @email_bp.route("/api/check-new-emails", methods=["GET"])
 @login_required
 def check_new_emails():
@@ -2623,62 +2988,52 @@ def check_new_emails():
         cache_key = f"max_email_id_{current_user.id}"
 
         # Use cached max email id if available
-        cached_max_id = cache.get(cache_key)
-
-        if cached_max_id is not None:
-            # Compare cached max email id with the client's last seen email id
-            has_new_emails = (
-                last_seen_email_id is None or cached_max_id > last_seen_email_id
-            )
-
-            result = {
-                "has_new_emails": has_new_emails,
-                "max_email_id": cached_max_id,
-                "last_seen_email_id": last_seen_email_id,
-                "new_count": (
-                    cached_max_id - (last_seen_email_id or 0) if has_new_emails else 0
-                ),
-                "last_check": datetime.utcnow().isoformat(),
-                "cached_until": (datetime.utcnow() + timedelta(seconds=10)).isoformat(),
-            }
+        max_email_id = cache.get(cache_key)
 
-            return jsonify(result)
-
-        # If cache is empty, calculate max email id from DB
-        active_accounts = UserAccount.query.filter_by(
-            user_id=current_user.id, is_active=True
-        ).all()
-
-        if not active_accounts:
-            return jsonify(
-                {
-                    "has_new_emails": False,
-                    "max_email_id": 0,
-                    "last_seen_email_id": last_seen_email_id,
-                    "new_count": 0,
-                    "last_check": datetime.utcnow().isoformat(),
-                }
-            )
+        if max_email_id is None:
+            # Only one poller per user recomputes the max email id; the others
+            # wait briefly for the winner to fill the cache
+            lock_key = f"max_email_id_lock_{current_user.id}"
+            if cache.add(lock_key, True, timeout=2):
+                try:
+                    max_email_id = _get_max_email_id(current_user.id)
+                    if max_email_id is not None:
+                        # Cache result (10 seconds) - add() only writes when the key
+                        # is absent, so a concurrent writer is never overwritten
+                        cache.add(cache_key, max_email_id, timeout=10)
+                finally:
+                    cache.delete(lock_key)
+            else:
+                for _ in range(5):
+                    time.sleep(0.05)
+                    max_email_id = cache.get(cache_key)
+                    if max_email_id is not None:
+                        break
+                else:
+                    max_email_id = _get_max_email_id(current_user.id)
 
-        # Find max email id across all user's accounts
-        max_email_id = 0
-        for account in active_accounts:
-            max_id_for_account = (
-                db.session.query(db.func.max(Email.id))
-                .filter(
-                    Email.user_id == current_user.id, Email.account_id == account.id
+            if max_email_id is None:
+                return jsonify(
+                    {
+                        "has_new_emails": False,
+                        "max_email_id": 0,
+                        "last_seen_email_id": last_seen_email_id,
+                        "new_count": 0,
+                        "last_check": _poll_timestamps()[0],
+                    }
                 )
-                .scalar()
-            )
-
-            if max_id_for_account and max_id_for_account > max_email_id:
-                max_email_id = max_id_for_account
 
-        # Cache result (10 seconds)
-        cache.set(cache_key, max_email_id, timeout=10)
+        # Let the browser revalidate against the same 10 second window
+        etag = f'W/"{max_email_id}"'
+        if request.headers.get("If-None-Match") == etag:
+            response = make_response("", 304)
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "private, max-age=10"
+            return response
 
         # Check for new emails
         has_new_emails = last_seen_email_id is None or max_email_id > last_seen_email_id
+        last_check, cached_until = _poll_timestamps()
 
         result = {
             "has_new_emails": has_new_emails,
@@ -2687,11 +3042,14 @@ def check_new_emails():
             "new_count": (
                 max_email_id - (last_seen_email_id or 0) if has_new_emails else 0
             ),
-            "last_check": datetime.utcnow().isoformat(),
-            "cached_until": (datetime.utcnow() + timedelta(seconds=10)).isoformat(),
+            "last_check": last_check,
+            "cached_until": cached_until,
         }
 
-        return jsonify(result)
+        response = jsonify(result)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=10"
+        return response
 
     except Exception as e:
         logger.error(f"Error checking for new emails: {e}")
@@ -9,9 +9,10 @@ from datetime import datetime
 from flask import Blueprint, request, jsonify, session
 
 # Local imports
-from ..models import User, UserAccount, Email, WebhookStatus, db
+from ..models import User, UserAccount, WebhookStatus, db
 from .gmail_service import GmailService
-from .ai_classifier import AIClassifier
+from .ai_classifier import get_classifier
+from .routes import invalidate_email_caches
 from .. import cache
 
 logger = logging.getLogger(__name__)
@@ -65,6 +66,7 @@ def gmail_webhook():
             # Invalidate cache (for real-time notification)
             cache_key = f"max_email_id_{account.user_id}"
             cache.delete(cache_key)
+            invalidate_email_caches(account.user_id)
             logger.info(f"Cache invalidated: {cache_key}")
 
             # Simple notification data for browser notification
@@ -171,7 +173,7 @@ def process_new_emails_for_account(account):
     """Process new emails for account (only after signup date)"""
     try:
         gmail_service = GmailService(account.user_id, account.id)
-        ai_classifier = AIClassifier()
+        ai_classifier = get_classifier()
 
         # Get user info
         user = User.query.get(account.user_id)
@@ -205,63 +207,71 @@ def process_new_emails_for_account(account):
         classified_count = 0
         archived_count = 0
 
+        # Fetch already processed gmail ids in one query
+        existing_ids = gmail_service.get_existing_gmail_ids(
+            [email_data["gmail_id"] for email_data in recent_emails]
+        )
+
+        # Save new emails to DB (committed once after the loop)
+        saved = []
         for email_data in recent_emails:
             try:
                 # Check if email already processed
-                existing_email = Email.query.filter_by(
-                    user_id=account.user_id,
-                    account_id=account.id,
-                    gmail_id=email_data["gmail_id"],
-                ).first()
-
-                if existing_email:
+                if email_data["gmail_id"] in existing_ids:
                     continue
 
-                # Save to DB
-                email_obj = gmail_service.save_email_to_db(email_data)
-
+                email_obj = gmail_service.save_email_to_db(
+                    email_data, commit=False, check_existing=False
+                )
+                existing_ids.add(email_data["gmail_id"])
                 if email_obj:
                     processed_count += 1
+                    saved.append((email_data, email_obj))
 
-                    # AI classification and summarization
-                    if categories:
-                        category_id, summary = (
-                            ai_classifier.classify_and_summarize_email(
-                                email_data["body"],
-                                email_data["subject"],
-                                email_data["sender"],
-                                categories,
-                            )
-                        )
+            except Exception as e:
+                logger.error(f"Webhook email processing failed: {str(e)}")
+                continue
 
-                        if category_id:
-                            gmail_service.update_email_category(
-                                email_data["gmail_id"], category_id
-                            )
-                            classified_count += 1
-
-                        # Save summary
-                        if (
-                            summary
-                            and summary
-                            != "AI processing not available. Please check manually."
-                        ):
-                            email_obj.summary = summary
-
-                            # After AI analysis, archive in Gmail
-                            try:
-                                gmail_service.archive_email(email_data["gmail_id"])
-                                email_obj.is_archived = True
-                                archived_count += 1
-                                logger.info(
-                                    f"✅ Webhook email archived: {email_data.get('subject', 'No subject')}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"❌ Webhook email archive failed: {str(e)}"
-                                )
-
-                            db.session.commit()
+        # AI classification and summarization with concurrent API calls
+        ai_results = []
+        if categories:
+            ai_results = ai_classifier.classify_and_summarize_emails(
+                [
+                    {
+                        "content": email_data["body"],
+                        "subject": email_data["subject"],
+                        "sender": email_data["sender"],
+                    }
+                    for email_data, _ in saved
+                ],
+                categories,
+            )
+
+        for (email_data, email_obj), (category_id, summary) in zip(saved, ai_results):
+            try:
+                if category_id:
+                    email_obj.category_id = category_id
+                    classified_count += 1
+
+                # Save summary
+                if (
+                    summary
+                    and summary != "AI processing not available. Please check manually."
+                ):
+                    email_obj.summary = summary
+
+                    # After AI analysis, archive in Gmail
+                    try:
+                        gmail_service.archive_email(
+                            email_data["gmail_id"], update_db=False
+                        )
+                        email_obj.is_archived = True
+                        archived_count += 1
+                        logger.info(
+                            f"✅ Webhook email archived: {email_data.get('subject', 'No subject')}"
+                        )
+                    except Exception as e:
+                        logger.error(f"❌ Webhook email archive failed: {str(e)}")
 
                 logger.info(
                     f"Webhook email processing complete - subject: {email_data.get('subject', 'No subject')}"
@@ -271,6 +281,9 @@ def process_new_emails_for_account(account):
                 logger.error(f"Webhook email processing failed: {str(e)}")
                 continue
 
+        # Single commit for all emails of this account
+        db.session.commit()
+
         logger.info(
             f"Webhook processing complete - account: {account.account_email}, processed: {processed_count}, classified: {classified_count}, archived: {archived_count}"
         )
@@ -291,5 +304,6 @@ def process_new_emails_for_account(account):
         return result
 
     except Exception as e:
+        db.session.rollback()
         logger.error(f"Error during webhook email processing: {str(e)}")
         return None
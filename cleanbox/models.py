@@ -1,16 +1,20 @@
 # Standard library imports
 import json
+import logging
 import os
 from datetime import datetime, timedelta
 
 # Third-party imports
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 from werkzeug.security import generate_password_hash, check_password_hash
 from cryptography.fernet import Fernet
 
 db = SQLAlchemy()
 
+logger = logging.getLogger(__name__)
+
 
 class User(UserMixin, db.Model):
     """CleanBox user model"""
@@ -69,7 +73,7 @@ class UserAccount(db.Model):
         "UserToken", backref="account", lazy=True, cascade="all, delete-orphan"
     )
     emails = db.relationship(
-        "Email", backref="account", lazy=True, cascade="all, delete-orphan"
+        "Email", back_populates="account", lazy=True, cascade="all, delete-orphan"
     )
 
     def __repr__(self):
@@ -182,7 +186,7 @@ class Category(db.Model):
     )
 
     # Relationships
-    emails = db.relationship("Email", backref="category", lazy=True)
+    emails = db.relationship("Email", back_populates="category", lazy=True)
 
     def __repr__(self):
         return f"<Category {self.name}>"
@@ -192,6 +196,22 @@ class Email(db.Model):
     """Email model"""
 
     __tablename__ = "emails"
+    __table_args__ = (
+        # List pages: WHERE user_id AND account_id ORDER BY created_at DESC
+        db.Index(
+            "ix_emails_user_account_created", "user_id", "account_id", "created_at"
+        ),
+        # Category pages: WHERE user_id AND category_id ORDER BY created_at DESC
+        db.Index(
+            "ix_emails_user_category_created", "user_id", "category_id", "created_at"
+        ),
+        # Mailbox-wide recent emails: WHERE user_id ORDER BY created_at DESC
+        db.Index("ix_emails_user_created", "user_id", "created_at"),
+        # Ingest dedupe by gmail id within an account
+        db.UniqueConstraint(
+            "user_id", "account_id", "gmail_id", name="uq_emails_user_account_gmail"
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(255), db.ForeignKey("users.id"), nullable=False)
@@ -206,6 +226,8 @@ class Email(db.Model):
     recipients = db.Column(db.Text)  # Stored as JSON
     content = db.Column(db.Text)
     summary = db.Column(db.Text)
+    unsubscribe_links = db.Column(db.Text)  # Stored as JSON, extracted at ingest
+    one_click_unsubscribe_url = db.Column(db.Text)  # RFC 8058 one-click endpoint
     is_read = db.Column(db.Boolean, default=False)
     is_archived = db.Column(db.Boolean, default=False)
     is_unsubscribed = db.Column(db.Boolean, default=False)
@@ -215,6 +237,10 @@ class Email(db.Model):
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Relationships (declared here so list/detail queries can eager-load them)
+    account = db.relationship("UserAccount", back_populates="emails")
+    category = db.relationship("Category", back_populates="emails")
+
     def __repr__(self):
         return f"<Email {self.subject}>"
 
@@ -269,3 +295,96 @@ class WebhookStatus(db.Model):
 
         # If never received a webhook, it's healthy within 1 hour after setup
         return datetime.utcnow() - self.setup_at < timedelta(hours=1)
+
+
+# Columns added to the emails table after it was first deployed (name -> SQL type)
+EMAIL_COLUMN_UPGRADES = {
+    "unsubscribe_links": "TEXT",
+    "one_click_unsubscribe_url": "TEXT",
+}
+
+# Indexes added to the emails table after it was first deployed. db.create_all()
+# only creates missing tables, so upgrade_schema() adds these to existing ones.
+EMAIL_INDEX_UPGRADES = {
+    "ix_emails_user_account_created": "CREATE INDEX IF NOT EXISTS"
+    " ix_emails_user_account_created ON emails (user_id, account_id, created_at)",
+    "ix_emails_user_category_created": "CREATE INDEX IF NOT EXISTS"
+    " ix_emails_user_category_created ON emails (user_id, category_id, created_at)",
+    "ix_emails_user_created": "CREATE INDEX IF NOT EXISTS"
+    " ix_emails_user_created ON emails (user_id, created_at)",
+    "uq_emails_user_account_gmail": "CREATE UNIQUE INDEX IF NOT EXISTS"
+    " uq_emails_user_account_gmail ON emails (user_id, account_id, gmail_id)",
+}
+
+
+# Rows saved twice before uq_emails_user_account_gmail existed. NULL keys are
+# left alone: the unique index treats them as distinct.
+DUPLICATE_EMAILS_EXIST = (
+    "SELECT 1 FROM emails"
+    " WHERE account_id IS NOT NULL AND gmail_id IS NOT NULL"
+    " GROUP BY user_id, account_id, gmail_id HAVING COUNT(*) > 1"
+    " LIMIT 1"
+)
+DELETE_DUPLICATE_EMAILS = (
+    "DELETE FROM emails WHERE id IN ("
+    " SELECT id FROM ("
+    "  SELECT id, ROW_NUMBER() OVER ("
+    "   PARTITION BY user_id, account_id, gmail_id"
+    "   ORDER BY updated_at IS NULL, updated_at DESC, id DESC"
+    "  ) AS position FROM emails"
+    "  WHERE account_id IS NOT NULL AND gmail_id IS NOT NULL"
+    " ) ranked WHERE position > 1"
+    ")"
+)
+
+
+def upgrade_schema():
+    """Bring tables created by an older version up to the current models
+
+    Runs after db.create_all(); every step is idempotent.
+    """
+    with db.engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table("emails"):
+            return
+
+        columns = {column["name"] for column in inspector.get_columns("emails")}
+        for name, column_type in EMAIL_COLUMN_UPGRADES.items():
+            if name not in columns:
+                conn.execute(
+                    text(f"ALTER TABLE emails ADD COLUMN {name} {column_type}")
+                )
+
+        existing = {index["name"] for index in inspector.get_indexes("emails")}
+        existing.update(
+            constraint["name"]
+            for constraint in inspector.get_unique_constraints("emails")
+        )
+        if (
+            "uq_emails_user_account_gmail" not in existing
+            and conn.execute(text(DUPLICATE_EMAILS_EXIST)).first()
+        ):
+            # Deleting rows is not done at startup; run `flask dedupe-emails` once
+            logger.warning(
+                "emails has duplicate (user_id, account_id, gmail_id) rows; "
+                "uq_emails_user_account_gmail not created. "
+                "Run `flask dedupe-emails`, then restart."
+            )
+            existing.add("uq_emails_user_account_gmail")  # skip it this time
+
+        for name, statement in EMAIL_INDEX_UPGRADES.items():
+            if name not in existing:
+                conn.execute(text(statement))
+
+
+def dedupe_emails() -> int:
+    """Delete duplicate emails so uq_emails_user_account_gmail can be created
+
+    One-off data migration (`flask dedupe-emails`). Of each duplicate group the
+    most recently updated row is kept, since it carries the user's latest
+    category, read and archive changes. Returns the number of deleted rows.
+    """
+    with db.engine.begin() as conn:
+        deleted = conn.execute(text(DELETE_DUPLICATE_EMAILS)).rowcount
+    logger.info("Deleted %s duplicate emails", deleted)
+    return deleted
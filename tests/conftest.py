@@ -1,7 +1,36 @@
 import os
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
+
+from cleanbox.models import db
 
 
 @pytest.fixture
 def base_url():
     return os.environ.get("CLEANBOX_URL", "http://localhost:5000")
+
+
+@pytest.fixture
+def query_counter():
+    """Collect SQL statements run inside `with query_counter() as queries:`
+
+    Must be used within an app context.
+    """
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.engine
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    return counter
@@ -0,0 +1,190 @@
+import threading
+import time
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from cleanbox import create_app
+from cleanbox.config import TestConfig
+from cleanbox.email.ai_classifier import AI_MAX_CONCURRENT_REQUESTS, AIClassifier
+from cleanbox.email.gmail_service import GmailService
+from cleanbox.email.routes import process_missed_emails_for_account
+from cleanbox.models import User, UserAccount, Category, Email, db
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig, testing=True)
+    with app.app_context():
+        db.create_all()
+        user = User(id="test-user", email="test@example.com")
+        db.session.add(user)
+        db.session.add(
+            UserAccount(
+                user_id=user.id,
+                account_email="test@example.com",
+                is_primary=True,
+                is_active=True,
+            )
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def gmail_service(app):
+    gs = GmailService.__new__(GmailService)
+    gs.user_id = "test-user"
+    gs.account_id = UserAccount.query.first().id
+    return gs
+
+
+def _email_data(gmail_id):
+    return {
+        "gmail_id": gmail_id,
+        "subject": f"Subject {gmail_id}",
+        "sender": "a@b.com",
+        "body": "Body text",
+    }
+
+
+class TestBatchedEmailSave:
+    def test_failed_email_keeps_rest_of_batch(self, gmail_service):
+        saved = []
+        # The second email violates NOT NULL on gmail_id when flushed
+        for email_data in [_email_data("g1"), _email_data(None), _email_data("g3")]:
+            try:
+                saved.append(gmail_service.save_email_to_db(email_data, commit=False))
+            except Exception:
+                continue
+        db.session.commit()
+
+        assert [email_obj.gmail_id for email_obj in saved] == ["g1", "g3"]
+        db.session.expire_all()
+        assert sorted(gmail_id for (gmail_id,) in db.session.query(Email.gmail_id)) == [
+            "g1",
+            "g3",
+        ]
+
+    def test_prefetched_batch_skips_per_email_lookup(
+        self, gmail_service, query_counter
+    ):
+        gmail_service.save_email_to_db(_email_data("g1"))
+        batch = [_email_data(gmail_id) for gmail_id in ("g1", "g2", "g3")]
+
+        with query_counter() as queries:
+            existing_ids = gmail_service.get_existing_gmail_ids(
+                [email_data["gmail_id"] for email_data in batch]
+            )
+            for email_data in batch:
+                if email_data["gmail_id"] not in existing_ids:
+                    gmail_service.save_email_to_db(
+                        email_data, commit=False, check_existing=False
+                    )
+        db.session.commit()
+
+        assert existing_ids == {"g1"}
+        # Only the prefetch selects; each save is a savepoint plus its INSERT
+        assert sum(query.lstrip().startswith("SELECT") for query in queries) == 1
+        assert Email.query.count() == 3
+
+
+def _init_without_gmail(self, user_id, account_id):
+    self.user_id = user_id
+    self.account_id = account_id
+
+
+class TestProcessMissedEmails:
+    @patch("cleanbox.email.routes.get_classifier")
+    @patch.object(GmailService, "fetch_recent_emails")
+    @patch.object(GmailService, "__init__", _init_without_gmail)
+    def test_saves_before_classifying(self, mock_fetch, mock_classifier, app):
+        account_id = UserAccount.query.first().id
+        category = Category(user_id="test-user", name="Work", is_active=True)
+        db.session.add(category)
+        db.session.commit()
+        # The second email cannot be stored (NOT NULL gmail_id)
+        mock_fetch.return_value = [
+            _email_data("g1"),
+            _email_data(None),
+            _email_data("g3"),
+        ]
+        classify = mock_classifier.return_value.classify_and_summarize_emails
+        classify.return_value = [(category.id, "summary"), (None, "summary")]
+
+        result = process_missed_emails_for_account(
+            "test-user",
+            account_id,
+            datetime.utcnow(),
+            categories=[{"id": category.id, "name": "Work", "description": ""}],
+        )
+
+        assert result["processed_count"] == 2
+        assert result["classified_count"] == 1
+        # Only the stored emails are sent to the AI
+        assert [email["subject"] for email in classify.call_args[0][0]] == [
+            "Subject g1",
+            "Subject g3",
+        ]
+        db.session.expire_all()
+        assert [
+            (email.gmail_id, email.category_id)
+            for email in Email.query.order_by(Email.gmail_id)
+        ] == [("g1", category.id), ("g3", None)]
+
+    @patch.object(AIClassifier, "_call_openai_api")
+    @patch.object(GmailService, "save_email_to_db")
+    @patch.object(GmailService, "get_existing_gmail_ids", return_value=set())
+    @patch.object(GmailService, "__init__", _init_without_gmail)
+    def test_accounts_share_ai_request_limit(
+        self, mock_existing, mock_save, mock_call, app
+    ):
+        for i in range(3):
+            db.session.add(
+                UserAccount(
+                    user_id="test-user",
+                    account_email=f"other{i}@example.com",
+                    is_active=True,
+                )
+            )
+        db.session.add(Category(user_id="test-user", name="Work", is_active=True))
+        db.session.commit()
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def call_openai_api(prompt):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return '{"category_id": null, "summary": "Summary", "confidence_score": 0}'
+
+        def fetch_recent_emails(self, max_results, after_date):
+            return [
+                {**_email_data(f"{self.account_id}-{i}"), "body": f"Body {i}"}
+                for i in range(8)
+            ]
+
+        mock_call.side_effect = call_openai_api
+        mock_save.side_effect = lambda email_data, **kwargs: SimpleNamespace(
+            content=email_data["body"],
+            subject=email_data["subject"],
+            sender=email_data["sender"],
+        )
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["_user_id"] = "test-user"
+            sess["_fresh"] = True
+
+        with patch.object(GmailService, "fetch_recent_emails", fetch_recent_emails):
+            response = client.post("/email/process-missed-emails")
+
+        assert response.get_json()["success"]
+        # 4 accounts x 8 emails, but never more requests in flight than the limit
+        assert mock_call.call_count == 32
+        assert peak <= AI_MAX_CONCURRENT_REQUESTS
@@ -0,0 +1,80 @@
+import html
+import re
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from cleanbox import create_app
+from cleanbox.config import TestConfig
+from cleanbox.email.routes import EMAILS_PER_PAGE
+from cleanbox.models import User, UserAccount, Category, Email, db
+
+EMAIL_COUNT = EMAILS_PER_PAGE + 5
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig, testing=True)
+    with app.app_context():
+        db.create_all()
+        user = User(id="test-user", email="test@example.com")
+        db.session.add(user)
+        account = UserAccount(
+            user_id=user.id,
+            account_email="test@example.com",
+            is_primary=True,
+            is_active=True,
+        )
+        category = Category(user_id=user.id, name="Work", is_active=True)
+        db.session.add_all([account, category])
+        db.session.commit()
+        # Saved by one batch ingest: every email has the same created_at
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        db.session.add_all(
+            Email(
+                user_id=user.id,
+                account_id=account.id,
+                category_id=category.id,
+                gmail_id=f"g{i}",
+                subject=f"Subject-{i}-end",
+                sender="a@b.com",
+                content="Body",
+                created_at=created_at,
+            )
+            for i in range(EMAIL_COUNT)
+        )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["_user_id"] = "test-user"
+        sess["_fresh"] = True
+    return client
+
+
+def _collect_pages(client, url):
+    """Follow the "Older Emails" links and return every listed subject"""
+    subjects = []
+    while url:
+        page = client.get(url).get_data(as_text=True)
+        subjects += re.findall(r"Subject-\d+-end", page)
+        next_link = re.search(r'href="([^"]*before=[^"]*)"', page)
+        url = html.unescape(next_link.group(1)) if next_link else None
+    return subjects
+
+
+class TestKeysetPagination:
+    @patch("cleanbox.email.routes.check_and_refresh_token", return_value=True)
+    def test_list_pages_keep_created_at_ties(self, mock_token, client):
+        subjects = _collect_pages(client, "/email/")
+        assert len(subjects) == len(set(subjects)) == EMAIL_COUNT
+
+    def test_category_pages_keep_created_at_ties(self, client):
+        category_id = Category.query.first().id
+        subjects = _collect_pages(client, f"/email/category/{category_id}")
+        assert len(subjects) == len(set(subjects)) == EMAIL_COUNT
@@ -0,0 +1,84 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from cleanbox import create_app
+from cleanbox.config import TestConfig
+from cleanbox.models import User, UserAccount, Category, Email, db
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig, testing=True)
+    with app.app_context():
+        db.create_all()
+        user = User(id="test-user", email="test@example.com")
+        db.session.add(user)
+        accounts = [
+            UserAccount(
+                user_id=user.id,
+                account_email=f"test{i}@example.com",
+                is_primary=(i == 0),
+                is_active=True,
+            )
+            for i in range(2)
+        ]
+        db.session.add_all(accounts)
+        category = Category(user_id=user.id, name="Work", is_active=True)
+        db.session.add(category)
+        db.session.commit()
+        for i in range(20):
+            db.session.add(
+                Email(
+                    user_id=user.id,
+                    account_id=accounts[i % 2].id,
+                    category_id=category.id if i % 2 else None,
+                    gmail_id=f"g{i}",
+                    subject=f"Subject {i}",
+                    sender="a@b.com",
+                    content="Body",
+                    is_read=bool(i % 3),
+                    created_at=datetime.utcnow() - timedelta(minutes=i),
+                )
+            )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["_user_id"] = "test-user"
+        sess["_fresh"] = True
+    return client
+
+
+class TestQueryCounts:
+    """Guard the per-request query counts against N+1 regressions"""
+
+    @patch("cleanbox.email.routes.check_and_refresh_token", return_value=True)
+    def test_list_emails(self, mock_token, client, query_counter):
+        with query_counter() as queries:
+            response = client.get("/email/")
+        assert response.status_code == 200
+        # Fixed number of statements regardless of how many emails are listed
+        assert len(queries) <= 6
+
+    def test_view_email(self, client, query_counter):
+        with query_counter() as queries:
+            response = client.get("/email/1")
+        assert response.status_code == 200
+        assert len(queries) <= 6
+
+    @patch("cleanbox.email.routes.GmailService")
+    def test_bulk_delete(self, mock_gmail, client, query_counter):
+        with query_counter() as queries:
+            response = client.post(
+                "/email/bulk-actions",
+                data={"action": "delete", "email_ids": [str(i) for i in range(1, 11)]},
+            )
+        assert response.status_code == 200
+        # user, one IN select for all ids, one DELETE; independent of selection size
+        assert len(queries) <= 3
@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy import inspect, text
+from cleanbox import create_app
+from cleanbox.config import TestConfig
+from cleanbox.models import Email, db, dedupe_emails, upgrade_schema
+
+# emails table as created by the first deployed version (no indexes, no
+# columns added since)
+OLD_EMAILS_TABLE = """
+CREATE TABLE emails (
+    id INTEGER PRIMARY KEY,
+    user_id VARCHAR(255) NOT NULL,
+    account_id INTEGER NOT NULL,
+    category_id INTEGER,
+    gmail_id VARCHAR(255) NOT NULL,
+    thread_id VARCHAR(255),
+    subject VARCHAR(500),
+    sender VARCHAR(255),
+    recipients TEXT,
+    content TEXT,
+    summary TEXT,
+    is_read BOOLEAN,
+    is_archived BOOLEAN,
+    is_unsubscribed BOOLEAN,
+    received_at DATETIME,
+    created_at DATETIME,
+    updated_at DATETIME
+)
+"""
+
+
+@pytest.fixture
+def app():
+    app = create_app(TestConfig, testing=True)
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP TABLE emails"))
+            conn.execute(text(OLD_EMAILS_TABLE))
+            # g1 was saved twice; the user later edited the second copy (id 2)
+            for gmail_id, updated_at in (
+                ("g1", "2024-01-01 00:00:00"),
+                ("g1", "2024-02-01 00:00:00"),
+                ("g2", "2024-01-01 00:00:00"),
+            ):
+                conn.execute(
+                    text(
+                        "INSERT INTO emails (user_id, account_id, gmail_id, updated_at)"
+                        " VALUES ('test-user', 1, :gmail_id, :updated_at)"
+                    ),
+                    {"gmail_id": gmail_id, "updated_at": updated_at},
+                )
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+class TestUpgradeSchema:
+    def test_adds_indexes_but_keeps_duplicates(self, app):
+        upgrade_schema()
+
+        indexes = {
+            index["name"]: index for index in inspect(db.engine).get_indexes("emails")
+        }
+        assert {
+            "ix_emails_user_account_created",
+            "ix_emails_user_category_created",
+            "ix_emails_user_created",
+        } <= indexes.keys()
+        # Startup never deletes rows, so the unique index waits for dedupe_emails
+        assert "uq_emails_user_account_gmail" not in indexes
+        assert Email.query.count() == 3
+
+    def test_dedupe_keeps_most_recently_updated(self, app):
+        assert dedupe_emails() == 1
+        upgrade_schema()
+
+        indexes = {
+            index["name"]: index for index in inspect(db.engine).get_indexes("emails")
+        }
+        assert indexes["uq_emails_user_account_gmail"]["unique"]
+        assert [
+            (email.id, email.gmail_id) for email in Email.query.order_by(Email.id)
+        ] == [(2, "g1"), (3, "g2")]
+
+    def test_dedupe_command(self, app):
+        result = app.test_cli_runner().invoke(args=["dedupe-emails"])
+        assert "Deleted 1 duplicate emails." in result.output
+        assert Email.query.count() == 2
+
+    def test_adds_missing_columns(self, app):
+        upgrade_schema()
+
+        columns = {
+            column["name"] for column in inspect(db.engine).get_columns("emails")
+        }
+        assert {"unsubscribe_links", "one_click_unsubscribe_url"} <= columns
+        # The ORM can select every mapped column again
+        email = Email.query.filter_by(gmail_id="g2").one()
+        assert email.unsubscribe_links is None
+        assert email.one_click_unsubscribe_url is None
+
+    def test_is_idempotent(self, app):
+        upgrade_schema()
+        upgrade_schema()
+        assert Email.query.count() == 3
+
+    def test_fresh_database_is_left_as_is(self, app):
+        db.drop_all()
+        db.create_all()
+        before = inspect(db.engine).get_indexes("emails")
+        upgrade_schema()
+        assert inspect(db.engine).get_indexes("emails") == before
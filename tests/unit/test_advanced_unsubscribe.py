@@ -32,6 +32,65 @@ class TestAdvancedUnsubscribeService:
         )
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    @patch("cleanbox.email.advanced_unsubscribe.PlaywrightUnsubscribeService")
+    @patch("cleanbox.email.advanced_unsubscribe.get_http_session")
+    async def test_process_unsubscribe_advanced_one_click(
+        self, mock_session, mock_playwright
+    ):
+        mock_post = mock_session.return_value.post
+        mock_post.return_value = MagicMock(status_code=200)
+        mock_playwright.return_value.process_unsubscribe_with_playwright_ai = (
+            AsyncMock()
+        )
+        service = AdvancedUnsubscribeService()
+        result = await service.process_unsubscribe_advanced(
+            "body text",
+            {},
+            "user@example.com",
+            known_links=["https://example.com/unsub"],
+            one_click_url="https://example.com/unsub",
+        )
+        assert result["success"] is True
+        assert result["method"] == "one_click_post"
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["data"] == {"List-Unsubscribe": "One-Click"}
+        mock_playwright.return_value.process_unsubscribe_with_playwright_ai.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("cleanbox.email.advanced_unsubscribe.PlaywrightUnsubscribeService")
+    async def test_process_unsubscribe_advanced_known_links_fallback(
+        self, mock_playwright
+    ):
+        playwright = mock_playwright.return_value
+        playwright.extract_unsubscribe_links_with_ai_fallback = AsyncMock(
+            return_value=[
+                "https://example.com/unsub?a=1&b=2",
+                "https://example.com/opt",
+            ]
+        )
+        playwright.process_unsubscribe_with_playwright_ai = AsyncMock(
+            side_effect=[
+                {"success": False, "message": "failed"},
+                {"success": True, "message": "ok"},
+            ]
+        )
+        service = AdvancedUnsubscribeService()
+        result = await service.process_unsubscribe_advanced(
+            "body text",
+            {},
+            "user@example.com",
+            known_links=["https://example.com/unsub?a=1&amp;b=2"],
+        )
+        assert result["success"] is True
+        assert result["processed_url"] == "https://example.com/opt"
+        # The stored link is unescaped and not retried after extraction
+        tried = [
+            call.args[0]
+            for call in playwright.process_unsubscribe_with_playwright_ai.await_args_list
+        ]
+        assert tried == ["https://example.com/unsub?a=1&b=2", "https://example.com/opt"]
+
     @pytest.mark.asyncio
     @patch.object(AdvancedUnsubscribeService, "playwright_service", create=True)
     async def test_process_unsubscribe_advanced_no_links(self, mock_playwright):
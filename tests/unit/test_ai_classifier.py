@@ -1,6 +1,9 @@
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
-from cleanbox.email.ai_classifier import AIClassifier
+from cleanbox.email.ai_classifier import AI_MAX_CONCURRENT_REQUESTS, AIClassifier
 
 
 class TestAIClassifier:
@@ -51,3 +54,75 @@ class TestAIClassifier:
         cat_id, summary = ai._parse_unified_response(response, cats)
         assert cat_id == 1
         assert summary == "Test summary"
+
+    @patch.object(AIClassifier, "classify_and_summarize_email")
+    def test_classify_and_summarize_emails_keeps_order(self, mock_classify):
+        mock_classify.side_effect = lambda content, subject, sender, cats: (
+            None,
+            subject,
+        )
+        ai = AIClassifier()
+        emails = [
+            {"content": "Body", "subject": f"Subject {i}", "sender": "a@b.com"}
+            for i in range(5)
+        ]
+        results = ai.classify_and_summarize_emails(emails, [])
+        assert [summary for _, summary in results] == [f"Subject {i}" for i in range(5)]
+
+    @patch.object(AIClassifier, "_call_openai_api")
+    def test_classify_and_summarize_email_reuses_cached_result(self, mock_call):
+        from cleanbox import create_app
+
+        app = create_app(testing=True)
+        mock_call.return_value = (
+            '{"category_id": 1, "summary": "Summary", "confidence_score": 90}'
+        )
+        ai = AIClassifier()
+        cats = [{"id": 1, "name": "Work", "description": "Work"}]
+        with app.app_context():
+            first = ai.classify_and_summarize_email(
+                "Same body", "Subject", "a@b.com", cats
+            )
+            second = ai.classify_and_summarize_email(
+                "Same body", "Subject", "a@b.com", cats
+            )
+        assert first == second == (1, "Summary")
+        assert mock_call.call_count == 1
+
+    @patch.object(AIClassifier, "_call_openai_api")
+    def test_nested_batches_share_request_limit(self, mock_call):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def call_openai_api(prompt):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return '{"category_id": 1, "summary": "Summary", "confidence_score": 90}'
+
+        mock_call.side_effect = call_openai_api
+        ai = AIClassifier()
+        cats = [{"id": 1, "name": "Work", "description": "Work"}]
+        # One batch per account, run from an account-level pool as a sync does
+        batches = [
+            [
+                {"content": "Body", "subject": f"{account}-{i}", "sender": "a@b.com"}
+                for i in range(8)
+            ]
+            for account in range(4)
+        ]
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            results = list(
+                executor.map(
+                    lambda emails: ai.classify_and_summarize_emails(emails, cats),
+                    batches,
+                )
+            )
+
+        assert mock_call.call_count == 32
+        assert all(len(batch) == 8 for batch in results)
+        assert peak <= AI_MAX_CONCURRENT_REQUESTS
@@ -7,7 +7,7 @@ from datetime import datetime
 class TestGmailService:
     @patch("cleanbox.email.gmail_service.UserAccount")
     @patch("cleanbox.email.gmail_service.get_user_credentials")
-    @patch("cleanbox.email.gmail_service.build")
+    @patch("cleanbox.email.gmail_service.build_from_document")
     def test_get_new_emails(self, mock_build, mock_get_creds, mock_account):
         mock_account.query.filter_by.return_value.first.return_value = MagicMock(
             created_at="2023-01-01"
@@ -54,11 +54,12 @@ class TestGmailService:
         gs = GmailService.__new__(GmailService)
         gs.user_id = "user1"
         gs.account_id = 1
-        email_obj = MagicMock()
-        mock_email.query.filter_by.return_value.first.return_value = email_obj
+        mock_email.query.filter_by.return_value.update.return_value = 1
         result = GmailService.update_email_category(gs, "g1", 2)
         assert result is True
-        assert email_obj.category_id == 2
+        values = mock_email.query.filter_by.return_value.update.call_args[0][0]
+        assert values["category_id"] == 2
+        mock_db.session.commit.assert_called_once()
 
     @patch("cleanbox.email.gmail_service.Email")
     @patch("cleanbox.email.gmail_service.db")
@@ -66,12 +67,12 @@ class TestGmailService:
         gs = GmailService.__new__(GmailService)
         gs.user_id = "user1"
         gs.account_id = 1
-        email_obj = MagicMock()
-        mock_email.query.filter_by.return_value.first.return_value = email_obj
         gs.service = MagicMock()
         result = GmailService.archive_email(gs, "g1")
         assert result is True
-        assert email_obj.is_archived is True
+        values = mock_email.query.filter_by.return_value.update.call_args[0][0]
+        assert values["is_archived"] is True
+        mock_db.session.commit.assert_called_once()
 
     @patch("cleanbox.email.gmail_service.Email")
     def test_delete_email(self, mock_email):
@@ -98,9 +99,11 @@ class TestGmailService:
         mock_unsub.return_value.process_unsubscribe_advanced = AsyncMock(
             return_value={"success": True}
         )
+        mock_unsub.return_value.close_browser = AsyncMock()
         with app.app_context():
             result = await GmailService.process_unsubscribe(gs, email_obj)
             assert result["success"] is True
+            mock_unsub.return_value.close_browser.assert_awaited_once()
 
     @patch("cleanbox.email.gmail_service.Email")
     @patch("cleanbox.email.gmail_service.UserAccount")
@@ -119,7 +122,7 @@ class TestGmailService:
 
     @patch("cleanbox.email.gmail_service.UserAccount")
     @patch("cleanbox.email.gmail_service.get_user_credentials")
-    @patch("cleanbox.email.gmail_service.build")
+    @patch("cleanbox.email.gmail_service.build_from_document")
     def test_setup_gmail_watch(self, mock_build, mock_get_creds, mock_account):
         from cleanbox import create_app
 
@@ -147,7 +150,7 @@ class TestGmailService:
 
     @patch("cleanbox.email.gmail_service.UserAccount")
     @patch("cleanbox.email.gmail_service.get_user_credentials")
-    @patch("cleanbox.email.gmail_service.build")
+    @patch("cleanbox.email.gmail_service.build_from_document")
     def test_get_webhook_status(self, mock_build, mock_get_creds, mock_account):
         from cleanbox import create_app
 
@@ -185,3 +188,26 @@ class TestGmailService:
                     "not_setup",
                     "error",
                 )
+
+    def test_batch_modify_chunks_ids(self):
+        gs = GmailService.__new__(GmailService)
+        gs.service = MagicMock()
+        gmail_ids = [f"g{i}" for i in range(1500)]
+        result = gs.batch_modify(gmail_ids, remove_labels=["INBOX"])
+        assert result is True
+        calls = gs.service.users.return_value.messages.return_value.batchModify
+        assert calls.call_count == 2
+        bodies = [call.kwargs["body"] for call in calls.call_args_list]
+        assert [len(body["ids"]) for body in bodies] == [1000, 500]
+        assert bodies[0]["removeLabelIds"] == ["INBOX"]
+
+    def test_extract_unsubscribe_links_unescapes_html(self):
+        gs = GmailService.__new__(GmailService)
+        email_data = {
+            "headers": {"List-Unsubscribe": "<https://example.com/unsubscribe?id=1>"},
+            "body": '<a href="https://example.com/unsubscribe?u=1&amp;id=2">x</a>',
+        }
+        assert gs._extract_unsubscribe_links(email_data) == [
+            "https://example.com/unsubscribe?id=1",
+            "https://example.com/unsubscribe?u=1&id=2",
+        ]
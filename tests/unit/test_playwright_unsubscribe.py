@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from cleanbox.email.playwright_unsubscribe import PlaywrightUnsubscribeService
+
+
+class TestExecuteAiInstructions:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "action, tag", [("link_click", "a"), ("button_click", "button")]
+    )
+    @patch.object(
+        PlaywrightUnsubscribeService,
+        "_analyze_unsubscribe_completion_with_ai",
+        new_callable=AsyncMock,
+    )
+    @patch.object(
+        PlaywrightUnsubscribeService, "_wait_for_click_result", new_callable=AsyncMock
+    )
+    async def test_clicks_non_ascii_target(self, mock_wait, mock_analyze, action, tag):
+        mock_analyze.return_value = {"success": True, "confidence": 90, "reason": "ok"}
+        element = MagicMock()
+        element.count = AsyncMock(return_value=1)
+        element.text_content = AsyncMock(return_value="구독 취소하기")
+        element.click = AsyncMock()
+        page = MagicMock(url="https://example.com/unsubscribe")
+        page.locator.return_value.filter.return_value.first = element
+
+        service = PlaywrightUnsubscribeService.__new__(PlaywrightUnsubscribeService)
+        service.logger = MagicMock()
+        result = await service._execute_ai_instructions(
+            page, {"action": action, "target": "구독 취소"}
+        )
+
+        assert result["success"] is True
+        page.locator.assert_called_once_with(tag)
+        # The target reaches Playwright's text matcher as-is (no selector escaping)
+        page.locator.return_value.filter.assert_called_once_with(has_text="구독 취소")
+        element.click.assert_awaited_once()
+
+
+class TestExtractUnsubscribeLinks:
+    def test_html_body_keeps_urls_written_in_text(self):
+        service = PlaywrightUnsubscribeService.__new__(PlaywrightUnsubscribeService)
+        service.logger = MagicMock()
+        email_content = (
+            "<html><body>"
+            '<p>Stop these emails: <a href="https://example.com/opt-out">here</a></p>'
+            "<p>Or visit https://example.com/unsubscribe?id=1</p>"
+            '<a href="https://example.com/blog">Blog</a>'
+            "</body></html>"
+        )
+
+        links = service.extract_unsubscribe_links(email_content)
+
+        assert links == [
+            "https://example.com/unsubscribe?id=1",
+            "https://example.com/opt-out",
+        ]